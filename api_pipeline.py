@@ -21,6 +21,12 @@ from utils import (
 )
 from smwc_api_proxy import smwc_api_get, get_api_delay
 from patch_handler import PatchHandler
+from pipeline_metrics import RunMetrics
+from retry_queue import (
+    get_retry_queue, classify_failure, is_transient, compute_backoff, wait_with_cancel,
+    HackProcessingError, MAX_AUTO_RETRY_ROUNDS,
+    REASON_NO_DOWNLOAD_URL, REASON_NO_PATCH, REASON_PATCH_FAILED
+)
 
 # Global cancellation flag
 _cancel_operation = False
@@ -232,7 +238,21 @@ def extract_patches_from_zip(zip_path, extract_to, hack_name="", return_all=Fals
 def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patch_callback=None):
     """
     Main pipeline function using unified patch handler
+
+    Returns a dict counting hacks by final outcome (downloaded, skipped, failed...)
     """
+    with RunMetrics("bulk_download", log) as metrics:
+        try:
+            _run_pipeline(filter_payload, base_rom_path, output_dir, log, multi_patch_callback, metrics)
+        finally:
+            # The per-hack "save_enqueue" stages only queue writes; time them landing on disk
+            from persistence_worker import get_persistence_worker
+            with metrics.stage("save_flush"):
+                get_persistence_worker().flush()
+    return metrics.final_outcomes()
+
+
+def _run_pipeline(filter_payload, base_rom_path, output_dir, log, multi_patch_callback, metrics):
     # Reset cancellation flag at start
     reset_cancel_flag()
     
@@ -359,22 +379,51 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
         log(f"📦 Found {len(all_hacks)} total hacks.")
         log("🧪 Starting patching...")
 
-    base_rom_ext = os.path.splitext(base_rom_path)[1]
-
     # Normalize to internal key, NOT display name
     raw_type = filter_payload["type"][0]
     normalized_type = raw_type.lower().replace("-", "_")
 
+    failed = _patch_hack_list(all_hacks, processed, base_rom_path, output_dir, normalized_type, metrics, log, multi_patch_callback)
+
+    # Retry transient failures (network, server errors...) at the end of the run
+    retry_round = 0
+    while failed and retry_round < MAX_AUTO_RETRY_ROUNDS and not is_cancelled():
+        delay = compute_backoff(retry_round)
+        if log:
+            log(f"🔁 Retrying {len(failed)} failed hack(s) in {delay:.1f}s (attempt {retry_round + 1}/{MAX_AUTO_RETRY_ROUNDS})", "Information")
+        with metrics.stage("retry_wait"):
+            completed = wait_with_cancel(delay, is_cancelled)
+        if not completed:
+            break
+        failed = _patch_hack_list(failed, processed, base_rom_path, output_dir, normalized_type, metrics, log, multi_patch_callback)
+        retry_round += 1
+
+    if failed and log:
+        log(f"⚠️ {len(failed)} hack(s) still failing - they are kept in the retry queue", "Warning")
+
+
+def _patch_hack_list(all_hacks, processed, base_rom_path, output_dir, normalized_type, metrics, log=None, multi_patch_callback=None):
+    """Download and patch a list of hacks for run_pipeline
+
+    Failures are recorded in the retry queue and every stage is timed in
+    metrics. Returns the hacks that failed with a transient reason so the
+    caller can retry them.
+    """
+    retry_queue = get_retry_queue()
+    transient_failures = []
+    base_rom_ext = os.path.splitext(base_rom_path)[1]
+
     for hack in all_hacks:
         # Check for cancellation at the start of each hack processing
         if is_cancelled():
             if log: log("❌ Operation cancelled by user", "warning")
-            return
+            return transient_failures
             
         hack_id = str(hack["id"])
         raw_title = hack["name"]
         title_clean = title_case(safe_filename(raw_title))
         raw_diff = hack.get("raw_fields", {}).get("difficulty", "")
+        metrics.begin_hack(hack_id)
         
         # Fix: Handle None/empty difficulty values consistently
         if not raw_diff or raw_diff in [None, "N/A"]:
@@ -425,10 +474,12 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
             if actual_diff != display_diff or not _file_on_disk:
                 if os.path.exists(actual_path):
                     try:
-                        os.makedirs(os.path.dirname(expected_path), exist_ok=True)
-                        os.rename(actual_path, expected_path)
+                        with metrics.stage("move", hack_id):
+                            os.makedirs(os.path.dirname(expected_path), exist_ok=True)
+                            os.rename(actual_path, expected_path)
                         processed[hack_id]["current_difficulty"] = display_diff
-                        save_processed(processed)
+                        with metrics.stage("save_enqueue", hack_id):
+                            save_processed(processed, changed_ids=[hack_id])
                     except Exception as e:
                         if log:
                             log(f"❌ Failed to move: {title_clean} → {str(e)}", "Error")
@@ -463,7 +514,10 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
                 if processed[hack_id].get("current_difficulty") != display_diff:
                     processed[hack_id]["current_difficulty"] = display_diff
                 
-                save_processed(processed)
+                with metrics.stage("save_enqueue", hack_id):
+                    save_processed(processed, changed_ids=[hack_id])
+                retry_queue.discard([hack_id])
+                metrics.end_hack(hack_id, "skipped")
                 continue
 
         # OPTIMIZED: Use download_url directly from page data (eliminates API call)
@@ -471,6 +525,8 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
         if not download_url:
             if log:
                 log(f"❌ Error: No download URL found for {title_clean}", "Error")
+            retry_queue.record_failure(hack, REASON_NO_DOWNLOAD_URL, "No download URL found")
+            metrics.end_hack(hack_id, "failed")
             continue
 
         temp_dir = tempfile.mkdtemp()
@@ -481,13 +537,17 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
             if log:
                 log(f"[DEBUG] Downloading file: {download_url}", level="debug")
             
-            r = requests.get(download_url)
-            with open(zip_path, "wb") as f:
-                f.write(r.content)
+            with metrics.stage("download", hack_id) as stage:
+                r = requests.get(download_url, timeout=60)
+                r.raise_for_status()
+                with open(zip_path, "wb") as f:
+                    f.write(r.content)
+                stage["bytes"] = downloaded_bytes = len(r.content)
 
-            patch_files = extract_patches_from_zip(zip_path, temp_dir, title_clean, return_all=True)
+            with metrics.stage("extract", hack_id):
+                patch_files = extract_patches_from_zip(zip_path, temp_dir, title_clean, return_all=True)
             if not patch_files:
-                raise Exception("Patch file (.ips or .bps) not found in archive")
+                raise HackProcessingError(REASON_NO_PATCH, "Patch file (.ips or .bps) not found in archive")
 
             # ── Multi-patch path ────────────────────────────────────────
             if len(patch_files) > 1 and multi_patch_callback:
@@ -498,6 +558,7 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
                 if selections is None:
                     if log:
                         log(f"⏭️ Skipped: {title_clean} (cancelled by user)", "Warning")
+                    metrics.end_hack(hack_id, "skipped")
                     continue
 
                 primary_output_path = None
@@ -512,7 +573,9 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
                     )
                     if log:
                         log(f"🔧 Patching {clean_name}...", "Information")
-                    success = PatchHandler.apply_patch(sel["patch_path"], base_rom_path, out_path, log)
+                    with metrics.stage("patch", hack_id) as stage:
+                        success = PatchHandler.apply_patch(sel["patch_path"], base_rom_path, out_path, log)
+                        stage["outcome"] = "ok" if success else "failed"
                     if not success:
                         if log:
                             log(f"⚠️ Patch failed for {clean_name}, skipping.", "Warning")
@@ -522,7 +585,7 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
                         primary_output_path = out_path
 
                 if not patched_files:
-                    raise Exception("All selected patches failed")
+                    raise HackProcessingError(REASON_PATCH_FAILED, "All selected patches failed")
 
                 if primary_output_path is None:
                     primary_output_path = patched_files[0]["path"]
@@ -538,9 +601,11 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
                 patch_path = _select_best_patch(patch_files, title_clean)
                 output_filename = f"{title_clean}{base_rom_ext}"
                 output_path = os.path.join(make_output_path(output_dir, normalized_type, folder_name), output_filename)
-                success = PatchHandler.apply_patch(patch_path, base_rom_path, output_path, log)
+                with metrics.stage("patch", hack_id) as stage:
+                    success = PatchHandler.apply_patch(patch_path, base_rom_path, output_path, log)
+                    stage["outcome"] = "ok" if success else "failed"
                 if not success:
-                    raise Exception("Patch application failed")
+                    raise HackProcessingError(REASON_PATCH_FAILED, "Patch application failed")
                 patched_files_data = []
                 if log:
                     log(f"✅ Patched: {title_clean}")
@@ -607,11 +672,19 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
                 except Exception:
                     pass
             
-            save_processed(processed)
+            with metrics.stage("save_enqueue", hack_id):
+                save_processed(processed, changed_ids=[hack_id])
+            retry_queue.discard([hack_id])
+            metrics.end_hack(hack_id, "downloaded", downloaded_bytes)
 
         except Exception as e:
+            reason = classify_failure(e)
             if log:
-                log(f"❌ Error processing {title_clean}: {str(e)}", "Error")
+                log(f"❌ Error processing {title_clean}: {str(e)} ({reason})", "Error")
+            retry_queue.record_failure(hack, reason, str(e))
+            metrics.end_hack(hack_id, "failed")
+            if is_transient(reason):
+                transient_failures.append(hack)
         finally:
             # Clean up temp files
             import shutil
@@ -620,6 +693,8 @@ def run_pipeline(filter_payload, base_rom_path, output_dir, log=None, multi_patc
             except Exception:
                 pass
 
+    return transient_failures
+
 def save_hack_to_processed_json(hack_data, file_path, hack_type):
     """Save hack data with actual SMWC metadata to processed.json"""
     
@@ -707,7 +782,7 @@ def process_individual_hacks(selected_hacks, base_rom_path, output_dir, log=None
             if success:
                 successful_downloads += 1
                 # Save progress after each successful download
-                save_processed(processed)
+                save_processed(processed, changed_ids=[hack_id])
             
         except Exception as e:
             if log: log(f"❌ Error processing {hack_name}: {str(e)}", "error")
@@ -815,7 +890,7 @@ def download_and_patch_hack(hack_data, patch_handler, processed, log=None):
 def backfill_metadata(log_callback=None, cancel_check=None):
     """
     Backfill missing metadata for existing hacks (release date, description, etc.)
-    Uses BULK API fetching like migration (fetches page lists instead of individual API calls)
+    Joins the shared hack catalog like migration (see hack_catalog) instead of individual API calls
     
     Args:
         log_callback: Optional callback for logging messages
@@ -823,7 +898,13 @@ def backfill_metadata(log_callback=None, cancel_check=None):
     
     Returns the number of updated hacks, or -1 if cancelled.
     """
-    processed = load_processed()
+    with RunMetrics("backfill_metadata", log_callback) as metrics:
+        return _backfill_metadata(log_callback, cancel_check, metrics)
+
+
+def _backfill_metadata(log_callback, cancel_check, metrics):
+    with metrics.stage("load"):
+        processed = load_processed()
     if not processed:
         if log_callback:
             log_callback("No processed hacks found.", "Warning")
@@ -853,70 +934,33 @@ def backfill_metadata(log_callback=None, cancel_check=None):
     if log_callback:
         log_callback(f"Found {len(ids_to_update)} hacks missing metadata. Fetching from SMWCentral...", "Information")
     
-    # OPTIMIZED: Use bulk API fetching (same approach as migration)
-    # Fetch all hacks from list API in pages instead of individual calls
+    # OPTIMIZED: Join the shared hack catalog by id (same source as migration);
+    # it only goes back to the API when the snapshot is stale
+    from hack_catalog import get_hack_catalog
+    catalog = get_hack_catalog()
+    with metrics.stage("catalog_sync"):
+        synced = catalog.sync(log=log_callback, cancel_check=cancel_check, metrics=metrics)
+    if not synced:
+        # Safe point - no data written yet
+        if log_callback:
+            log_callback("⚠️ Metadata fetch cancelled by user", "Warning")
+        return -1
+    
     api_metadata = {}
     total_fetched = 0
-    
-    if log_callback:
-        log_callback("🌐 Fetching hack list from SMWC API (bulk)...", "Information")
-    
-    # Fetch from both moderated AND waiting sections
-    for waiting_mode in [False, True]:
-        section_name = "waiting" if waiting_mode else "moderated"
-        page = 1
-        
-        if log_callback:
-            log_callback(f"🔍 Checking {section_name} hacks...", "Information")
-        
-        while True:
-            # Check for cancellation (safe point - no data written yet)
-            if cancel_check and cancel_check():
-                if log_callback:
-                    log_callback("⚠️ Metadata fetch cancelled by user", "Warning")
-                return -1
-            
-            config = {}  # Empty config = no filters, get all hacks
-            response = fetch_hack_list(config, page=page, waiting_mode=waiting_mode, log=log_callback)
-            
-            if not response or not response.get("data"):
-                break
-            
-            hacks = response["data"]
-            page_matches = 0
-            
-            for hack in hacks:
-                hack_id = str(hack.get("id", ""))
-                if hack_id in ids_to_update:  # Only process hacks we need to update
-                    # Extract time field from list API response
-                    hack_time = hack.get("time", 0)
-                    
-                    if hack_time:
-                        api_metadata[hack_id] = {
-                            "time": hack_time,
-                            "downloads": hack.get("downloads", 0),
-                            "rating": hack.get("rating", 0)
-                        }
-                        total_fetched += 1
-                        page_matches += 1
-                        # Remove from set so we stop searching once all are found
-                        ids_to_update.discard(hack_id)
-            
-            if log_callback:
-                log_callback(f"📄 {section_name.title()} Page {page}: Found {page_matches} hacks to update", "Information")
-            
-            # Check if we're on the last page
-            if page >= response.get("last_page", 1):
-                break
-            
-            # Early exit if we found all hacks
-            if not ids_to_update:
-                if log_callback:
-                    log_callback(f"✅ Found all missing metadata in {section_name} section", "Information")
-                break
-            
-            page += 1
-            time.sleep(0.5)  # Small delay between pages
+    for hack_id in list(ids_to_update):
+        hack = catalog.get(hack_id)
+        # Extract time field from the listing. downloads/rating come from the
+        # snapshot: current for recent releases (delta window), otherwise as of
+        # the last full crawl (at most FULL_SYNC_SECONDS old)
+        if hack and hack.get("time"):
+            api_metadata[hack_id] = {
+                "time": hack["time"],
+                "downloads": hack.get("downloads", 0),
+                "rating": hack.get("rating", 0)
+            }
+            total_fetched += 1
+            ids_to_update.discard(hack_id)
     
     if log_callback:
         log_callback(f"🎯 Fetched metadata for {total_fetched} hacks from API", "Information")
@@ -938,7 +982,8 @@ def backfill_metadata(log_callback=None, cancel_check=None):
             
             try:
                 # Use individual file metadata API
-                file_data = fetch_file_metadata(hack_id, log=log_callback)
+                with metrics.stage("lookup", hack_id):
+                    file_data = fetch_file_metadata(hack_id, log=log_callback)
                 
                 if file_data and file_data.get("data"):
                     hack_data = file_data["data"]
@@ -963,7 +1008,8 @@ def backfill_metadata(log_callback=None, cancel_check=None):
                     if log_callback:
                         log_callback(f"   ✗ ID {hack_id} ({hack_title}): Not found or inaccessible", "Warning")
                 
-                time.sleep(0.5)  # Rate limiting between individual calls
+                with metrics.stage("rate_limit_wait"):
+                    time.sleep(0.5)  # Rate limiting between individual calls
                 
             except Exception as e:
                 if log_callback:
@@ -1004,7 +1050,10 @@ def backfill_metadata(log_callback=None, cancel_check=None):
                     log_callback(f"⚠️ Invalid timestamp for '{hack_title}': {e}", "Warning")
     
     # Save updated data
-    save_processed(processed)
+    with metrics.stage("save"):
+        save_processed(processed)
+        from persistence_worker import get_persistence_worker
+        get_persistence_worker().flush()
     if log_callback:
         log_callback(f"💾 Saved {updated_count} updated hacks", "Information")
         log_callback(f"Backfill function completing (updated {updated_count} hacks)...", "Information")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark - time-to-first-paint of the GUI
+Launches main.py several times and measures the wall time from process start
+until the main window has been drawn (main.py prints a first_paint marker
+when SMWC_STARTUP_BENCHMARK is set and exits straight away).
+
+Usage:
+    python benchmark_startup.py               # 5 runs with your normal config
+    python benchmark_startup.py --runs 10 --json
+    python benchmark_startup.py --isolated    # empty user data folder (first launch)
+
+Needs a display (on Linux, run under X11/Wayland or xvfb-run).
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TIMEOUT = 60
+
+
+def measure_once(env, timeout=DEFAULT_TIMEOUT):
+    """Start main.py once and return seconds until the first_paint marker"""
+    start = time.time()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(BASE_DIR, "main.py")],
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        raise RuntimeError(f"main.py did not paint within {timeout}s")
+
+    for line in stdout.splitlines():
+        line = line.strip()
+        if line.startswith("{") and '"first_paint"' in line:
+            return json.loads(line)["time"] - start
+
+    raise RuntimeError(f"main.py exited (code {process.returncode}) without painting:\n{stderr[-2000:]}")
+
+
+def run_benchmark(runs=5, isolated=False, timeout=DEFAULT_TIMEOUT):
+    """Measure time-to-first-paint over several launches"""
+    env = dict(os.environ)
+    env["SMWC_STARTUP_BENCHMARK"] = "exit"
+    env.pop("SMWC_TRACE", None)
+
+    temp_home = None
+    if isolated:
+        temp_home = tempfile.TemporaryDirectory(prefix="smwc_startup_")
+        env["HOME"] = temp_home.name
+        env["APPDATA"] = temp_home.name
+
+    try:
+        samples = [measure_once(env, timeout) for _ in range(runs)]
+    finally:
+        if temp_home:
+            temp_home.cleanup()
+
+    return {
+        "benchmark": "time_to_first_paint",
+        "runs": runs,
+        "isolated": isolated,
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        # The first launch pays for cold .pyc / disk caches
+        "first_seconds": samples[0],
+        "min_seconds": min(samples),
+        "median_seconds": statistics.median(samples),
+        "max_seconds": max(samples),
+        "samples": samples,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GUI time-to-first-paint")
+    parser.add_argument("--runs", type=int, default=5, help="number of launches (default: 5)")
+    parser.add_argument("--isolated", action="store_true",
+                        help="use an empty temporary user data folder instead of your config")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds to wait per launch")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    try:
+        result = run_benchmark(max(1, args.runs), args.isolated, args.timeout)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"Time to first paint over {result['runs']} launches:")
+        print(f"  first  {result['first_seconds'] * 1000:8.0f}ms")
+        print(f"  min    {result['min_seconds'] * 1000:8.0f}ms")
+        print(f"  median {result['median_seconds'] * 1000:8.0f}ms")
+        print(f"  max    {result['max_seconds'] * 1000:8.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
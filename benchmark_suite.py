@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite - startup, import and data loading performance
+Runs without a display: the main.py startup benchmark swaps tkinter.Tk for a
+stub that stops the app as soon as it tries to open the window, so it
+measures all the imports and eager work done before the first window.
+
+Benchmarks:
+    startup   cold (empty bytecode cache) and warm launches of main.py
+    imports   import time of each module in a fresh interpreter (-X importtime)
+    data      HackDataManager load + get_all_hacks/get_columns on synthetic processed.json
+              files with 1k, 10k and 50k records, plus how soon a background
+              load publishes its first records
+
+Usage:
+    python benchmark_suite.py                        # everything, JSON to stdout
+    python benchmark_suite.py --only data --sizes 1000 10000
+    python benchmark_suite.py --output bench.json
+
+Compare the JSON between commits to spot regressions from new imports or
+eager startup work. Use benchmark_startup.py for real time-to-first-paint.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from check_import_budget import CORE_MODULES, run_importtime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+GUI_MODULES = [
+    "colors",
+    "logging_system",
+    "ui",
+    "updater",
+    "migration_manager",
+    "qusb2snes_ui",
+    "main",
+]
+
+DEFAULT_SIZES = [1000, 10000, 50000]
+
+# Runs main.py until it tries to create the Tk root window, then reports how long that took
+_STARTUP_BOOTSTRAP = r'''
+import json, runpy, sys, time
+start = time.perf_counter()
+import tkinter
+
+class _WindowReached(BaseException):
+    pass
+
+class _StubTk:
+    def __init__(self, *args, **kwargs):
+        raise _WindowReached()
+
+tkinter.Tk = _StubTk
+sys.argv = ["main.py"]
+try:
+    runpy.run_path("main.py", run_name="__main__")
+except _WindowReached:
+    print(json.dumps({"event": "window", "time": time.time(),
+                      "in_process_seconds": time.perf_counter() - start}), flush=True)
+'''
+
+
+def _isolated_env(home_dir, pycache_dir=None):
+    """Environment with an empty user data folder and no tracing"""
+    env = dict(os.environ)
+    env["HOME"] = home_dir
+    env["APPDATA"] = home_dir
+    env.pop("SMWC_TRACE", None)
+    env.pop("SMWC_STARTUP_BENCHMARK", None)
+    if pycache_dir:
+        env["PYTHONPYCACHEPREFIX"] = pycache_dir
+    return env
+
+
+def _stats(samples):
+    return {
+        "min_seconds": min(samples),
+        "median_seconds": statistics.median(samples),
+        "max_seconds": max(samples),
+        "samples": samples,
+    }
+
+
+def _launch_to_window(env):
+    """Launch main.py once with the stubbed Tk, returning (wall, in_process) seconds"""
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", _STARTUP_BOOTSTRAP],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("{") and '"window"' in line:
+            marker = json.loads(line)
+            return marker["time"] - start, marker["in_process_seconds"]
+    raise RuntimeError(f"main.py exited (code {result.returncode}) before creating the window:\n"
+                       f"{result.stderr[-2000:]}")
+
+
+def bench_startup(runs=5):
+    """Cold and warm launches of main.py up to the point the window would open"""
+    with tempfile.TemporaryDirectory(prefix="smwc_bench_") as work_dir:
+        home_dir = os.path.join(work_dir, "home")
+        os.makedirs(home_dir)
+
+        # Cold: a fresh bytecode cache every launch, so every module is compiled
+        cold = []
+        for i in range(runs):
+            env = _isolated_env(home_dir, os.path.join(work_dir, f"pycache_cold_{i}"))
+            cold.append(_launch_to_window(env))
+
+        # Warm: reuse one bytecode cache, primed by an untimed launch
+        warm_env = _isolated_env(home_dir, os.path.join(work_dir, "pycache_warm"))
+        _launch_to_window(warm_env)
+        warm = [_launch_to_window(warm_env) for _ in range(runs)]
+
+    return {
+        "cold": dict(_stats([wall for wall, _ in cold]),
+                     in_process_median_seconds=statistics.median(p for _, p in cold)),
+        "warm": dict(_stats([wall for wall, _ in warm]),
+                     in_process_median_seconds=statistics.median(p for _, p in warm)),
+    }
+
+
+def bench_imports(modules=None):
+    """Import each module on its own in a fresh interpreter"""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="smwc_bench_imports_") as home_dir:
+        for module in modules or CORE_MODULES + GUI_MODULES:
+            try:
+                rows = run_importtime([module], home_dir)
+            except RuntimeError as e:
+                results[module] = {"error": str(e).splitlines()[-1]}
+                continue
+            own = next((r for r in rows if r["module"] == module), None)
+            results[module] = {
+                "cumulative_seconds": own["cumulative_us"] / 1e6 if own else 0.0,
+                "self_seconds": own["self_us"] / 1e6 if own else 0.0,
+                "modules_loaded": len(rows),
+            }
+    return results
+
+
+def make_synthetic_processed(count, seed=1234):
+    """Build a processed.json-style dict with realistic field shapes"""
+    rng = random.Random(seed)
+    difficulties = ["Newcomer", "Casual", "Intermediate", "Advanced", "Expert", "Master", "Grandmaster", ""]
+    types = ["standard", "kaizo", "puzzle", "tool_assisted", "pit"]
+    authors = [f"Author{i}" for i in range(max(50, count // 20))]
+    data = {}
+    for i in range(count):
+        hack_id = str(10000 + i)
+        hack_type = rng.choice(types)
+        difficulty = rng.choice(difficulties)
+        timestamp = 1262304000 + rng.randint(0, 15 * 365 * 86400)
+        data[hack_id] = {
+            "title": f"Synthetic Hack {i} {rng.choice(['World', 'Quest', 'Adventure', 'Kaizo'])}",
+            "current_difficulty": difficulty or "No Difficulty",
+            "folder_name": difficulty,
+            "file_path": f"/roms/{hack_type}/{difficulty or 'No Difficulty'}/Synthetic Hack {i}.smc",
+            "additional_paths": [],
+            "hack_type": hack_type,
+            "hack_types": [hack_type],
+            "hall_of_fame": rng.random() < 0.05,
+            "sa1_compatibility": rng.random() < 0.1,
+            "collaboration": rng.random() < 0.1,
+            "demo": rng.random() < 0.2,
+            "authors": rng.sample(authors, rng.randint(1, 3)),
+            "exits": rng.randint(1, 120),
+            "obsolete": rng.random() < 0.03,
+            "difficulty_id": f"diff_{rng.randint(1, 7)}",
+            "time": timestamp,
+            "date": time.strftime("%Y-%m-%d", time.gmtime(timestamp)),
+            "completed": rng.random() < 0.3,
+            "completed_date": "",
+            "personal_rating": rng.randint(0, 5),
+            "notes": "",
+            "time_to_beat": rng.randint(0, 36000),
+        }
+    return data
+
+
+def bench_data(sizes=None, repeats=3):
+    """HackDataManager load and get_all_hacks on synthetic collections"""
+    import threading
+    from hack_data_manager import HackDataManager
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="smwc_bench_data_") as work_dir:
+        for size in sizes or DEFAULT_SIZES:
+            path = os.path.join(work_dir, f"processed_{size}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(make_synthetic_processed(size), f, indent=2)
+
+            load_samples = []
+            view_samples = []
+            repeat_samples = []
+            columns_samples = []
+            first_records_samples = []
+            background_samples = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                manager = HackDataManager(json_path=path, logger=None)
+                load_samples.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                manager.get_all_hacks()
+                view_samples.append(time.perf_counter() - start)
+
+                # Second call with unchanged data (served from the view cache)
+                start = time.perf_counter()
+                manager.get_all_hacks()
+                repeat_samples.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                manager.get_columns()
+                columns_samples.append(time.perf_counter() - start)
+
+                # Background load: time until the first records are readable, then until done
+                first_records = threading.Event()
+                start = time.perf_counter()
+                manager = HackDataManager(json_path=path, logger=None, background=True)
+                manager.subscribe(lambda event, hack_ids: first_records.set())
+                first_records.wait()
+                first_records_samples.append(time.perf_counter() - start)
+                manager.wait_until_loaded()
+                background_samples.append(time.perf_counter() - start)
+
+            results[str(size)] = {
+                "file_bytes": os.path.getsize(path),
+                "load": _stats(load_samples),
+                "get_all_hacks": _stats(view_samples),
+                "get_all_hacks_repeat": _stats(repeat_samples),
+                "get_columns": _stats(columns_samples),
+                "background_first_records": _stats(first_records_samples),
+                "background_load": _stats(background_samples),
+            }
+    return results
+
+
+def run_suite(only=None, runs=5, sizes=None, repeats=3):
+    """Run the selected benchmarks and return one JSON-serializable report"""
+    report = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    selected = only or ["startup", "imports", "data"]
+    if "startup" in selected:
+        report["startup"] = bench_startup(runs)
+    if "imports" in selected:
+        report["imports"] = bench_imports()
+    if "data" in selected:
+        report["data"] = bench_data(sizes, repeats)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup, import and data loading benchmarks")
+    parser.add_argument("--only", nargs="+", choices=["startup", "imports", "data"],
+                        help="run only these benchmarks")
+    parser.add_argument("--runs", type=int, default=5, help="launches per startup mode (default: 5)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="synthetic collection sizes (default: 1000 10000 50000)")
+    parser.add_argument("--repeats", type=int, default=3, help="repeats per data benchmark (default: 3)")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        report = run_suite(args.only, max(1, args.runs), args.sizes, max(1, args.repeats))
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"📊 Benchmark report saved to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
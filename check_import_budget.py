@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Import budget check for the core (non-GUI) modules
+Imports the pipeline, patching, storage, config and API modules in a fresh
+interpreter with `python -X importtime` and fails if the import graph pulls in
+tkinter, PIL or sv_ttk, writes anything to the user data folder, or takes
+longer than the time budget.
+
+Usage:
+    python check_import_budget.py               # default budget
+    python check_import_budget.py --budget-ms 400 --top 15
+
+Exit code 0 when the budget holds, 1 otherwise.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# Modules the headless CLI and the background pipeline rely on.
+# These must stay importable without a display.
+CORE_MODULES = [
+    "utils",
+    "config_manager",
+    "api_pipeline",
+    "patch_handler",
+    "patcher_ips",
+    "patcher_bps",
+    "hack_data_manager",
+    "processed_journal",
+    "persistence_worker",
+    "record_normalization",
+    "schema_migrations",
+    "hack_catalog",
+    "library_integrity",
+    "collection_columns",
+    "smwc_api_proxy",
+    "difficulty_lookup_manager",
+    "difficulty_migration",
+    "multi_type_utils",
+    "hack_index",
+    "download_state_manager",
+    "retry_queue",
+    "pipeline_metrics",
+    "tracer",
+    "qusb2snes_sync",
+    "platform_utils",
+    "file_explorer_utils",
+    "cli",
+]
+
+# Top-level packages that only the GUI may load
+FORBIDDEN_PACKAGES = ["tkinter", "_tkinter", "PIL", "sv_ttk", "ui"]
+
+DEFAULT_BUDGET_MS = 1500
+
+
+def run_importtime(modules, home_dir):
+    """Import modules in a clean interpreter and return the -X importtime rows"""
+    env = dict(os.environ)
+    # Point the user data folder at an empty temp dir so import-time writes show up
+    env["HOME"] = home_dir
+    env["APPDATA"] = home_dir
+    env.pop("SMWC_TRACE", None)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing core modules failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append({
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip())) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            })
+        except ValueError:
+            continue
+    return rows
+
+
+def check(budget_ms=DEFAULT_BUDGET_MS, top=10):
+    """Run the budget check, print a report and return a list of problems"""
+    problems = []
+    with tempfile.TemporaryDirectory(prefix="smwc_import_budget_") as home_dir:
+        rows = run_importtime(CORE_MODULES, home_dir)
+
+        created = []
+        for root, _dirs, files in os.walk(home_dir):
+            created.extend(os.path.relpath(os.path.join(root, name), home_dir) for name in files)
+        if created:
+            problems.append(f"Import wrote files to the user data folder: {', '.join(sorted(created))}")
+
+    for row in rows:
+        if row["module"].split(".")[0] in FORBIDDEN_PACKAGES:
+            problems.append(f"GUI module imported by core graph: {row['module']}")
+
+    # Only top-level rows (depth 1) add up to the wall time of the import statement
+    total_ms = sum(r["cumulative_us"] for r in rows if r["depth"] == 1) / 1000.0
+    if total_ms > budget_ms:
+        problems.append(f"Core import took {total_ms:.0f}ms (budget {budget_ms}ms)")
+
+    print(f"Core import: {len(rows)} modules, {total_ms:.0f}ms (budget {budget_ms}ms)")
+    print(f"{'Cumulative':>12}  {'Self':>9}  Module")
+    for row in sorted(rows, key=lambda r: r["cumulative_us"], reverse=True)[:top]:
+        print(f"{row['cumulative_us'] / 1000:>10.1f}ms  {row['self_us'] / 1000:>7.1f}ms  {row['module']}")
+
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the core modules' import-time budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"maximum total import time in ms (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest modules to list")
+    args = parser.parse_args()
+
+    try:
+        problems = check(args.budget_ms, args.top)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if problems:
+        print()
+        for problem in problems:
+            print(f"❌ {problem}")
+        return 1
+    print("✅ Core import budget OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+SMWCentral Downloader & Patcher - Headless CLI
+Runs bulk downloads, metadata backfill, difficulty migration, library integrity
+scans and QUSB2SNES sync without the GUI (no tkinter / ui imports), e.g. from cron.
+
+Progress is written to stdout as JSON lines (one object per line) unless
+--format text is used. Anything the pipeline prints directly goes to stderr.
+
+Exit codes:
+    0   success
+    1   the operation failed (or some hacks failed to download)
+    2   bad arguments or missing configuration
+    130 cancelled (Ctrl+C)
+
+Examples:
+    python cli.py download --filter kaizo.json
+    python cli.py backfill
+    python cli.py migrate-difficulty --dry-run
+    python cli.py verify-library --fix
+    python cli.py sync --device "SD2SNES COM3"
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_CANCELLED = 130
+
+
+class Reporter:
+    """Writes machine-readable (JSON lines) or plain text progress"""
+
+    def __init__(self, stream, fmt="jsonl", verbose=False):
+        self.stream = stream
+        self.fmt = fmt
+        self.verbose = verbose
+        self.start = time.monotonic()
+        self.errors = 0
+
+    def emit(self, event_type, **fields):
+        fields = {"type": event_type, "t": round(time.monotonic() - self.start, 3), **fields}
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(fields, ensure_ascii=False, default=str) + "\n")
+        elif event_type == "log":
+            self.stream.write(f"[{fields['level']}] {fields['message']}\n")
+        elif event_type == "hack":
+            self.stream.write(f"[hack] {fields['hack_id']}: {fields['outcome']} ({fields['duration']:.2f}s)\n")
+        else:
+            details = ", ".join(f"{k}={v}" for k, v in fields.items() if k not in ("type", "t"))
+            self.stream.write(f"[{event_type}] {details}\n")
+        self.stream.flush()
+
+    def log(self, message, level="Information"):
+        """log(message, level) callback compatible with the pipeline functions"""
+        level = str(level).lower()
+        if level in ("information", "info", "applying"):
+            level = "info"
+        elif level in ("warn", "wrn"):
+            level = "warning"
+        if level == "debug" and not self.verbose:
+            return
+        if level == "error":
+            self.errors += 1
+        self.emit("log", level=level, message=str(message))
+
+    def on_metrics_event(self, run_name, event):
+        """pipeline_metrics listener - report per-hack progress"""
+        if event["stage"] == "hack":
+            self.emit("hack", run=run_name, hack_id=event["hack_id"], outcome=event["outcome"],
+                      duration=round(event["duration"], 3), bytes=event["bytes"])
+
+
+def _load_config():
+    from config_manager import ConfigManager
+    return ConfigManager()
+
+
+def _init_difficulty_lookup(config):
+    """Load the cached difficulty lookup before importing the pipeline modules"""
+    from difficulty_lookup_manager import get_difficulty_lookup
+    from utils import update_difficulty_lookup
+    update_difficulty_lookup(get_difficulty_lookup(config))
+
+
+def cmd_download(args, reporter):
+    try:
+        with open(args.filter, "r", encoding="utf-8") as f:
+            filter_payload = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        reporter.log(f"Could not read filter file {args.filter}: {e}", "Error")
+        return EXIT_USAGE
+
+    if not isinstance(filter_payload, dict) or not filter_payload.get("type"):
+        reporter.log('Filter must be a JSON object with a "type" list, e.g. {"type": ["kaizo"]}', "Error")
+        return EXIT_USAGE
+    if isinstance(filter_payload["type"], str):
+        filter_payload["type"] = [filter_payload["type"]]
+
+    config = _load_config()
+    base_rom_path = args.base_rom or config.get("base_rom_path", "")
+    output_dir = args.output_dir or config.get("output_dir", "")
+    if not base_rom_path or not os.path.isfile(base_rom_path):
+        reporter.log(f"Base ROM not found: '{base_rom_path}' (set base_rom_path in config or pass --base-rom)", "Error")
+        return EXIT_USAGE
+    if not output_dir:
+        reporter.log("Output directory not configured (set output_dir in config or pass --output-dir)", "Error")
+        return EXIT_USAGE
+
+    _init_difficulty_lookup(config)
+    from api_pipeline import run_pipeline, is_cancelled
+
+    outcomes = run_pipeline(filter_payload, base_rom_path, output_dir, log=reporter.log) or {}
+    failed = outcomes.get("failed", 0)
+    reporter.emit("result", command="download", ok=failed == 0 and not is_cancelled(), outcomes=outcomes)
+    if is_cancelled():
+        return EXIT_CANCELLED
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def cmd_backfill(args, reporter):
+    from api_pipeline import backfill_metadata
+
+    updated = backfill_metadata(log_callback=reporter.log)
+    if updated < 0:
+        reporter.emit("result", command="backfill", ok=False, cancelled=True)
+        return EXIT_CANCELLED
+    reporter.emit("result", command="backfill", ok=True, updated=updated)
+    return EXIT_OK
+
+
+def cmd_migrate_difficulty(args, reporter):
+    config = _load_config()
+    output_dir = args.output_dir or config.get("output_dir", "")
+    if not output_dir or not os.path.isdir(output_dir):
+        reporter.log(f"Output directory not found: '{output_dir}'", "Error")
+        return EXIT_USAGE
+
+    _init_difficulty_lookup(config)
+    from difficulty_migration import run_difficulty_migration
+
+    results = run_difficulty_migration(output_dir, dry_run=args.dry_run, log_func=reporter.log)
+    errors = [m["error"] for m in results.get("migrations", []) if m.get("error")]
+    errors.extend(results.get("errors", []))
+    backfill = results.get("backfill_result", {})
+    if backfill and not backfill.get("success", True) and "not found" not in backfill.get("message", ""):
+        errors.append(backfill.get("message"))
+    for error in errors:
+        reporter.log(error, "Error")
+
+    reporter.emit("result", command="migrate-difficulty", ok=not errors, dry_run=args.dry_run,
+                  summary=results.get("summary", {}), message=results.get("message", ""))
+    return EXIT_FAILED if errors else EXIT_OK
+
+
+def cmd_verify_library(args, reporter):
+    config = _load_config()
+    output_dir = args.output_dir or config.get("output_dir", "")
+    if not output_dir or not os.path.isdir(output_dir):
+        reporter.log(f"Output directory not found: '{output_dir}'", "Error")
+        return EXIT_USAGE
+
+    from library_integrity import scan_library, apply_fix_plan
+
+    report = scan_library(output_dir, full=args.full, log=reporter.log)
+    if args.verbose:
+        for item in report["missing"]:
+            reporter.log(f"Missing: {item['title']} ({item['field']}) {item['path']}", "Debug")
+        for item in report["moved"]:
+            reporter.log(f"Moved: {item['title']} {item['path']} → {item['new_path']}", "Debug")
+        for item in report["orphaned"]:
+            reporter.log(f"Untracked: {item['path']}", "Debug")
+    relinked = apply_fix_plan(report, log=reporter.log) if args.fix else 0
+
+    # Moved files are fine once relinked; missing ones still need a redownload
+    ok = not report["missing"] and (args.fix or not report["moved"])
+    reporter.emit("result", command="verify-library", ok=ok, fixed=args.fix, relinked=relinked,
+                  missing=len(report["missing"]), moved=len(report["moved"]),
+                  orphaned=len(report["orphaned"]), files=report["files"],
+                  rescanned_directories=report["rescanned_directories"], fix_plan=report["fix_plan"])
+    return EXIT_OK if ok else EXIT_FAILED
+
+
+def cmd_sync(args, reporter):
+    import asyncio
+    from qusb2snes_sync import QUSB2SNESSyncManager
+
+    config = _load_config()
+    local_dir = args.output_dir or config.get("output_dir", "")
+    if not local_dir or not os.path.isdir(local_dir):
+        reporter.log(f"ROM directory not found: '{local_dir}'", "Error")
+        return EXIT_USAGE
+
+    host = args.host or config.get("qusb2snes_host", "localhost")
+    port = args.port or int(config.get("qusb2snes_port", 23074) or 23074)
+    device = args.device or config.get("qusb2snes_device", "")
+    remote_folder = args.remote_folder or config.get("qusb2snes_remote_folder", "/ROMS")
+    cleanup = args.cleanup or bool(config.get("qusb2snes_cleanup_deleted", False))
+    last_sync = 0.0 if args.full else float(config.get("qusb2snes_last_sync", 0) or 0)
+
+    async def run_sync():
+        manager = QUSB2SNESSyncManager()
+        manager.on_progress = lambda message: reporter.log(message, "Information")
+        manager.on_error = lambda message: reporter.log(message, "Error")
+        manager.configure(host, port, "", remote_folder)
+
+        try:
+            if not await manager.connect_and_attach():
+                return {"success": False, "error": f"Could not connect to QUSB2SNES at {host}:{port}"}
+
+            target = device
+            if not target:
+                devices = await manager.get_devices()
+                if not devices:
+                    return {"success": False, "error": "No devices found"}
+                target = devices[0]
+                reporter.log(f"Using device: {target}", "Information")
+            if not await manager.sync_client.attach_device(target):
+                return {"success": False, "error": f"Could not attach to device {target}"}
+
+            return await manager.sync_roms_incremental(local_dir, {}, cleanup, last_sync)
+        finally:
+            await manager.disconnect()
+
+    result = asyncio.run(run_sync())
+    ok = bool(result and result.get("success"))
+    if ok:
+        config.set("qusb2snes_last_sync", time.time())
+    reporter.emit("result", command="sync", ok=ok, error=(result or {}).get("error"))
+    return EXIT_OK if ok else EXIT_FAILED
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="smwc-cli",
+        description="Headless SMWCentral Downloader & Patcher"
+    )
+    parser.add_argument("--format", choices=["jsonl", "text"], default="jsonl",
+                        help="progress output format (default: jsonl)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="include debug messages")
+    parser.add_argument("--trace", action="store_true",
+                        help="write a Chrome trace file for the run (see tracer.py)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    download = subparsers.add_parser("download", help="bulk download + patch hacks matching a filter")
+    download.add_argument("--filter", required=True,
+                          help='JSON file with the filter payload, e.g. {"type": ["kaizo"], "difficulties": ["expert"], "waiting": false}')
+    download.add_argument("--base-rom", help="clean SMW ROM (default: base_rom_path from config)")
+    download.add_argument("--output-dir", help="output folder (default: output_dir from config)")
+    download.set_defaults(func=cmd_download)
+
+    backfill = subparsers.add_parser("backfill", help="fetch missing release dates/metadata for processed hacks")
+    backfill.set_defaults(func=cmd_backfill)
+
+    migrate = subparsers.add_parser("migrate-difficulty", help="apply SMWC difficulty renames to folders and processed.json")
+    migrate.add_argument("--dry-run", action="store_true", help="only report what would change")
+    migrate.add_argument("--output-dir", help="output folder (default: output_dir from config)")
+    migrate.set_defaults(func=cmd_migrate_difficulty)
+
+    verify = subparsers.add_parser("verify-library", help="check processed.json against the ROM files in the output folder")
+    verify.add_argument("--fix", action="store_true", help="relink hacks whose files were moved within the output folder")
+    verify.add_argument("--full", action="store_true", help="ignore the stat index and re-read every folder")
+    verify.add_argument("--output-dir", help="output folder (default: output_dir from config)")
+    verify.set_defaults(func=cmd_verify_library)
+
+    sync = subparsers.add_parser("sync", help="sync the ROM folder to an SD2SNES/FXPak via QUSB2SNES")
+    sync.add_argument("--host", help="QUSB2SNES host (default: localhost)")
+    sync.add_argument("--port", type=int, help="QUSB2SNES port (default: 23074)")
+    sync.add_argument("--device", help="device name (default: first device found)")
+    sync.add_argument("--remote-folder", help="folder on the SD card (default: /ROMS)")
+    sync.add_argument("--output-dir", help="local ROM folder (default: output_dir from config)")
+    sync.add_argument("--cleanup", action="store_true", help="remove files deleted locally from the SD card")
+    sync.add_argument("--full", action="store_true", help="ignore the last sync time and check every file")
+    sync.set_defaults(func=cmd_sync)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # Keep stdout clean for machine-readable output; stray prints go to stderr
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    reporter = Reporter(out, args.format, args.verbose)
+
+    import pipeline_metrics
+    pipeline_metrics.register_listener(reporter.on_metrics_event)
+    if args.trace:
+        import tracer
+        tracer.enable()
+
+    try:
+        return args.func(args, reporter)
+    except KeyboardInterrupt:
+        from api_pipeline import cancel_pipeline
+        cancel_pipeline()
+        reporter.emit("result", command=args.command, ok=False, cancelled=True)
+        return EXIT_CANCELLED
+    except Exception as e:
+        reporter.log(f"{type(e).__name__}: {e}", "Error")
+        reporter.emit("result", command=args.command, ok=False, error=str(e))
+        return EXIT_FAILED
+    finally:
+        pipeline_metrics.unregister_listener(reporter.on_metrics_event)
+        sys.stdout = out
+
+
+if __name__ == "__main__":
+    sys.exit(main())
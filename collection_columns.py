@@ -0,0 +1,251 @@
+"""
+Collection Columns
+Compact columnar snapshot of the collection for analytics and charts
+
+Numeric fields live in typed arrays, difficulty, type lists and completion
+dates are small-int codes into shared tables, and the boolean fields are bit
+flags packed into one byte per record. Aggregates are computed with whole-
+column passes (bytes.translate masks, itertools.compress, Counter) instead of
+walking ~20-key dicts, and date-derived values are parsed once per distinct
+date rather than once per record. RecordView gives row access for code that
+expects a hack dict.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import and_
+
+# Bit flags, one byte per record
+COMPLETED = 0x01
+OBSOLETE = 0x02
+HALL_OF_FAME = 0x04
+SA1_COMPATIBILITY = 0x08
+COLLABORATION = 0x10
+DEMO = 0x20
+
+FLAG_BITS = {
+    "completed": COMPLETED,
+    "obsolete": OBSOLETE,
+    "hall_of_fame": HALL_OF_FAME,
+    "sa1_compatibility": SA1_COMPATIBILITY,
+    "collaboration": COLLABORATION,
+    "demo": DEMO,
+}
+
+
+def _to_int(value):
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return 0
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
+def _to_float(value):
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _to_rating(value):
+    """Personal rating as 1-5, or 0 for not rated / invalid"""
+    if not value or value == "Not Rated":
+        return 0
+    try:
+        rating = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return rating if 1 <= rating <= 5 else 0
+
+
+class _CodeTable:
+    """Interns values to small ints: values[code] -> value"""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class CollectionColumns:
+    """Columnar copy of every titled processed.json record
+
+    Rows follow the insertion order of the records dict. Fields without a
+    column (notes, authors, file paths...) are read from the records dict the
+    snapshot was built from, which is referenced, not copied.
+    """
+
+    def __init__(self, records):
+        self.records = records
+        self.ids = []
+        self.row_of = {}
+        self.titles = []
+        self.exits = array("i")
+        self.time = array("q")
+        self.time_to_beat = array("d")
+        self.rating = array("b")
+        self.flags = bytearray()
+        self.difficulty_table = _CodeTable()
+        self.types_table = _CodeTable()
+        self.date_table = _CodeTable()
+        self.difficulty = array("H")
+        self.types = array("H")
+        self.completed_date = array("I")
+
+        for hack_id, hack_data in records.items():
+            if isinstance(hack_data, dict) and "title" in hack_data:
+                self.row_of[hack_id] = len(self.ids)
+                self.ids.append(hack_id)
+                self.titles.append(None)
+                self.exits.append(0)
+                self.time.append(0)
+                self.time_to_beat.append(0.0)
+                self.rating.append(0)
+                self.flags.append(0)
+                self.difficulty.append(0)
+                self.types.append(0)
+                self.completed_date.append(0)
+                self._fill_row(len(self.ids) - 1, hack_data)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _fill_row(self, row, hack_data):
+        self.titles[row] = hack_data.get("title", "Unknown")
+        self.exits[row] = max(0, min(_to_int(hack_data.get("exits", 0)), 2 ** 31 - 1))
+        self.time[row] = max(-2 ** 63, min(_to_int(hack_data.get("time", 0)), 2 ** 63 - 1))
+        self.time_to_beat[row] = _to_float(hack_data.get("time_to_beat", 0))
+        self.rating[row] = _to_rating(hack_data.get("personal_rating"))
+        flags = 0
+        for field, bit in FLAG_BITS.items():
+            if hack_data.get(field, False):
+                flags |= bit
+        self.flags[row] = flags
+        self.difficulty[row] = self.difficulty_table.code(hack_data.get("current_difficulty", "Unknown"))
+        # None marks "no type recorded" so callers can pick their own default
+        if "hack_types" in hack_data:
+            hack_types = tuple(hack_data["hack_types"] or ())
+        elif "hack_type" in hack_data:
+            hack_types = (hack_data["hack_type"],)
+        else:
+            hack_types = None
+        self.types[row] = self.types_table.code(hack_types)
+        self.completed_date[row] = self.date_table.code(hack_data.get("completed_date") or "")
+
+    def update_row(self, hack_id, hack_data):
+        """Refresh one record in place; returns False if it has no row (rebuild instead)"""
+        row = self.row_of.get(hack_id)
+        if row is None or not (isinstance(hack_data, dict) and "title" in hack_data):
+            return False
+        self._fill_row(row, hack_data)
+        return True
+
+    # -- row access -------------------------------------------------------
+
+    def view(self, row):
+        return RecordView(self, row)
+
+    def views(self, mask=None):
+        rows = range(len(self.ids)) if mask is None else compress(range(len(self.ids)), mask)
+        return [RecordView(self, row) for row in rows]
+
+    def hack_types(self, row, default):
+        """Type list of a row, or [default] when the record has none"""
+        hack_types = self.types_table.values[self.types[row]]
+        return list(hack_types) if hack_types is not None else [default]
+
+    # -- whole-column passes ----------------------------------------------
+
+    def mask(self, required=0, excluded=0):
+        """Row mask (bytes of 0/1) for flags with all required bits and no excluded bits"""
+        table = bytes(1 if (flags & required) == required and not flags & excluded else 0
+                      for flags in range(256))
+        return self.flags.translate(table)
+
+    def date_mask(self, accept):
+        """Row mask from accept(completed_date) evaluated once per distinct date"""
+        table = bytes(1 if accept(date) else 0 for date in self.date_table.values)
+        return bytes(map(table.__getitem__, self.completed_date))
+
+    @staticmethod
+    def both(mask_a, mask_b):
+        return bytes(map(and_, mask_a, mask_b))
+
+    @staticmethod
+    def count(mask):
+        return mask.count(1)
+
+    def sum(self, column, mask):
+        return sum(compress(column, mask))
+
+    def value_counts(self, codes, table, mask=None):
+        """{value: rows} for a code column, optionally restricted to mask"""
+        counts = Counter(codes if mask is None else compress(codes, mask))
+        return {table.values[code]: count for code, count in counts.items()}
+
+    def type_counts(self, mask, default):
+        """{hack_type: rows} counting each type of multi-type records once"""
+        counts = Counter()
+        for hack_types, rows in Counter(compress(self.types, mask)).items():
+            values = self.types_table.values[hack_types]
+            for hack_type in values if values is not None else (default,):
+                counts[hack_type] += rows
+        return dict(counts)
+
+
+class RecordView:
+    """Read-only row of a CollectionColumns snapshot with a dict-style get()"""
+
+    __slots__ = ("_columns", "row")
+
+    def __init__(self, columns, row):
+        self._columns = columns
+        self.row = row
+
+    def get(self, field, default=None):
+        columns, row = self._columns, self.row
+        if field == "id":
+            return columns.ids[row]
+        if field == "title":
+            return columns.titles[row]
+        if field in FLAG_BITS:
+            return bool(columns.flags[row] & FLAG_BITS[field])
+        if field in ("difficulty", "current_difficulty"):
+            return columns.difficulty_table.values[columns.difficulty[row]]
+        if field == "personal_rating":
+            return columns.rating[row]
+        if field == "exits":
+            return columns.exits[row]
+        if field == "time":
+            return columns.time[row]
+        if field == "time_to_beat":
+            return columns.time_to_beat[row]
+        if field == "completed_date":
+            return columns.date_table.values[columns.completed_date[row]]
+        return columns.records.get(columns.ids[row], {}).get(field, default)
+
+    def __getitem__(self, field):
+        value = self.get(field, KeyError)
+        if value is KeyError:
+            raise KeyError(field)
+        return value
+
+    def __repr__(self):
+        return f"RecordView({self._columns.ids[self.row]!r})"
@@ -75,6 +75,7 @@ class ConfigManager:
             "multi_type_enabled": True,
             "multi_type_download_mode": "primary_only",
             "auto_check_updates": True,  # Auto-check for updates on startup
+            "performance_trace": False,  # Write Chrome trace files for pipeline runs
             # Emulator settings
             "emulator_path": "",
             "emulator_args": "",
@@ -100,7 +101,11 @@ class ConfigManager:
         allowed_keys = {"base_rom_path", "output_dir", "api_delay", "flips_path",
                         "multi_type_enabled", "multi_type_download_mode", "difficulty_lookup",
                         "emulator_path", "emulator_args", "emulator_args_enabled", "auto_check_updates",
-                        "column_order", "visible_columns", "show_rom_picker"}
+                        "column_order", "visible_columns", "show_rom_picker", "performance_trace",
+                        # QUSB2SNES sync settings (settings page + headless CLI)
+                        "qusb2snes_enabled", "qusb2snes_host", "qusb2snes_port", "qusb2snes_device",
+                        "qusb2snes_remote_folder", "qusb2snes_cleanup_deleted", "qusb2snes_last_sync",
+                        "qusb2snes_sync_progress", "qusb2snes_partial_sync"}
         cleaned = {}
 
         for key, value in config.items():
@@ -131,6 +136,7 @@ class ConfigManager:
         try:
             # Clean config before saving to prevent UI references
             clean_config = self._clean_config(config)
+            os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
             with open(CONFIG_PATH, "w", encoding="utf-8") as f:
                 json.dump(clean_config, f, indent=2)
         except Exception as e:
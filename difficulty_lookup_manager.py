@@ -6,8 +6,20 @@ Copyright (c) 2025 iamtheratio
 Licensed under the MIT License - see LICENSE file for details
 """
 
+import threading
 import requests
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
+
+# Hardcoded fallback (current as of v4.8)
+FALLBACK_LOOKUP = {
+    "diff_1": "Newcomer",
+    "diff_2": "Casual",
+    "diff_3": "Intermediate",
+    "diff_4": "Advanced",
+    "diff_5": "Expert",
+    "diff_6": "Master",
+    "diff_7": "Grandmaster"
+}
 
 def fetch_difficulty_lookup_from_api() -> Optional[Dict[str, str]]:
     """
@@ -69,22 +81,10 @@ def get_difficulty_lookup(config_manager=None) -> Dict[str, str]:
     Returns:
         Dictionary mapping difficulty IDs to friendly names
     """
-    # Hardcoded fallback (current as of v4.8)
-    FALLBACK_LOOKUP = {
-        "diff_1": "Newcomer",
-        "diff_2": "Casual",
-        "diff_3": "Intermediate",
-        "diff_4": "Advanced",
-        "diff_5": "Expert",
-        "diff_6": "Master",
-        "diff_7": "Grandmaster"
-    }
-    
     # Try to get cached version from config
-    if config_manager:
-        cached = config_manager.get_difficulty_lookup()
-        if cached and isinstance(cached, dict) and len(cached) > 0:
-            return cached
+    cached = get_cached_difficulty_lookup(config_manager)
+    if cached:
+        return cached
     
     # Try to fetch from API
     fetched = fetch_difficulty_lookup_from_api()
@@ -96,7 +96,49 @@ def get_difficulty_lookup(config_manager=None) -> Dict[str, str]:
         return fetched
     
     # Fall back to hardcoded
-    return FALLBACK_LOOKUP
+    return FALLBACK_LOOKUP.copy()
+
+
+def get_cached_difficulty_lookup(config_manager=None) -> Optional[Dict[str, str]]:
+    """
+    Get the difficulty lookup cached in config without touching the network.
+    
+    Args:
+        config_manager: ConfigManager instance (optional)
+    
+    Returns:
+        Cached dictionary, or None if nothing is cached
+    """
+    if config_manager:
+        cached = config_manager.get_difficulty_lookup()
+        if cached and isinstance(cached, dict) and len(cached) > 0:
+            return cached
+    return None
+
+
+def refresh_difficulty_lookup_async(callback: Callable[[Optional[Dict[str, str]]], None]) -> threading.Thread:
+    """
+    Fetch the difficulty lookup from the SMWC API on a background thread.
+    
+    The callback receives the fetched dictionary (or None if the fetch failed)
+    on the background thread - GUI callers should marshal it with root.after().
+    Nothing is saved here so config writes stay on the caller's thread.
+    
+    Args:
+        callback: Function called with the fetch result
+    
+    Returns:
+        The started daemon thread
+    """
+    def fetch():
+        try:
+            callback(fetch_difficulty_lookup_from_api())
+        except Exception as e:
+            print(f"Background difficulty lookup refresh failed: {e}")
+
+    thread = threading.Thread(target=fetch, name="difficulty-lookup-refresh", daemon=True)
+    thread.start()
+    return thread
 
 
 def update_difficulty_lookup(config_manager) -> bool:
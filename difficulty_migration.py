@@ -40,14 +40,16 @@ Licensed under the MIT License - see LICENSE file for details
 
 import os
 import json
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Set
 
 # Import the current difficulty lookup from utils
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from utils import DIFFICULTY_LOOKUP, PROCESSED_JSON_PATH
+from utils import DIFFICULTY_LOOKUP, PROCESSED_JSON_PATH, load_processed, save_processed
 
 # Sorted folder name patterns (number prefix)
 FOLDER_NUMBER_MAP = {
@@ -62,6 +64,87 @@ FOLDER_NUMBER_MAP = {
     "No Difficulty": "08"
 }
 
+# Worker threads for moving files when a folder has to be merged
+MOVE_WORKERS = 8
+
+# Path separators as stored in processed.json (Windows paths may mix both)
+_PATH_SEGMENTS = re.compile(r"[^/\\]+")
+
+
+def _count_tree(path: str) -> Tuple[int, int]:
+    """Count the files and bytes under a folder"""
+    files = 0
+    size = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = list(os.scandir(stack.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    files += 1
+                    size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+    return files, size
+
+
+class MigrationPlan:
+    """Every folder move and path rewrite of a migration, computed before anything changes
+
+    A difficulty folder whose new name is free is renamed with one
+    directory-level os.replace; one whose new name already exists is merged
+    file by file. Stored paths are rewritten through folder_map in one pass.
+    """
+
+    def __init__(self, renames: Dict[str, str], folder_map: Dict[str, str]):
+        self.renames = renames          # old difficulty name -> new
+        self.folder_map = folder_map    # old sorted folder name -> new
+        # {"type", "old", "new", "old_name", "new_name", "files", "bytes"} per folder
+        self.directory_moves: List[Dict] = []
+        # Same, plus "moves": [(source, destination, bytes, overwrites)]
+        self.merges: List[Dict] = []
+
+    @property
+    def folders(self) -> List[Dict]:
+        return self.directory_moves + self.merges
+
+    @property
+    def files(self) -> int:
+        return sum(folder["files"] for folder in self.folders)
+
+    @property
+    def bytes(self) -> int:
+        return sum(folder["bytes"] for folder in self.folders)
+
+    @property
+    def overwrites(self) -> int:
+        return sum(1 for merge in self.merges for move in merge["moves"] if move[3])
+
+    def rewrite_path(self, path: str) -> str:
+        """Replace the first path segment that is a renamed difficulty folder"""
+        if not isinstance(path, str):
+            return path
+        for match in _PATH_SEGMENTS.finditer(path):
+            new_folder = self.folder_map.get(match.group())
+            if new_folder is not None:
+                return path[:match.start()] + new_folder + path[match.end():]
+        return path
+
+    def summary(self) -> Dict:
+        return {
+            "folders": len(self.folders),
+            "directory_renames": len(self.directory_moves),
+            "merges": len(self.merges),
+            "files": self.files,
+            "bytes": self.bytes,
+            "overwrites": self.overwrites,
+        }
+
 
 class DifficultyMigrator:
     """Manages difficulty name migrations across the entire app using auto-detection"""
@@ -71,26 +154,69 @@ class DifficultyMigrator:
         # Use platform-specific path by default to support macOS/Linux
         self.processed_json_path = processed_json_path if processed_json_path is not None else PROCESSED_JSON_PATH
         self.migrations_performed: List[Tuple[str, str]] = []
-        self.files_moved = 0
+        self.files_moved = 0  # Difficulty folders renamed or merged
+        self.files_in_moved_folders = 0
+        self.bytes_moved = 0
         self.json_entries_updated = 0
         self.detected_renames: Dict[str, str] = {}  # Auto-detected renames
     
-    def detect_renames_from_data(self) -> Dict[str, Tuple[str, int]]:
+    def _load_processed(self) -> Optional[Dict]:
+        """Read processed.json after queued saves land, with journaled edits (None if missing or unreadable)"""
+        if not os.path.exists(self.processed_json_path):
+            return None
+        try:
+            return load_processed(self.processed_json_path)
+        except Exception:
+            return None
+    
+    def _save_processed(self, processed: Dict) -> Optional[str]:
+        """Save processed.json through the persistence worker and wait for it
+        
+        Going through save_processed orders the write after queued pipeline and
+        collection saves, supersedes the journaled edits replayed into processed
+        (so they don't override the migrated fields) and lets the shared
+        HackDataManager (and open pages) pick up the migrated records. Returns
+        an error message on failure.
+        """
+        from persistence_worker import get_persistence_worker
+        try:
+            save_processed(processed, self.processed_json_path)
+            get_persistence_worker().flush()
+        except Exception as e:
+            return f"Error saving processed.json: {str(e)}"
+        return None
+    
+    def _replay_new_journal_entries(self, processed: Dict) -> None:
+        """Fold in collection edits journaled since processed was loaded
+        
+        Folder moves can take a while. Replaying the journal again before the
+        rewrite pass migrates paths/difficulties edited in the meantime too,
+        and the save then supersedes those entries instead of leaving them to
+        override the migrated fields.
+        """
+        from persistence_worker import get_persistence_worker
+        from processed_journal import ReplayedData, apply_journal
+        if not isinstance(processed, ReplayedData):
+            return
+        get_persistence_worker().flush()
+        # Older entries replay to the values already applied, so this is safe to repeat
+        _, _, processed.journal_seq = apply_journal(self.processed_json_path, processed)
+    
+    def detect_renames_from_data(self, processed: Optional[Dict] = None) -> Dict[str, Tuple[str, int]]:
         """
         Auto-detect difficulty renames by comparing stored names vs current DIFFICULTY_LOOKUP.
         Note: Run backfill_difficulty_ids() first to ensure all hacks have difficulty_id fields.
         
+        Args:
+            processed: Already loaded processed.json contents (read from disk if None)
+        
         Returns:
             Dict mapping old_name -> (new_name, count_of_affected_hacks)
         """
-        if not os.path.exists(self.processed_json_path):
-            return {}
-        
-        try:
-            with open(self.processed_json_path, 'r', encoding='utf-8') as f:
-                processed = json.load(f)
-        except Exception:
-            return {}
+        if processed is None:
+            processed = self._load_processed()
+            if processed is None:
+                return {}
         
         # Track mismatches: old_name -> (new_name, count)
         mismatches: Dict[str, Dict] = {}
@@ -123,22 +249,28 @@ class DifficultyMigrator:
         
         return result
     
-    def backfill_difficulty_ids(self, dry_run: bool = False) -> Dict:
+    def backfill_difficulty_ids(self, dry_run: bool = False, processed: Optional[Dict] = None,
+                                save: bool = True) -> Dict:
         """
         Backfill missing difficulty_id fields for old hacks (pre-v4.8) using their current_difficulty.
         This creates a reverse mapping from difficulty names to difficulty IDs.
         
+        Args:
+            dry_run: If True, only count the hacks that would be backfilled
+            processed: Already loaded processed.json contents, updated in place (read from disk if None)
+            save: Write processed.json when anything was backfilled
+        
         Returns:
             Dictionary with backfill results
         """
-        if not os.path.exists(self.processed_json_path):
-            return {"success": False, "message": "processed.json not found"}
-        
-        try:
-            with open(self.processed_json_path, 'r', encoding='utf-8') as f:
-                processed = json.load(f)
-        except Exception as e:
-            return {"success": False, "message": f"Error reading processed.json: {str(e)}"}
+        if processed is None:
+            if not os.path.exists(self.processed_json_path):
+                return {"success": False, "message": "processed.json not found"}
+            
+            try:
+                processed = load_processed(self.processed_json_path)
+            except Exception as e:
+                return {"success": False, "message": f"Error reading processed.json: {str(e)}"}
         
         # Create reverse mapping: difficulty_name -> difficulty_id
         # Using DIFFICULTY_LOOKUP from utils.py
@@ -178,12 +310,10 @@ class DifficultyMigrator:
                 })
         
         # Save the updated processed.json
-        if not dry_run and backfilled_count > 0:
-            try:
-                with open(self.processed_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(processed, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                return {"success": False, "message": f"Error saving processed.json: {str(e)}"}
+        if save and not dry_run and backfilled_count > 0:
+            save_error = self._save_processed(processed)
+            if save_error:
+                return {"success": False, "message": save_error}
         
         return {
             "success": True,
@@ -204,8 +334,7 @@ class DifficultyMigrator:
             return {"success": False, "message": "processed.json not found"}
         
         try:
-            with open(self.processed_json_path, 'r', encoding='utf-8') as f:
-                processed = json.load(f)
+            processed = load_processed(self.processed_json_path)
         except Exception as e:
             return {"success": False, "message": f"Error reading processed.json: {str(e)}"}
         
@@ -234,11 +363,9 @@ class DifficultyMigrator:
         
         # Save the updated processed.json
         if not dry_run and synced_count > 0:
-            try:
-                with open(self.processed_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(processed, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                return {"success": False, "message": f"Error saving processed.json: {str(e)}"}
+            save_error = self._save_processed(processed)
+            if save_error:
+                return {"success": False, "message": save_error}
         
         return {
             "success": True,
@@ -250,36 +377,40 @@ class DifficultyMigrator:
     def perform_migrations(self, dry_run: bool = False) -> Dict:
         """
         Perform all pending difficulty migrations using auto-detection.
-        First backfills missing difficulty_id fields, then detects and applies renames.
+        First backfills missing difficulty_id fields, then detects renames,
+        plans every folder move and path rewrite, and applies the plan.
+        processed.json is read once and written once.
         
         Args:
             dry_run: If True, only report what would be changed without making changes
+                (the plan summary has exact file and byte counts)
             
         Returns:
             Dictionary with migration results
         """
+        processed = self._load_processed()
+        if processed is None:
+            # Missing or unreadable - let the backfill report why
+            return self._no_migrations(self.backfill_difficulty_ids(dry_run))
+        
+        if dry_run:
+            # Backfill into copies so detection and the plan see what a real run would
+            processed = {hack_id: dict(hack_data) if isinstance(hack_data, dict) else hack_data
+                         for hack_id, hack_data in processed.items()}
+        
         # Step 0: Backfill missing difficulty_id fields for old hacks
-        backfill_result = self.backfill_difficulty_ids(dry_run)
+        backfill_result = self.backfill_difficulty_ids(processed=processed, save=False)
+        backfilled = not dry_run and backfill_result.get("backfilled_count", 0) > 0
         
         # Auto-detect renames from data (now with backfilled difficulty_ids)
-        detected = self.detect_renames_from_data()
+        detected = self.detect_renames_from_data(processed=processed)
         
         if not detected:
-            message_parts = []
-            if backfill_result.get("backfilled_count", 0) > 0:
-                message_parts.append(f"backfilled {backfill_result['backfilled_count']} difficulty_id fields")
-            
-            if message_parts:
-                message = "No migrations needed (" + ", ".join(message_parts) + ")"
-            else:
-                message = "No migrations needed"
-            
-            return {
-                "success": True, 
-                "message": message, 
-                "detected_renames": {},
-                "backfill_result": backfill_result
-            }
+            if backfilled:
+                save_error = self._save_processed(processed)
+                if save_error:
+                    backfill_result = {"success": False, "message": save_error}
+            return self._no_migrations(backfill_result)
         
         # Convert to simple dict for processing
         self.detected_renames = {old: new for old, (new, count) in detected.items()}
@@ -293,22 +424,32 @@ class DifficultyMigrator:
             "backfill_result": backfill_result  # Include backfill info
         }
         
-        # Step 1: Rename folders
+        # Step 1: Plan every folder move up front
+        plan = self.plan_migration(self.detected_renames)
+        results["plan"] = plan.summary()
+        
+        # Step 2: Move folders
         for old_name, new_name in self.detected_renames.items():
-            folder_result = self._migrate_folders(old_name, new_name, dry_run)
+            folder_result = self._migrate_folders(plan, old_name, new_name, dry_run)
             if folder_result:
                 results["migrations"].append(folder_result)
                 self.migrations_performed.append((old_name, new_name))
         
-        # Step 2: Update processed.json
+        # Step 3: Update processed.json (one pass over the records, one write)
         if self.migrations_performed:
-            json_result = self._migrate_processed_json(dry_run)
+            json_result = self._migrate_processed_json(plan, processed, dry_run, backfilled)
             if json_result:
                 results["migrations"].append(json_result)
+        elif backfilled:
+            save_error = self._save_processed(processed)
+            if save_error:
+                results["migrations"].append({"step": "json_update", "error": save_error})
         
-        # Step 3: Create summary
+        # Step 4: Create summary
         results["summary"] = {
             "folders_renamed": self.files_moved,
+            "files_moved": self.files_in_moved_folders,
+            "bytes_moved": self.bytes_moved,
             "json_entries_updated": self.json_entries_updated,
             "renames_applied": len(self.migrations_performed),
             "difficulty_ids_backfilled": backfill_result.get("backfilled_count", 0)
@@ -316,51 +457,87 @@ class DifficultyMigrator:
         
         return results
     
-    def _migrate_folders(self, old_name: str, new_name: str, dry_run: bool) -> Optional[Dict]:
-        """Rename folders from old difficulty name to new name"""
-        if not os.path.exists(self.output_dir):
-            return None
-        
-        old_folder_pattern = self._get_folder_name(old_name)
-        new_folder_pattern = self._get_folder_name(new_name)
+    def _no_migrations(self, backfill_result: Dict) -> Dict:
+        """Result for a run where no renames were detected"""
+        message_parts = []
+        if backfill_result.get("backfilled_count", 0) > 0:
+            message_parts.append(f"backfilled {backfill_result['backfilled_count']} difficulty_id fields")
+        
+        if message_parts:
+            message = "No migrations needed (" + ", ".join(message_parts) + ")"
+        else:
+            message = "No migrations needed"
         
+        return {
+            "success": True, 
+            "message": message, 
+            "detected_renames": {},
+            "backfill_result": backfill_result
+        }
+    
+    def plan_migration(self, renames: Dict[str, str]) -> MigrationPlan:
+        """Build the complete set of folder moves for renames (old name -> new name)"""
+        folder_map = {self._get_folder_name(old): self._get_folder_name(new) for old, new in renames.items()}
+        plan = MigrationPlan(renames, folder_map)
+        if not os.path.isdir(self.output_dir):
+            return plan
+        
+        # Only the top-level type folders (Standard, Kaizo, Pit, Tool-Assisted) hold difficulty folders
+        type_folders = sorted(entry.name for entry in os.scandir(self.output_dir) if entry.is_dir())
+        for old_name, new_name in renames.items():
+            old_folder = self._get_folder_name(old_name)
+            new_folder = self._get_folder_name(new_name)
+            for type_folder in type_folders:
+                type_path = os.path.join(self.output_dir, type_folder)
+                old_path = os.path.join(type_path, old_folder)
+                new_path = os.path.join(type_path, new_folder)
+                if not os.path.isdir(old_path):
+                    continue
+                
+                folder = {"type": type_folder, "old": old_path, "new": new_path,
+                          "old_name": old_name, "new_name": new_name}
+                if not os.path.exists(new_path):
+                    folder["files"], folder["bytes"] = _count_tree(old_path)
+                    plan.directory_moves.append(folder)
+                    continue
+                
+                # Destination exists: merge the files (subfolders stay where they are)
+                moves = []
+                for entry in os.scandir(old_path):
+                    if entry.is_file(follow_symlinks=False):
+                        destination = os.path.join(new_path, entry.name)
+                        moves.append((entry.path, destination, entry.stat(follow_symlinks=False).st_size,
+                                      os.path.exists(destination)))
+                folder["moves"] = moves
+                folder["files"] = len(moves)
+                folder["bytes"] = sum(move[2] for move in moves)
+                plan.merges.append(folder)
+        return plan
+    
+    def _migrate_folders(self, plan: MigrationPlan, old_name: str, new_name: str, dry_run: bool) -> Optional[Dict]:
+        """Apply the planned folder moves for one rename"""
+        folders = [folder for folder in plan.folders if folder["old_name"] == old_name]
         folders_renamed = []
         
-        # Check all hack type folders (Standard, Kaizo, Pit, Tool-Assisted)
-        for root, dirs, files in os.walk(self.output_dir):
-            # Only process top-level type folders
-            if root == self.output_dir:
-                for type_folder in dirs:
-                    type_path = os.path.join(self.output_dir, type_folder)
-                    old_path = os.path.join(type_path, old_folder_pattern)
-                    new_path = os.path.join(type_path, new_folder_pattern)
-                    
-                    if os.path.exists(old_path):
-                        if dry_run:
-                            folders_renamed.append({
-                                "type": type_folder,
-                                "old": old_path,
-                                "new": new_path
-                            })
-                        else:
-                            try:
-                                # If new path already exists, merge folders
-                                if os.path.exists(new_path):
-                                    self._merge_folders(old_path, new_path)
-                                else:
-                                    os.rename(old_path, new_path)
-                                
-                                folders_renamed.append({
-                                    "type": type_folder,
-                                    "old": old_path,
-                                    "new": new_path
-                                })
-                                self.files_moved += 1
-                            except Exception as e:
-                                return {
-                                    "step": "folder_rename",
-                                    "error": f"Failed to rename {old_path}: {str(e)}"
-                                }
+        for folder in folders:
+            entry = {"type": folder["type"], "old": folder["old"], "new": folder["new"],
+                     "files": folder["files"], "bytes": folder["bytes"]}
+            if not dry_run:
+                try:
+                    if "moves" in folder:
+                        self._merge_folders(folder["old"], folder["moves"])
+                    else:
+                        # Whole folder in one rename
+                        os.replace(folder["old"], folder["new"])
+                    self.files_moved += 1
+                    self.files_in_moved_folders += folder["files"]
+                    self.bytes_moved += folder["bytes"]
+                except Exception as e:
+                    return {
+                        "step": "folder_rename",
+                        "error": f"Failed to rename {folder['old']}: {str(e)}"
+                    }
+            folders_renamed.append(entry)
         
         if folders_renamed:
             return {
@@ -372,41 +549,36 @@ class DifficultyMigrator:
         
         return None
     
-    def _merge_folders(self, source: str, destination: str):
-        """Merge source folder into destination, moving all files"""
-        for item in os.listdir(source):
-            source_item = os.path.join(source, item)
-            dest_item = os.path.join(destination, item)
-            
-            if os.path.isfile(source_item):
-                # Move file, overwrite if exists
+    def _merge_folders(self, source: str, moves: List[Tuple[str, str, int, bool]]):
+        """Merge source folder into its destination by moving the planned files in parallel"""
+        def move(planned):
+            source_item, dest_item = planned[0], planned[1]
+            try:
+                # Same parent folder tree, so this is a rename that overwrites
+                os.replace(source_item, dest_item)
+            except OSError:
                 if os.path.exists(dest_item):
                     os.remove(dest_item)
                 shutil.move(source_item, dest_item)
         
+        if moves:
+            with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(moves))) as executor:
+                # list() re-raises the first failed move
+                list(executor.map(move, moves))
+        
         # Remove empty source folder
         try:
             os.rmdir(source)
         except OSError:
             pass  # Folder not empty, that's fine
     
-    def _migrate_processed_json(self, dry_run: bool) -> Optional[Dict]:
-        """Update all difficulty references in processed.json"""
-        if not os.path.exists(self.processed_json_path):
-            return None
-        
-        try:
-            with open(self.processed_json_path, 'r', encoding='utf-8') as f:
-                processed = json.load(f)
-        except Exception as e:
-            return {"step": "json_update", "error": f"Failed to load JSON: {str(e)}"}
+    def _migrate_processed_json(self, plan: MigrationPlan, processed: Dict, dry_run: bool,
+                                backfilled: bool = False) -> Optional[Dict]:
+        """Update all difficulty references in processed.json in one pass"""
+        renames = plan.renames
         
-        # Create backup before modifying
         if not dry_run:
-            backup_path = f"{self.processed_json_path}.difficulty-migration-{datetime.now().strftime('%Y%m%d_%H%M%S')}.backup"
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(processed, f, indent=2)
-        
+            self._replay_new_journal_entries(processed)
         entries_updated = []
         
         # Update all hack entries
@@ -416,69 +588,34 @@ class DifficultyMigrator:
             
             updated_fields = {}
             
-            # Update current_difficulty field
-            if "current_difficulty" in hack_data:
-                old_diff = hack_data["current_difficulty"]
-                if old_diff in self.detected_renames:
-                    new_diff = self.detected_renames[old_diff]
-                    updated_fields["current_difficulty"] = (old_diff, new_diff)
-                    if not dry_run:
-                        hack_data["current_difficulty"] = new_diff
-            
-            # Update difficulty field (legacy/display field - must stay in sync with current_difficulty)
-            if "difficulty" in hack_data:
-                old_diff = hack_data["difficulty"]
-                if old_diff in self.detected_renames:
-                    new_diff = self.detected_renames[old_diff]
-                    updated_fields["difficulty"] = (old_diff, new_diff)
+            # Update current_difficulty and the legacy/display difficulty field (must stay in sync)
+            for field in ("current_difficulty", "difficulty"):
+                old_diff = hack_data.get(field)
+                if isinstance(old_diff, str) and old_diff in renames:
+                    updated_fields[field] = (old_diff, renames[old_diff])
                     if not dry_run:
-                        hack_data["difficulty"] = new_diff
+                        hack_data[field] = renames[old_diff]
             
             # Update folder_name field
-            if "folder_name" in hack_data:
-                old_folder = hack_data["folder_name"]
-                # Check if folder contains old difficulty name
-                for old_name, new_name in self.detected_renames.items():
-                    old_pattern = self._get_folder_name(old_name)
-                    if old_folder == old_pattern:
-                        new_pattern = self._get_folder_name(new_name)
-                        updated_fields["folder_name"] = (old_folder, new_pattern)
-                        if not dry_run:
-                            hack_data["folder_name"] = new_pattern
+            old_folder = hack_data.get("folder_name")
+            if isinstance(old_folder, str) and old_folder in plan.folder_map:
+                updated_fields["folder_name"] = (old_folder, plan.folder_map[old_folder])
+                if not dry_run:
+                    hack_data["folder_name"] = plan.folder_map[old_folder]
             
             # Update file_path field
             if "file_path" in hack_data:
                 old_path = hack_data["file_path"]
-                new_path = old_path
-                for old_name, new_name in self.detected_renames.items():
-                    old_pattern = self._get_folder_name(old_name)
-                    new_pattern = self._get_folder_name(new_name)
-                    if old_pattern in old_path:
-                        new_path = old_path.replace(old_pattern, new_pattern)
-                        break
-                
+                new_path = plan.rewrite_path(old_path)
                 if new_path != old_path:
                     updated_fields["file_path"] = (old_path, new_path)
                     if not dry_run:
                         hack_data["file_path"] = new_path
             
             # Update additional_paths field
-            if "additional_paths" in hack_data and isinstance(hack_data["additional_paths"], list):
-                new_additional_paths = []
-                paths_changed = False
-                
-                for old_path in hack_data["additional_paths"]:
-                    new_path = old_path
-                    for old_name, new_name in self.detected_renames.items():
-                        old_pattern = self._get_folder_name(old_name)
-                        new_pattern = self._get_folder_name(new_name)
-                        if old_pattern in old_path:
-                            new_path = old_path.replace(old_pattern, new_pattern)
-                            paths_changed = True
-                            break
-                    new_additional_paths.append(new_path)
-                
-                if paths_changed:
+            if isinstance(hack_data.get("additional_paths"), list):
+                new_additional_paths = [plan.rewrite_path(path) for path in hack_data["additional_paths"]]
+                if new_additional_paths != hack_data["additional_paths"]:
                     updated_fields["additional_paths"] = (
                         len(hack_data["additional_paths"]),
                         "paths updated"
@@ -486,6 +623,15 @@ class DifficultyMigrator:
                     if not dry_run:
                         hack_data["additional_paths"] = new_additional_paths
             
+            # Update multi-file paths
+            if isinstance(hack_data.get("files"), list):
+                new_files = [dict(f, path=plan.rewrite_path(f["path"])) if isinstance(f, dict) and "path" in f else f
+                             for f in hack_data["files"]]
+                if new_files != hack_data["files"]:
+                    updated_fields["files"] = (len(hack_data["files"]), "paths updated")
+                    if not dry_run:
+                        hack_data["files"] = new_files
+            
             if updated_fields:
                 entries_updated.append({
                     "hack_id": hack_id,
@@ -494,13 +640,16 @@ class DifficultyMigrator:
                 })
                 self.json_entries_updated += 1
         
-        # Save updated JSON
-        if not dry_run and entries_updated:
+        # Save updated JSON (with the backfilled difficulty_ids), after a backup
+        if not dry_run and (entries_updated or backfilled):
             try:
-                with open(self.processed_json_path, 'w', encoding='utf-8') as f:
-                    json.dump(processed, f, indent=2)
-            except Exception as e:
-                return {"step": "json_update", "error": f"Failed to save JSON: {str(e)}"}
+                backup_path = f"{self.processed_json_path}.difficulty-migration-{datetime.now().strftime('%Y%m%d_%H%M%S')}.backup"
+                shutil.copyfile(self.processed_json_path, backup_path)
+            except OSError as e:
+                return {"step": "json_update", "error": f"Failed to back up JSON: {str(e)}"}
+            save_error = self._save_processed(processed)
+            if save_error:
+                return {"step": "json_update", "error": save_error}
         
         if entries_updated:
             return {
@@ -554,6 +703,11 @@ def run_difficulty_migration(output_dir: str, dry_run: bool = False, log_func=No
                 elif migration["step"] == "json_update":
                     log_func(f"  📝 Updated {migration['entries_updated']} hack entries in processed.json", "Information")
             
+            plan = results.get("plan")
+            if plan:
+                log_func(f"  📦 {plan['folders']} folder(s): {plan['directory_renames']} renamed whole, "
+                         f"{plan['merges']} merged ({plan['files']:,} files, {plan['bytes'] / (1024 * 1024):.1f} MB)", "Information")
+            
             summary = results.get("summary", {})
             log_func(f"  📊 Summary: {summary.get('folders_renamed', 0)} folders, {summary.get('json_entries_updated', 0)} JSON entries", "Information")
         else:
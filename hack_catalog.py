@@ -0,0 +1,207 @@
+"""
+Hack Catalog
+Local snapshot of the SMWC hack listings, shared by migration and backfill
+
+Walking every listing page of the moderated and waiting sections takes
+minutes. The catalog keeps the fields those jobs need (release time,
+authors, exits, flags...) for every listed hack in catalog.json and only
+goes back to the API when the snapshot is stale: a delta sync pages the
+moderated section newest-first until it reaches hacks it already knows, and
+a full crawl only happens when the snapshot is missing or older than
+FULL_SYNC_SECONDS. Callers join it to processed.json by hack id in memory.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import json
+import threading
+import time
+
+from utils import get_user_data_path
+
+CATALOG_PATH = get_user_data_path("catalog.json")
+CATALOG_FORMAT = 1
+
+# A snapshot newer than this is used as-is; older ones get a delta sync
+FRESH_SECONDS = 3600
+# Snapshots older than this are re-crawled in full (picks up edited metadata)
+FULL_SYNC_SECONDS = 7 * 24 * 3600
+# Delta syncs re-read this much before the newest known release, so hacks
+# moderated slightly out of order are not missed
+DELTA_OVERLAP_SECONDS = 7 * 24 * 3600
+PAGE_DELAY_SECONDS = 0.5
+
+_shared_catalog = None
+_shared_lock = threading.Lock()
+
+
+def get_hack_catalog():
+    """Get the process-wide catalog (loaded from disk on first use)"""
+    global _shared_catalog
+    with _shared_lock:
+        if _shared_catalog is None:
+            _shared_catalog = HackCatalog()
+        return _shared_catalog
+
+
+def catalog_entry(hack, section):
+    """Keep the listing fields migration and backfill use"""
+    raw_fields = hack.get("raw_fields", {}) or {}
+    return {
+        "name": hack.get("name", ""),
+        "time": hack.get("time", 0),
+        "downloads": hack.get("downloads", 0),
+        "rating": hack.get("rating", 0),
+        "authors": hack.get("authors", []),
+        "raw_fields": {field: raw_fields.get(field, 0) for field in ("hof", "sa1", "collab", "demo", "length")},
+        "section": section,
+    }
+
+
+class HackCatalog:
+    """hack_id -> listing entry, persisted in catalog.json"""
+
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        self.hacks = {}
+        self.synced_at = 0
+        self.full_synced_at = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(snapshot, dict) or snapshot.get("format") != CATALOG_FORMAT:
+            return  # Unknown layout - the next sync rebuilds it
+        self.hacks = snapshot.get("hacks", {})
+        self.synced_at = snapshot.get("synced_at", 0)
+        self.full_synced_at = snapshot.get("full_synced_at", 0)
+
+    def _save(self):
+        from processed_journal import write_json_atomic
+        write_json_atomic(self.path, {
+            "format": CATALOG_FORMAT,
+            "synced_at": self.synced_at,
+            "full_synced_at": self.full_synced_at,
+            "hacks": self.hacks,
+        }, indent=None)
+
+    def __len__(self):
+        return len(self.hacks)
+
+    def get(self, hack_id):
+        return self.hacks.get(str(hack_id))
+
+    def age(self):
+        """Seconds since the last sync (inf if never synced)"""
+        return time.time() - self.synced_at if self.synced_at else float("inf")
+
+    def is_fresh(self, max_age=FRESH_SECONDS):
+        return self.age() < max_age
+
+    def sync(self, log=None, cancel_check=None, metrics=None, max_age=FRESH_SECONDS):
+        """Bring the snapshot up to date if it is older than max_age
+
+        Returns True when the catalog is usable, False if cancelled (the
+        snapshot on disk is left as it was).
+        """
+        with self._lock:
+            if self.is_fresh(max_age):
+                if log:
+                    log(f"📚 Using local hack catalog ({len(self.hacks)} hacks, synced {int(self.age() // 60)} min ago)")
+                return True
+
+            full = not self.hacks or time.time() - self.full_synced_at >= FULL_SYNC_SECONDS
+            started = time.time()
+            if full:
+                if log:
+                    log("🌐 Building local hack catalog from SMWC (full sync)...")
+                hacks = {}
+                newest = None
+            else:
+                if log:
+                    log(f"🌐 Updating local hack catalog ({len(self.hacks)} hacks known)...")
+                # Moderated entries carry over; the waiting section is small and re-read whole
+                hacks = {hack_id: entry for hack_id, entry in self.hacks.items() if entry.get("section") != "waiting"}
+                newest = max((_to_int(entry.get("time")) for entry in hacks.values()), default=0)
+            previous_waiting = {hack_id: entry for hack_id, entry in self.hacks.items()
+                                if entry.get("section") == "waiting"}
+
+            for waiting_mode in (False, True):
+                section = "waiting" if waiting_mode else "moderated"
+                stop_before = newest - DELTA_OVERLAP_SECONDS if newest and not waiting_mode else None
+                fetched = self._fetch_section(hacks, waiting_mode, stop_before, log, cancel_check, metrics)
+                if fetched is None:
+                    if log:
+                        log("⚠️ Catalog sync cancelled by user")
+                    return False
+                if log:
+                    log(f"📄 {section.title()}: {fetched} listings read")
+
+            # A hack accepted from the queue keeps its (submission) time, which can
+            # be older than the delta window, so it may show up in neither read.
+            # Keep its waiting entry until it is seen again or a full crawl runs.
+            for hack_id, entry in previous_waiting.items():
+                hacks.setdefault(hack_id, entry)
+
+            self.hacks = hacks
+            self.synced_at = started
+            if full:
+                self.full_synced_at = started
+            self._save()
+            if log:
+                log(f"🎯 Hack catalog has {len(self.hacks)} hacks")
+            return True
+
+    def _fetch_section(self, hacks, waiting_mode, stop_before, log, cancel_check, metrics):
+        """Read listing pages into hacks; returns the listings read, or None if cancelled
+
+        With stop_before, pages are read newest-first and reading stops after
+        the first page whose hacks are all older than stop_before.
+        """
+        from api_pipeline import fetch_hack_list
+
+        section = "waiting" if waiting_mode else "moderated"
+        config = {"order": "date"} if stop_before is not None else {}  # Empty config = no filters
+        page = 1
+        fetched = 0
+        while True:
+            # Safe point - nothing is replaced until the sync completes
+            if cancel_check and cancel_check():
+                return None
+
+            response = fetch_hack_list(config, page=page, waiting_mode=waiting_mode)
+            if not response or not response.get("data"):
+                break
+
+            page_hacks = response["data"]
+            for hack in page_hacks:
+                hack_id = str(hack.get("id", ""))
+                if hack_id:
+                    hacks[hack_id] = catalog_entry(hack, section)
+            fetched += len(page_hacks)
+
+            if page >= response.get("last_page", 1):
+                break
+            if stop_before is not None and all(_to_int(hack.get("time")) < stop_before for hack in page_hacks):
+                break
+
+            page += 1
+            if metrics is not None:
+                with metrics.stage("rate_limit_wait"):
+                    time.sleep(PAGE_DELAY_SECONDS)
+            else:
+                time.sleep(PAGE_DELAY_SECONDS)
+        return fetched
+
+
+def _to_int(value):
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
@@ -1,14 +1,130 @@
+import copy
 import json
 import os
-import shutil
+import sys
 import threading
 from datetime import datetime
 
+from persistence_worker import get_persistence_worker
+from processed_journal import (
+    append_journal, apply_journal, discard_journal, rotate_backup, superseded_seq, write_json_atomic
+)
+from record_normalization import AuthorTable, normalize_authors, normalize_record
+
+# Process-wide store shared by every page (see get_hack_data_manager)
+_shared_manager = None
+_shared_lock = threading.Lock()
+
+# Background loads publish this many records first so the UI can paint early
+FIRST_PAINT_RECORDS = 500
+_READ_CHUNK_SIZE = 1 << 16
+
+
+def _iter_json_object_items(f, chunk_size=_READ_CHUNK_SIZE):
+    """Yield (key, value) pairs of the top-level JSON object in file f
+
+    Reads in chunks and decodes one value at a time, so the first records are
+    available long before a large file has been read or parsed.
+    """
+    decoder = json.JSONDecoder()
+    whitespace = json.decoder.WHITESPACE
+    buf, pos, eof = "", 0, False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def next_char():
+        nonlocal pos
+        while True:
+            pos = whitespace.match(buf, pos).end()
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                raise ValueError("Unexpected end of processed.json")
+
+    def decode():
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not fill():
+                    raise
+                continue
+            # A value ending exactly at the buffer end might be cut short (e.g. a number)
+            if end == len(buf) and not eof and fill():
+                continue
+            pos = end
+            return value
+
+    if next_char() != "{":
+        raise ValueError("processed.json is not a JSON object")
+    pos += 1
+    if next_char() == "}":
+        return
+    while True:
+        if next_char() != '"':
+            raise ValueError("Expected a key in processed.json")
+        key = decode()
+        if next_char() != ":":
+            raise ValueError("Expected ':' in processed.json")
+        pos += 1
+        next_char()
+        yield key, decode()
+        separator = next_char()
+        pos += 1
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError("Expected ',' in processed.json")
+
+
+def get_hack_data_manager(logger=None):
+    """Get the shared HackDataManager for processed.json
+
+    All pages use this one instance so the library is parsed and held in memory
+    once. Subscribe to it for record-level change events instead of re-reading
+    the file. It also follows utils.save_processed so pipeline writes show up
+    without a reload. It loads in the background: check .loaded, and follow
+    the "loading"/"loaded" events.
+    """
+    global _shared_manager
+    with _shared_lock:
+        if _shared_manager is None:
+            _shared_manager = HackDataManager(logger=logger, background=True)
+            _shared_manager.follow_processed_saves()
+        elif logger is not None and _shared_manager.logger is None:
+            _shared_manager.logger = logger
+        return _shared_manager
+
 
 class HackDataManager:
-    """Manages hack data from processed.json with collection tracking"""
+    """Manages hack data from processed.json with collection tracking
 
-    def __init__(self, json_path=None, logger=None):
+    Field edits are saved by appending the edited fields of dirty records to
+    processed.json.journal (see processed_journal); processed.json itself is
+    only rewritten when records are added or deleted, or once the journal
+    reaches JOURNAL_COMPACT_ENTRIES.
+    """
+
+    # Fold the journal into processed.json once it holds this many entries
+    JOURNAL_COMPACT_ENTRIES = 500
+
+    def __init__(self, json_path=None, logger=None, background=False):
+        """
+        Args:
+            background (bool): Stream processed.json on a worker thread. data
+                starts empty, gets the first FIRST_PAINT_RECORDS records
+                ("loading" event) and then all of them ("loaded" event).
+                Saves, adds, deletes and syncs wait for the load to finish.
+        """
         # If no path specified, use the same path resolution as download operations
         if json_path is None:
             from utils import PROCESSED_JSON_PATH
@@ -16,117 +132,524 @@ class HackDataManager:
         
         self.json_path = json_path
         self.logger = logger
-        self.data = self._load_data()
+        self._journal_fields = {}  # hack_id -> field -> (seq, value) journaled since the last rewrite
+        self._journal_entries = 0
+        self._disk_signature = None  # Stat of processed.json when last read or written
+        self.loaded = not background
+        self._loaded_event = threading.Event()
+        self.data = {} if background else self._load_data()
         self.unsaved_changes = False
         self.last_save_time = 0
         self.save_delay = 2.0  # Wait 2 seconds before auto-saving
-        self._save_timer = None
+        # Saves run on the shared persistence worker under this key
+        self._save_key = ("hack-data", os.path.abspath(json_path))
+        self._listeners = []
+        self._dirty_fields = {}  # hack_id -> fields edited here but not saved yet
+        self._full_save_needed = False  # Records added/removed since the last rewrite
+        self._save_lock = threading.Lock()
+        # Materialized get_all_hacks views, stamped with data_version
+        self.data_version = 0
+        self._record_views = {}
+        self._view_cache = {}
+        self._author_table = None  # Built on first use, then patched by _invalidate
+
+        if background:
+            threading.Thread(target=self._load_in_background, name="hack-data-load", daemon=True).start()
+        else:
+            self._loaded_event.set()
+
+    def wait_until_loaded(self, timeout=None):
+        """Block until a background load has finished; returns False on timeout"""
+        return self._loaded_event.wait(timeout)
+
+    def _load_in_background(self):
+        """Stream processed.json, publishing the first records early (worker thread)"""
+        data = {}
+        try:
+            get_persistence_worker().flush()
+            self._disk_signature = self._stat_signature()
+            with open(self.json_path, "r", encoding="utf-8") as f:
+                for hack_id, hack_data in _iter_json_object_items(f):
+                    if isinstance(hack_data, dict):
+                        self._apply_defaults(hack_data)
+                    data[hack_id] = hack_data
+                    if len(data) == FIRST_PAINT_RECORDS:
+                        # Publish a copy - readers may iterate it while we keep adding
+                        self.data = dict(data)
+                        self._invalidate()
+                        self._notify("loading", list(data))
+            self._journal_fields, self._journal_entries, _ = apply_journal(self.json_path, data)
+            # Same order as _load_data: replayed journal values get the defaults/normalization too
+            for hack_id in self._journal_fields:
+                self._apply_defaults(data[hack_id])
+        except FileNotFoundError:
+            data = {}
+        except Exception as e:
+            self._log(f"❌ Failed to load hack data: {e}", "Error")
+            data = {}
+
+        self.data = data
+        self._invalidate()
+        self.loaded = True
+        self._loaded_event.set()
+        self._log(f"📚 Loaded {len(data)} hacks from {self.json_path}", "Debug")
+        self._notify("loaded", list(data))
 
     def _log(self, message, level="Information"):
         """Helper method to log messages if logger is available"""
         if self.logger:
             self.logger.log(message, level)
         # Fall back to print for backward compatibility during transition
+        # (stderr, so tools that write JSON to stdout stay parseable)
         else:
-            print(f"[{level}] {message}")
+            print(f"[{level}] {message}", file=sys.stderr)
+
+    @staticmethod
+    def _apply_defaults(hack_data):
+        """Ensure an entry has the v3.0, v3.1 and v4.0 fields, with interned strings"""
+        # v3.0 fields
+        hack_data.setdefault("completed", False)
+        hack_data.setdefault("completed_date", "")
+        hack_data.setdefault("personal_rating", 0)
+        hack_data.setdefault("notes", "")
+        # v3.1 NEW fields
+        hack_data.setdefault("time_to_beat", 0)
+        hack_data.setdefault("exits", 0)
+        hack_data.setdefault("authors", [])
+        # v4.0 NEW fields
+        hack_data.setdefault("obsolete", False)
+        return normalize_record(hack_data)
 
     def _load_data(self):
-        """Load data from processed.json"""
+        """Load data from processed.json plus any journaled edits"""
+        # Let queued writes (ours and the pipeline's) land first
+        get_persistence_worker().flush()
+        # Stat before reading, so a write racing the read shows up as a change next time
+        self._disk_signature = self._stat_signature()
         try:
             with open(self.json_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                # Ensure all entries have the v3.0 and v3.1 fields
-                for hack_id, hack_data in data.items():
-                    if isinstance(hack_data, dict):
-                        # v3.0 fields
-                        hack_data.setdefault("completed", False)
-                        hack_data.setdefault("completed_date", "")
-                        hack_data.setdefault("personal_rating", 0)
-                        hack_data.setdefault("notes", "")
-                        # v3.1 NEW fields
-                        hack_data.setdefault("time_to_beat", 0)
-                        hack_data.setdefault("exits", 0)
-                        hack_data.setdefault("authors", [])
-                        # v4.0 NEW fields
-                        hack_data.setdefault("obsolete", False)
-                return data
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
+        self._journal_fields, self._journal_entries, _ = apply_journal(self.json_path, data)
+        # Ensure all entries have the v3.0 and v3.1 fields
+        for hack_id, hack_data in data.items():
+            if isinstance(hack_data, dict):
+                self._apply_defaults(hack_data)
+        return data
+
+    def _stat_signature(self):
+        """(mtime_ns, size, inode) of processed.json, or None if it doesn't exist"""
+        try:
+            st = os.stat(self.json_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def reload_data(self, force=False):
+        """Reload data from processed.json (useful when external processes modify the file)
 
-    def reload_data(self):
-        """Reload data from processed.json (useful when external processes modify the file)"""
-        self.data = self._load_data()
-        self._log(f"🔄 Reloaded {len(self.data)} hacks from disk", "Information")
+        Skipped when the file's stat signature matches the last read/write.
+        Otherwise only records that differ from memory are replaced, so
+        unchanged records keep their cached views.
+
+        Args:
+            force (bool): Re-read even if the file looks unchanged
+        """
+        # Let queued writes land before comparing
+        self.wait_until_loaded()
+        get_persistence_worker().flush()
+        if not force and self._disk_signature is not None and self._stat_signature() == self._disk_signature:
+            self._log("🔄 processed.json unchanged on disk - skipping reload", "Debug")
+            return True
+
+        old_data = self.data
+        loaded = self._load_data()
+        new_data = {}
+        changed = []
+        for hack_id, entry in loaded.items():
+            old_entry = old_data.get(hack_id)
+            if old_entry is not None and old_entry == entry:
+                new_data[hack_id] = old_entry
+            else:
+                new_data[hack_id] = entry
+                changed.append(hack_id)
+        changed.extend(hack_id for hack_id in old_data if hack_id not in loaded)
+
+        self.data = new_data
+        self._dirty_fields = {}
+        if changed:
+            self._invalidate(changed)
+        self._log(f"🔄 Reloaded {len(self.data)} hacks from disk ({len(changed)} changed)", "Information")
+        if changed:
+            self._notify("reloaded", changed)
         return True
 
-    def save_data(self):
-        """Save data back to processed.json with validation"""
+    def subscribe(self, callback):
+        """Register a callback(event, hack_ids) for record changes
+
+        Events: "updated", "added", "deleted", "reloaded" (re-read from disk),
+        "synced" (picked up from a save_processed call) and, for background
+        loads, "loading" (first records available) and "loaded". Callbacks may
+        run on a worker thread - UI code must marshal to the Tk thread itself.
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        """Unregister a change callback"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, hack_ids):
+        for callback in self._listeners.copy():
+            try:
+                callback(event, list(hack_ids))
+            except Exception as e:
+                self._log(f"❌ Error in hack data listener: {e}", "Error")
+
+    def follow_processed_saves(self):
+        """Keep this store in sync with data written through utils.save_processed"""
+        from utils import register_processed_save_listener
+        register_processed_save_listener(self._on_processed_saved)
+
+    def _on_processed_saved(self, path, data, changed_ids=None):
+        """Merge records saved by the download pipeline (runs on the saving thread)
+
+        With changed_ids only those records are compared; otherwise the whole
+        library is.
+        """
         try:
-            # Validate we have data to save
-            if not self.data:
-                self._log("⚠️ Attempting to save empty data - operation cancelled", "Error")
-                return False
+            if os.path.normcase(os.path.abspath(path)) != os.path.normcase(os.path.abspath(self.json_path)):
+                return
+            self.wait_until_loaded()
+            # The write drops the journal entries data already held - so do we
+            self._supersede_journal_fields(superseded_seq(data))
+            if changed_ids is not None:
+                self._merge_saved_records(data, [str(hack_id) for hack_id in changed_ids])
+                return
+
+            old_data = self.data
+            new_data = {}
+            changed = []
+            for hack_id, hack_data in data.items():
+                old_entry = old_data.get(hack_id)
+                if hack_id in self._dirty_fields and old_entry is not None:
+                    # Keep edits that haven't been saved yet
+                    new_data[hack_id] = old_entry
+                    continue
+                journaled = self._journaled_values(hack_id)
+                if journaled and isinstance(hack_data, dict):
+                    # Newer journaled edits win, as they do when the file is read back
+                    hack_data = {**hack_data, **journaled}
+                if old_entry == hack_data:
+                    new_data[hack_id] = old_entry
+                    continue
+                entry = self._saved_entry(hack_data)
+                new_data[hack_id] = entry
+                if entry != old_entry:
+                    changed.append(hack_id)
+            for hack_id in old_data:
+                if hack_id not in new_data:
+                    if hack_id in self._dirty_fields:
+                        new_data[hack_id] = old_data[hack_id]
+                    else:
+                        changed.append(hack_id)
+
+            # Swap in one assignment so readers never see a half-merged dict
+            self.data = new_data
+            if changed:
+                self._invalidate(changed)
+                self._notify("synced", changed)
+        except Exception as e:
+            self._log(f"❌ Error syncing hack data: {e}", "Error")
+
+    def _supersede_journal_fields(self, seq):
+        """Forget journaled fields up to seq, as supersede_journal does on disk"""
+        with self._save_lock:
+            journal_fields = {}
+            for hack_id, fields in self._journal_fields.items():
+                kept = {field: value for field, value in fields.items() if value[0] > seq}
+                if kept:
+                    journal_fields[hack_id] = kept
+            self._journal_fields = journal_fields
+
+    def _journaled_values(self, hack_id):
+        """{field: value} of the journaled edits still overriding hack_id's saved record"""
+        return {field: value for field, (_seq, value) in self._journal_fields.get(hack_id, {}).items()}
+
+    def _saved_entry(self, hack_data):
+        """Our own copy of a saved record, so later pipeline mutations (nested lists included) don't leak in unannounced"""
+        return self._apply_defaults(copy.deepcopy(hack_data)) if isinstance(hack_data, dict) else hack_data
+
+    def _merge_saved_records(self, data, hack_ids):
+        """Merge just hack_ids from saved data"""
+        old_data = self.data
+        updates = {}
+        removed = []
+        for hack_id in hack_ids:
+            if hack_id in self._dirty_fields and hack_id in old_data:
+                continue  # Keep edits that haven't been saved yet
+            if hack_id not in data:
+                if hack_id in old_data:
+                    removed.append(hack_id)
+                continue
+            hack_data = data[hack_id]
+            journaled = self._journaled_values(hack_id)
+            if journaled and isinstance(hack_data, dict):
+                hack_data = {**hack_data, **journaled}
+            if old_data.get(hack_id) != hack_data:
+                updates[hack_id] = self._saved_entry(hack_data)
+        if not updates and not removed:
+            return
+
+        if removed or any(hack_id not in old_data for hack_id in updates):
+            # Keys change: swap in a new dict so readers never iterate a resizing one
+            new_data = dict(old_data)
+            new_data.update(updates)
+            for hack_id in removed:
+                del new_data[hack_id]
+            self.data = new_data
+        else:
+            # Replacing values of existing keys is safe for concurrent readers
+            for hack_id, entry in updates.items():
+                old_data[hack_id] = entry
+        changed = list(updates) + removed
+        self._invalidate(changed)
+        self._notify("synced", changed)
 
-            # Create backup of current file before saving
-            if os.path.exists(self.json_path):
-                backup_path = f"{self.json_path}.backup"
-                shutil.copy2(self.json_path, backup_path)
+    def save_data(self):
+        """Persist pending changes with validation
 
-            with open(self.json_path, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2)
-            self._log(f"💾 Saved {len(self.data)} hack records to {self.json_path}", "Information")
-            return True
+        Field edits are appended to the journal, so the cost depends on how
+        many records changed rather than on the library size. Added/deleted
+        records and a full journal rewrite processed.json instead.
+        """
+        # Never save a partially loaded library
+        self.wait_until_loaded()
+        with self._save_lock:
+            try:
+                # Validate we have data to save
+                if not self.data:
+                    self._log("⚠️ Attempting to save empty data - operation cancelled", "Error")
+                    return False
+
+                if self._full_save_needed or self._journal_entries >= self.JOURNAL_COMPACT_ENTRIES:
+                    return self._rewrite_file()
+
+                dirty, self._dirty_fields = self._dirty_fields, {}
+                records = {}
+                for hack_id, fields in dirty.items():
+                    entry = self.data.get(hack_id)
+                    if isinstance(entry, dict):
+                        records[hack_id] = {field: entry.get(field) for field in fields}
+                try:
+                    seq = append_journal(self.json_path, records)
+                except Exception:
+                    # Not written - keep the edits pending for the next save
+                    for hack_id, fields in dirty.items():
+                        self._dirty_fields.setdefault(hack_id, set()).update(fields)
+                    raise
+                for hack_id, fields in records.items():
+                    journaled = self._journal_fields.setdefault(hack_id, {})
+                    for field, value in fields.items():
+                        journaled[field] = (seq, value)
+                self._journal_entries += len(records)
+                self._log(f"💾 Journaled {len(records)} edited hack record(s) to {self.json_path}", "Information")
+                return True
+            except Exception as e:
+                self._log(f"❌ Failed to save hack data: {e}", "Error")
+                return False
+
+    def _rewrite_file(self):
+        """Write all records to processed.json and fold the journal in (caller holds _save_lock)"""
+        try:
+            backup_path = rotate_backup(self.json_path)
+            if backup_path:
+                self._log(f"🗄️ Backed up hack data to {backup_path}", "Debug")
         except Exception as e:
-            self._log(f"❌ Failed to save hack data: {e}", "Error")
-            return False
+            # A failed backup shouldn't block saving the user's changes
+            self._log(f"⚠️ Could not back up hack data: {e}", "Warning")
+
+        dirty, self._dirty_fields = self._dirty_fields, {}
+        try:
+            write_json_atomic(self.json_path, self.data)
+        except Exception:
+            self._dirty_fields = {**dirty, **self._dirty_fields}
+            raise
+        # Our own write - don't treat it as an external change on the next reload
+        self._disk_signature = self._stat_signature()
+        discard_journal(self.json_path)
+        self._journal_fields = {}
+        self._journal_entries = 0
+        self._full_save_needed = False
+        self._log(f"💾 Saved {len(self.data)} hack records to {self.json_path}", "Information")
+        return True
 
     def get_all_hacks(self, include_obsolete=False):
         """Get all hacks as a list of dictionaries
 
+        The list is a cached view stamped with data_version, so repeated calls
+        are O(1) until the data changes. Treat it as read-only.
+
         Args:
             include_obsolete (bool): If True, include obsolete hack versions. Default False.
         """
-        hacks = []
+        cache_key = ("hacks", include_obsolete)
+        # Read the version first: a background load may swap data while we build
+        version = self.data_version
+        cached = self._view_cache.get(cache_key)
+        if cached and cached[0] == version:
+            return cached[1]
 
+        hacks = []
         for hack_id, hack_data in self.data.items():
             if isinstance(hack_data, dict) and "title" in hack_data:
                 # Skip obsolete hacks unless explicitly requested
                 if not include_obsolete and hack_data.get("obsolete", False):
                     continue
 
-                title = hack_data.get("title", "Unknown")
-
                 # With obsolete tracking, we may have multiple versions of the same hack
                 # When include_obsolete=True, we want to include all versions (obsolete and current)
                 # When include_obsolete=False, only current versions should be included
                 # The obsolete system handles version management, so duplicate titles are expected when including obsolete versions
-
-                hack_info = {
-                    "id": hack_id,
-                    "title": title,
-                    "hack_type": hack_data.get("hack_type", "unknown").title(),  # Keep for backward compatibility
-                    "hack_types": hack_data.get("hack_types", [hack_data.get("hack_type", "unknown")]),  # NEW: Include multi-type support
-                    "difficulty": hack_data.get("current_difficulty", "Unknown"),  # Use current_difficulty only
-                    "hall_of_fame": hack_data.get("hall_of_fame", False),
-                    "sa1_compatibility": hack_data.get("sa1_compatibility", False),
-                    "collaboration": hack_data.get("collaboration", False),
-                    "demo": hack_data.get("demo", False),
-                    "obsolete": hack_data.get("obsolete", False),  # NEW: Include obsolete status
-                    "authors": hack_data.get("authors", []),  # Include authors for filtering
-                    "file_path": hack_data.get("file_path", ""),  # Include file_path for folder icon feature
-                    "completed": hack_data.get("completed", False),
-                    "completed_date": hack_data.get("completed_date", ""),
-                    "personal_rating": hack_data.get("personal_rating", 0),
-                    "notes": hack_data.get("notes", ""),
-                    "time_to_beat": hack_data.get("time_to_beat", 0),  # v3.1 NEW: Add time_to_beat field
-                    "exits": hack_data.get("exits", 0),  # v3.1 NEW: Add exits field for analytics
-                    "time": hack_data.get("time", 0),  # v4.8 NEW: Raw timestamp for release date
-                    "date": hack_data.get("date", ""),  # v4.8 NEW: Formatted release date
-                    "files": hack_data.get("files", [])  # v5.0 NEW: Multi-file support
-                }
+                hack_info = self._record_views.get(hack_id)
+                if hack_info is None:
+                    hack_info = self._build_hack_info(hack_id, hack_data)
+                    self._record_views[hack_id] = hack_info
                 hacks.append(hack_info)
+
+        self._view_cache[cache_key] = (version, hacks)
         return hacks
 
+    def get_hack_records(self, include_obsolete=False):
+        """Get {hack_id: raw processed.json entry} for the hacks get_all_hacks returns (cached, read-only)"""
+        cache_key = ("records", include_obsolete)
+        version = self.data_version
+        cached = self._view_cache.get(cache_key)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        records = {hack["id"]: self.data[hack["id"]]
+                   for hack in self.get_all_hacks(include_obsolete) if hack["id"] in self.data}
+        self._view_cache[cache_key] = (version, records)
+        return records
+
+    def get_columns(self):
+        """Get a CollectionColumns snapshot of every titled record, obsolete included (cached)
+
+        Edits patch the cached snapshot's rows in place; it is rebuilt when
+        records are added or removed.
+        """
+        version = self.data_version
+        cached = self._view_cache.get(("columns",))
+        if cached and cached[0] == version and cached[1].records is self.data:
+            return cached[1]
+
+        from collection_columns import CollectionColumns
+        columns = CollectionColumns(self.data)
+        self._view_cache[("columns",)] = (version, columns)
+        return columns
+
+    def get_author_table(self):
+        """Get the AuthorTable for every titled record (built once, kept current by edits)"""
+        table = self._author_table
+        while table is None:
+            # May run on a worker thread: build from a snapshot, retry if an edit landed meanwhile
+            version = self.data_version
+            table = AuthorTable.build(dict(self.data))
+            if version != self.data_version:
+                table = None
+            else:
+                self._author_table = table
+        return table
+
+    def get_hacks_by_author(self, name):
+        """Get the ids of the hacks credited to an author (exact name, case-insensitive)"""
+        return self.get_author_table().hacks_by(name)
+
+    @staticmethod
+    def _build_hack_info(hack_id, hack_data):
+        """Build the flat dict get_all_hacks returns for one record"""
+        return {
+            "id": hack_id,
+            "title": hack_data.get("title", "Unknown"),
+            "hack_type": hack_data.get("hack_type", "unknown").title(),  # Keep for backward compatibility
+            "hack_types": hack_data.get("hack_types", [hack_data.get("hack_type", "unknown")]),  # NEW: Include multi-type support
+            "difficulty": hack_data.get("current_difficulty", "Unknown"),  # Use current_difficulty only
+            "hall_of_fame": hack_data.get("hall_of_fame", False),
+            "sa1_compatibility": hack_data.get("sa1_compatibility", False),
+            "collaboration": hack_data.get("collaboration", False),
+            "demo": hack_data.get("demo", False),
+            "obsolete": hack_data.get("obsolete", False),  # NEW: Include obsolete status
+            "authors": normalize_authors(hack_data.get("authors", [])),  # Names only, for filtering and display
+            "file_path": hack_data.get("file_path", ""),  # Include file_path for folder icon feature
+            "completed": hack_data.get("completed", False),
+            "completed_date": hack_data.get("completed_date", ""),
+            "personal_rating": hack_data.get("personal_rating", 0),
+            "notes": hack_data.get("notes", ""),
+            "time_to_beat": hack_data.get("time_to_beat", 0),  # v3.1 NEW: Add time_to_beat field
+            "exits": hack_data.get("exits", 0),  # v3.1 NEW: Add exits field for analytics
+            "time": hack_data.get("time", 0),  # v4.8 NEW: Raw timestamp for release date
+            "date": hack_data.get("date", ""),  # v4.8 NEW: Formatted release date
+            "files": hack_data.get("files", [])  # v5.0 NEW: Multi-file support
+        }
+
+    def _invalidate(self, hack_ids=None):
+        """Bump data_version and refresh cached views for the given records (None = everything)
+
+        Per-record views are rebuilt in place, so cached lists stay valid when
+        only field values changed; they are dropped when a record is added,
+        removed, replaced or changes obsolete status.
+        """
+        self.data_version += 1
+        if hack_ids is None:
+            self._record_views.clear()
+            self._view_cache.clear()
+            self._author_table = None
+            return
+
+        if self._author_table is not None:
+            for hack_id in hack_ids:
+                self._author_table.set(hack_id, self.data.get(hack_id))
+
+        membership_changed = False
+        cached_records = self._view_cache.get(("records", True))
+        cached_columns = self._view_cache.get(("columns",))
+        if cached_columns:
+            cached_columns[1].records = self.data  # reload_data swaps in a new dict
+        for hack_id in hack_ids:
+            hack_data = self.data.get(hack_id)
+            if cached_columns and not cached_columns[1].update_row(hack_id, hack_data):
+                membership_changed = True
+            old_view = self._record_views.get(hack_id)
+            if old_view is None or not (isinstance(hack_data, dict) and "title" in hack_data):
+                self._record_views.pop(hack_id, None)
+                membership_changed = True
+                continue
+            if cached_records and cached_records[1].get(hack_id) is not hack_data:
+                membership_changed = True  # Entry object was replaced (pipeline sync)
+            new_view = self._build_hack_info(hack_id, hack_data)
+            if new_view["obsolete"] != old_view["obsolete"]:
+                membership_changed = True
+            # Cached lists hold this same dict, so update it in place
+            old_view.clear()
+            old_view.update(new_view)
+
+        if membership_changed:
+            self._view_cache.clear()
+        else:
+            for key, (_version, view) in list(self._view_cache.items()):
+                self._view_cache[key] = (self.data_version, view)
+
+    def get_hack_ids(self, include_obsolete=False):
+        """Get the set of hack IDs get_all_hacks would return, without building the dicts"""
+        return {
+            hack_id for hack_id, hack_data in self.data.items()
+            if isinstance(hack_data, dict) and "title" in hack_data
+            and (include_obsolete or not hack_data.get("obsolete", False))
+        }
+
     def update_hack(self, hack_id, field, value):
         """Update a specific field for a hack with delayed saving for performance"""
         if hack_id not in self.data:
@@ -148,7 +671,13 @@ class HackDataManager:
 
             # Mark as having unsaved changes and schedule delayed save
             self.unsaved_changes = True
+            dirty = self._dirty_fields.setdefault(hack_id, set())
+            dirty.add(field)
+            if field == "completed":
+                dirty.add("completed_date")
+            self._invalidate([hack_id])
             self._schedule_delayed_save()
+            self._notify("updated", [hack_id])
 
             self._log(f"🔄 Updated {field} for hack {hack_id}: '{old_value}' → '{value}' (will save in {self.save_delay}s)", "Debug")
             return True
@@ -157,37 +686,36 @@ class HackDataManager:
             return False
 
     def _schedule_delayed_save(self):
-        """Schedule a delayed save to improve performance"""
-        # Cancel any existing save timer
-        if self._save_timer:
-            self._save_timer.cancel()
-
-        # Schedule new save
-        self._save_timer = threading.Timer(self.save_delay, self._delayed_save)
-        self._save_timer.start()
+        """Queue a save on the persistence worker; edits within save_delay coalesce into one"""
+        get_persistence_worker().submit(self._save_key, self._delayed_save, delay=self.save_delay)
 
     def _delayed_save(self):
-        """Perform the actual delayed save"""
+        """Perform the actual delayed save (runs on the persistence worker)"""
         if self.unsaved_changes:
             if self.save_data():
-                self.unsaved_changes = False
+                # Edits made while saving stay pending for the next save
+                self.unsaved_changes = bool(self._dirty_fields) or self._full_save_needed
                 self._log(f"💾 Successfully saved batched changes to {self.json_path}", "Information")
             else:
                 self._log("❌ Failed to save batched changes", "Error")
 
-    def force_save(self):
-        """Force immediate save of any pending changes"""
-        if self._save_timer:
-            self._save_timer.cancel()
-            self._save_timer = None
+    def force_save(self, rewrite=False):
+        """Force immediate save of any pending changes
 
+        Waits for the persistence worker, so the save is ordered after any
+        queued pipeline writes. Returns False if the save failed.
+
+        Args:
+            rewrite (bool): Rewrite processed.json instead of journaling the
+                edits, so they don't override later save_processed writes
+        """
+        worker = get_persistence_worker()
+        if rewrite and self.unsaved_changes:
+            self._full_save_needed = True
         if self.unsaved_changes:
-            success = self.save_data()
-            if success:
-                self.unsaved_changes = False
-                self._log(f"💾 Successfully saved pending changes to {self.json_path}", "Information")
-            return success
-        return True
+            worker.submit(self._save_key, self._delayed_save)
+        worker.flush()
+        return not self.unsaved_changes
 
     def get_unique_types(self):
         """Get list of unique hack types"""
@@ -219,10 +747,14 @@ class HackDataManager:
 
     def add_user_hack(self, user_id, hack_data):
         """Add a user-created hack entry"""
+        self.wait_until_loaded()
         try:
             self.data[user_id] = hack_data
             self.unsaved_changes = True
+            self._full_save_needed = True
+            self._invalidate([user_id])
             self._schedule_delayed_save()
+            self._notify("added", [user_id])
             return True
         except Exception as e:
             self._log(f"❌ Error adding user hack: {e}", "Error")
@@ -239,6 +771,7 @@ class HackDataManager:
         Returns:
             bool: True on success, False on failure.
         """
+        self.wait_until_loaded()
         try:
             hack_id = str(hack_id)
             if hack_id not in self.data:
@@ -270,10 +803,15 @@ class HackDataManager:
 
             # Remove from processing history.
             del self.data[hack_id]
+            self._dirty_fields.pop(hack_id, None)
+            self._journal_fields.pop(hack_id, None)
+            self._invalidate([hack_id])
             self.unsaved_changes = True
+            self._full_save_needed = True
             # Force immediate save — deletion must persist before any subsequent
             # download attempt reads processed.json from disk.
             self.force_save()
+            self._notify("deleted", [hack_id])
             return True
 
         except Exception as e:
@@ -0,0 +1,640 @@
+"""
+Hack Index
+Precomputed filter index over the collection's hack list
+
+Built once per data version from HackDataManager.get_all_hacks(). Exact-match
+filters (type, difficulty, completed, obsolete, rating, user-created and the
+boolean flags) become set intersections. The search and author text filters
+go through a TrigramIndex over title, authors and notes, which follows the
+data manager's change events so edits only re-index the records they touch.
+Column sort orders are kept as cached row permutations, so the filtered rows
+come out already sorted and edits patch the index instead of rebuilding it.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import threading
+from bisect import bisect_left, insort
+from itertools import compress, repeat
+from operator import contains
+
+from utils import get_hack_types
+
+# Boolean hack fields filtered with "Yes"/"No"/"All"
+FLAG_FIELDS = ["hall_of_fame", "sa1_compatibility", "collaboration", "demo"]
+
+# Joins a hack's lowercase authors so one substring test covers all of them
+# without matching across author boundaries
+_AUTHOR_SEPARATOR = "\x00"
+
+# Text fields covered by the trigram index and their ranking weights
+SEARCH_FIELDS = ("title", "authors", "notes")
+FIELD_WEIGHTS = {"title": 30, "authors": 15, "notes": 5}
+PREFIX_BONUS = 20       # field starts with the query
+WORD_START_BONUS = 10   # query starts a word inside the field
+
+
+# Characters after which a trigram counts as the start of a word
+_WORD_BREAKS = " " + _AUTHOR_SEPARATOR
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _word_start_trigrams(text):
+    return {text[i:i + 3] for i in range(1, len(text) - 2) if text[i - 1] in _WORD_BREAKS}
+
+
+def _authors_text(authors):
+    if isinstance(authors, list):
+        return _AUTHOR_SEPARATOR.join(a.lower() for a in authors if isinstance(a, str))
+    if isinstance(authors, str):
+        return authors.lower()
+    return ""
+
+
+def _field_text(hack_data, field):
+    if field == "authors":
+        return _authors_text(hack_data.get("authors", []))
+    return str(hack_data.get(field, "") or "").lower()
+
+
+class _FieldIndex:
+    """Trigram postings for one text field, by document number"""
+
+    __slots__ = ("texts", "postings", "heads", "word_heads")
+
+    def __init__(self):
+        self.texts = []       # doc -> lowercase text ("" once removed)
+        self.postings = {}    # trigram -> docs containing it
+        self.heads = {}       # first trigram of the text -> docs
+        self.word_heads = {}  # trigram starting a later word -> docs
+
+    def add(self, doc, text):
+        if doc == len(self.texts):
+            self.texts.append(text)
+        else:
+            self.texts[doc] = text
+        for gram in _trigrams(text):
+            _add_posting(self.postings, gram, doc)
+        if len(text) >= 3:
+            _add_posting(self.heads, text[:3], doc)
+        for gram in _word_start_trigrams(text):
+            _add_posting(self.word_heads, gram, doc)
+
+    def remove(self, doc):
+        text = self.texts[doc]
+        for gram in _trigrams(text):
+            _discard_posting(self.postings, gram, doc)
+        if len(text) >= 3:
+            _discard_posting(self.heads, text[:3], doc)
+        for gram in _word_start_trigrams(text):
+            _discard_posting(self.word_heads, gram, doc)
+        self.texts[doc] = ""
+
+    def _containing(self, docs, needle):
+        """Subset of docs whose text contains needle (the loop runs in C)"""
+        docs = list(docs)
+        texts = map(self.texts.__getitem__, docs)
+        return set(compress(docs, map(contains, texts, repeat(needle))))
+
+    def match(self, query, grams):
+        """Return the set of docs whose text contains query"""
+        if not grams:
+            # Under 3 characters there is no trigram to look up, so scan
+            return set(compress(range(len(self.texts)), map(contains, self.texts, repeat(query))))
+
+        sets = []
+        for gram in grams:
+            docs = self.postings.get(gram)
+            if not docs:
+                return set()
+            sets.append(docs)
+        sets.sort(key=len)
+        matched = sets[0].intersection(*sets[1:])
+        # A 3-character query is exactly its one trigram; longer ones need confirming
+        if len(query) > 3:
+            matched = self._containing(matched, query)
+        return matched
+
+    def starts_with(self, query, matched):
+        """Subset of matched whose text starts with query"""
+        if len(query) >= 3:
+            matched = matched.intersection(self.heads.get(query[:3], ()))
+            if len(query) == 3:
+                return matched
+        docs = list(matched)
+        texts = map(self.texts.__getitem__, docs)
+        return set(compress(docs, map(str.startswith, texts, repeat(query))))
+
+    def word_starts(self, query, matched):
+        """Subset of matched where the query's first trigram begins a later word
+
+        Only used for ranking, so the rest of the query isn't re-checked.
+        """
+        if len(query) < 3:
+            return set()
+        return matched.intersection(self.word_heads.get(query[:3], ()))
+
+
+def _add_posting(postings, gram, doc):
+    docs = postings.get(gram)
+    if docs is None:
+        postings[gram] = {doc}
+    else:
+        docs.add(doc)
+
+
+def _discard_posting(postings, gram, doc):
+    docs = postings.get(gram)
+    if docs is not None:
+        docs.discard(doc)
+        if not docs:
+            del postings[gram]
+
+
+class TrigramIndex:
+    """Inverted trigram index over title, authors and notes
+
+    Each record gets a small integer document number (doc_of / ids) so the
+    posting sets and verification passes work on ints rather than id strings.
+    Queries of 3+ characters intersect posting sets (one per trigram) and then
+    confirm the substring on the candidates left; shorter queries scan.
+    Matches are ranked by field weight plus prefix / word-start bonuses, which
+    are found through the first-trigram and word-start-trigram postings.
+    """
+
+    def __init__(self):
+        self.fields = {field: _FieldIndex() for field in SEARCH_FIELDS}
+        self.ids = []      # doc -> hack_id (None once removed)
+        self.doc_of = {}   # hack_id -> doc
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.doc_of)
+
+    def build(self, data):
+        """Index every titled record in a processed.json-style dict"""
+        with self._lock:
+            self.fields = {field: _FieldIndex() for field in SEARCH_FIELDS}
+            self.ids = []
+            self.doc_of = {}
+            for hack_id, hack_data in data.items():
+                if isinstance(hack_data, dict) and "title" in hack_data:
+                    self._add(hack_id, hack_data)
+
+    def update(self, hack_id, hack_data):
+        """Re-index one record (or drop it if it is no longer a titled entry)"""
+        with self._lock:
+            if not (isinstance(hack_data, dict) and "title" in hack_data):
+                self._remove(hack_id)
+                return
+            doc = self.doc_of.get(hack_id)
+            if doc is None:
+                self._add(hack_id, hack_data)
+                return
+            # Only re-index the fields whose text changed
+            for field, index in self.fields.items():
+                text = _field_text(hack_data, field)
+                if index.texts[doc] != text:
+                    index.remove(doc)
+                    index.add(doc, text)
+
+    def remove(self, hack_id):
+        with self._lock:
+            self._remove(hack_id)
+
+    def _add(self, hack_id, hack_data):
+        doc = len(self.ids)
+        self.ids.append(hack_id)
+        self.doc_of[hack_id] = doc
+        for field, index in self.fields.items():
+            index.add(doc, _field_text(hack_data, field))
+
+    def _remove(self, hack_id):
+        doc = self.doc_of.pop(hack_id, None)
+        if doc is None:
+            return
+        self.ids[doc] = None
+        for index in self.fields.values():
+            index.remove(doc)
+
+    def search_docs(self, query, fields=SEARCH_FIELDS):
+        """Like search(), but keyed by document number"""
+        query = query.strip().lower()
+        if not query:
+            return {}
+
+        grams = _trigrams(query)
+        scores = None
+        with self._lock:
+            for field in fields:
+                index = self.fields[field]
+                matched = index.match(query, grams)
+                if not matched:
+                    continue
+
+                weight = FIELD_WEIGHTS[field]
+                prefixed = index.starts_with(query, matched)
+                field_scores = dict.fromkeys(matched, weight)
+                field_scores.update(dict.fromkeys(index.word_starts(query, matched) - prefixed,
+                                                  weight + WORD_START_BONUS))
+                field_scores.update(dict.fromkeys(prefixed, weight + PREFIX_BONUS))
+
+                if scores is None:
+                    scores = field_scores
+                else:
+                    # Only records matching in several fields need adding up
+                    both = scores.keys() & field_scores.keys()
+                    summed = {doc: scores[doc] + field_scores[doc] for doc in both}
+                    scores.update(field_scores)
+                    scores.update(summed)
+        return scores or {}
+
+    def search(self, query, fields=SEARCH_FIELDS):
+        """Find records containing query in any of the fields
+
+        Args:
+            query: Search text (case-insensitive substring)
+            fields: Which of SEARCH_FIELDS to search
+
+        Returns:
+            dict of hack_id -> relevance score (higher is better)
+        """
+        scores = self.search_docs(query, fields)
+        return dict(zip(map(self.ids.__getitem__, scores), scores.values()))
+
+
+class HackSearchIndex(TrigramIndex):
+    """TrigramIndex kept in sync with a HackDataManager through its change events
+
+    Building takes a while on large libraries, so build_async() does it on a
+    background thread; records changed meanwhile are re-indexed afterwards.
+    """
+
+    def __init__(self, data_manager):
+        super().__init__()
+        self.data_manager = data_manager
+        self.ready = False
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        data_manager.subscribe(self._on_data_changed)
+
+    def build_async(self, callback=None):
+        """Build from the store on a daemon thread, then call callback() (from that thread)"""
+        snapshot = dict(self.data_manager.data)
+
+        def worker():
+            try:
+                self.build(snapshot)
+                with self._pending_lock:
+                    pending, self._pending = self._pending, set()
+                    self.ready = True
+                self._reindex(pending)
+                if callback:
+                    callback()
+            except Exception as e:
+                print(f"Search index build failed: {e}")
+
+        threading.Thread(target=worker, name="search-index-build", daemon=True).start()
+
+    def _on_data_changed(self, event, hack_ids):
+        with self._pending_lock:
+            if not self.ready:
+                self._pending.update(hack_ids)
+                return
+        self._reindex(hack_ids)
+
+    def _reindex(self, hack_ids):
+        data = self.data_manager.data
+        for hack_id in hack_ids:
+            self.update(hack_id, data.get(hack_id))
+
+    def close(self):
+        self.data_manager.unsubscribe(self._on_data_changed)
+
+
+def _rating_sort_key(hack):
+    # Numeric value from the data, not the star display
+    rating = hack.get("personal_rating", 0)
+    try:
+        return float(rating) if rating else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+def _time_to_beat_sort_key(hack):
+    value = hack.get("time_to_beat", "")
+    if not value:
+        return 0
+    try:
+        # Already numeric (seconds), or a string to parse
+        if isinstance(value, (int, float)):
+            return value
+        return float(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _release_date_sort_key(hack):
+    # Numeric timestamp for proper chronological ordering
+    timestamp = hack.get("time", 0)
+    try:
+        return int(timestamp) if timestamp else 0
+    except (ValueError, TypeError):
+        return 0
+
+
+# Typed sort keys for collection columns; anything else sorts as lowercase text
+SORT_KEYS = {
+    # Completed items first, then uncompleted, each by title
+    "completed": lambda hack: (not hack.get("completed", False), hack.get("title", "").lower()),
+    "rating": _rating_sort_key,
+    # Empty dates sort first
+    "completed_date": lambda hack: hack.get("completed_date", "") or "0000-00-00",
+    "time_to_beat": _time_to_beat_sort_key,
+    "release_date": _release_date_sort_key,
+}
+
+
+def get_sort_key(column):
+    """Return the key function the collection uses to sort by column"""
+    key = SORT_KEYS.get(column)
+    if key is None:
+        def key(hack):
+            return str(hack.get(column, "")).lower()
+    return key
+
+
+class FilterSpec:
+    """Filter values compiled once per apply (read from the Tk variables up front)
+
+    Every field is None when that filter is inactive.
+    """
+
+    __slots__ = ("name", "author", "hack_type", "difficulty", "user_created",
+                 "obsolete", "completed", "rating", "flags")
+
+    def __init__(self, name=None, author=None, hack_type=None, difficulty=None,
+                 user_created=None, obsolete=None, completed=None, rating=None, flags=None):
+        self.name = name
+        self.author = author
+        self.hack_type = hack_type
+        self.difficulty = difficulty
+        self.user_created = user_created
+        self.obsolete = obsolete
+        self.completed = completed
+        self.rating = rating
+        self.flags = flags or {}
+
+    def key(self):
+        """Hashable form of the spec, for caching filter results"""
+        return (self.name, self.author, self.hack_type, self.difficulty, self.user_created,
+                self.obsolete, self.completed, self.rating, tuple(sorted(self.flags.items())))
+
+    @classmethod
+    def from_values(cls, name="", author="", hack_type="All", difficulty="All", user_created="Any",
+                    obsolete="Any", completed="All", rating="All", flags=None):
+        """Compile the raw filter UI values ("All"/"Any"/"Yes"/"No", star strings...)"""
+        def yes_no(value):
+            if value == "Yes":
+                return True
+            if value == "No":
+                return False
+            return None
+
+        name = name.strip().lower()
+        author = author.strip().lower()
+        return cls(
+            name=name or None,
+            author=author or None,
+            hack_type=hack_type.lower() if hack_type != "All" else None,
+            difficulty=difficulty if difficulty != "All" else None,
+            user_created=yes_no(user_created),
+            obsolete=yes_no(obsolete),
+            completed=yes_no(completed),
+            rating=rating.count("★") if rating != "All" else None,
+            flags={field: yes_no(value) for field, value in (flags or {}).items() if yes_no(value) is not None},
+        )
+
+
+class HackIndex:
+    """Row-number sets and lowercase text columns for one hack list
+
+    With a search_index the text filters use trigram lookups and matches are
+    ranked (see last_scores); without one (while it is still being built) they
+    fall back to substring scans over the same fields. With an author_table
+    (record_normalization.AuthorTable) the author filter matches the distinct
+    author names instead.
+    """
+
+    def __init__(self, hacks, search_index=None, author_table=None):
+        self.hacks = hacks
+        self.search_index = search_index
+        self.author_table = author_table
+        self.all_rows = frozenset(range(len(hacks)))
+        self.row_of = {}    # hack_id -> row
+        self.doc_rows = {}  # search index doc -> row
+        text_columns = len(hacks) if search_index is None else 0
+        self.titles = [""] * text_columns
+        self.authors = [""] * text_columns
+        self.notes = [""] * text_columns
+        self.last_scores = {}  # hack_id -> relevance of the last text search
+        self.by_type = {}
+        self.by_difficulty = {}
+        self.by_rating = {}
+        self.completed = set()
+        self.obsolete = set()
+        self.user_created = set()
+        self.flags = {field: set() for field in FLAG_FIELDS}
+        # Typed sort key per row and cached row permutations, built per column on first use
+        self._sort_keys = {}  # column -> key per row
+        self._orders = {}     # (column, reverse) -> rows in order (see _order)
+
+        doc_of = search_index.doc_of if search_index is not None else {}
+        for row, hack in enumerate(hacks):
+            self.row_of[hack.get("id")] = row
+            if search_index is not None:
+                doc = doc_of.get(hack.get("id"))
+                if doc is not None:
+                    self.doc_rows[doc] = row
+            self._index_row(row, hack)
+
+    def _index_row(self, row, hack):
+        """Add one row to the filter sets (and text columns when scanning)"""
+        if self.search_index is None:
+            self.titles[row] = hack.get("title", "").lower()
+
+            authors = hack.get("authors", [])
+            if isinstance(authors, (list, str)):
+                self.authors[row] = _authors_text(authors)
+            else:
+                self.authors[row] = None  # Unknown shape never fails the author filter
+            self.notes[row] = str(hack.get("notes", "") or "").lower()
+
+        for hack_type in {t.lower() for t in get_hack_types(hack)}:
+            self.by_type.setdefault(hack_type, set()).add(row)
+        self.by_difficulty.setdefault(hack.get("difficulty"), set()).add(row)
+        self.by_rating.setdefault(hack.get("personal_rating", 0), set()).add(row)
+
+        if hack.get("completed", False):
+            self.completed.add(row)
+        if hack.get("obsolete", False):
+            self.obsolete.add(row)
+        if str(hack.get("id", "")).startswith("usr_"):
+            self.user_created.add(row)
+        for field in FLAG_FIELDS:
+            if hack.get(field, False):
+                self.flags[field].add(row)
+
+    def update_records(self, hack_ids):
+        """Re-index records whose fields changed in place (same hack list)
+
+        Filter sets are patched and cached sort orders have each changed row
+        moved with a binary search, instead of rebuilding the whole index.
+        """
+        for hack_id in hack_ids:
+            row = self.row_of.get(hack_id)
+            if row is None:
+                continue
+            hack = self.hacks[row]
+
+            for groups in (self.by_type, self.by_difficulty, self.by_rating):
+                for rows in groups.values():
+                    rows.discard(row)
+            for rows in (self.completed, self.obsolete, self.user_created, *self.flags.values()):
+                rows.discard(row)
+            self._index_row(row, hack)
+
+            for column, keys in self._sort_keys.items():
+                new_key = get_sort_key(column)(hack)
+                if new_key == keys[row]:
+                    continue
+                orders = [(self._orders.get((column, reverse)), reverse) for reverse in (False, True)]
+                for order, reverse in orders:
+                    if order is not None:
+                        del order[bisect_left(order, self._order_key(keys, row, reverse),
+                                              key=self._order_key_func(keys, reverse))]
+                keys[row] = new_key
+                for order, reverse in orders:
+                    if order is not None:
+                        insort(order, row, key=self._order_key_func(keys, reverse))
+
+    @staticmethod
+    def _order_key(keys, row, reverse):
+        return (keys[row], -row if reverse else row)
+
+    @staticmethod
+    def _order_key_func(keys, reverse):
+        if reverse:
+            return lambda row: (keys[row], -row)
+        return lambda row: (keys[row], row)
+
+    def _keys(self, column):
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            keys = self._sort_keys[column] = list(map(get_sort_key(column), self.hacks))
+        return keys
+
+    def _order(self, column, reverse):
+        """Cached permutation of every row, sorted by (key, row)
+
+        For reverse the tie-break is -row, so walking the list backwards gives
+        the same order as a stable reverse sort (ties keep list order).
+        """
+        order = self._orders.get((column, reverse))
+        if order is None:
+            keys = self._keys(column)
+            rows = reversed(range(len(keys))) if reverse else range(len(keys))
+            order = self._orders[(column, reverse)] = sorted(rows, key=keys.__getitem__)
+        return order
+
+    def sorted_rows(self, rows, column, reverse=False):
+        """Return rows in column order, taken from the cached permutation"""
+        order = self._order(column, reverse)
+        if len(rows) * 16 < len(order):
+            # Few rows: sorting them directly beats walking the whole permutation
+            result = sorted(rows, key=self._order_key_func(self._keys(column), reverse))
+        elif len(rows) == len(order):
+            result = list(order)
+        else:
+            result = list(filter(rows.__contains__, order))
+        if reverse:
+            result.reverse()
+        return result
+
+    def filter_rows(self, spec, sort_column=None, reverse=False):
+        """Return the row numbers that pass the spec, in list order or sorted by sort_column"""
+        includes = []
+        excludes = []
+
+        def require(rows, wanted):
+            # wanted=True keeps rows in the set, False keeps rows outside it
+            (includes if wanted else excludes).append(rows)
+
+        if spec.hack_type is not None:
+            includes.append(self.by_type.get(spec.hack_type, set()))
+        if spec.difficulty is not None:
+            includes.append(self.by_difficulty.get(spec.difficulty, set()))
+        if spec.rating is not None:
+            includes.append(self.by_rating.get(spec.rating, set()))
+        if spec.user_created is not None:
+            require(self.user_created, spec.user_created)
+        if spec.obsolete is not None:
+            require(self.obsolete, spec.obsolete)
+        if spec.completed is not None:
+            require(self.completed, spec.completed)
+        for field, wanted in spec.flags.items():
+            require(self.flags[field], wanted)
+
+        self.last_scores = {}
+        author_query = spec.author
+        if author_query and self.author_table is not None:
+            matched = set(map(self.row_of.get, self.author_table.hacks_matching(author_query)))
+            matched.discard(None)  # Not in this hack list
+            includes.append(matched)
+            author_query = None
+        if self.search_index is not None:
+            # Text matches become one more include set
+            if spec.name:
+                includes.append(self._search_rows(spec.name, SEARCH_FIELDS, rank=True))
+            if author_query:
+                includes.append(self._search_rows(author_query, ("authors",)))
+
+        # Intersect smallest first so the working set shrinks quickly
+        if includes:
+            includes.sort(key=len)
+            rows = includes[0].intersection(*includes[1:])
+        else:
+            rows = self.all_rows
+        for other in excludes:
+            rows = rows - other
+
+        if self.search_index is None:
+            if spec.name:
+                titles, authors, notes = self.titles, self.authors, self.notes
+                rows = {row for row in rows
+                        if spec.name in titles[row] or spec.name in (authors[row] or "") or spec.name in notes[row]}
+            if author_query:
+                authors = self.authors
+                rows = {row for row in rows if authors[row] is None or author_query in authors[row]}
+
+        if sort_column:
+            return self.sorted_rows(rows, sort_column, reverse)
+        return sorted(rows)
+
+    def _search_rows(self, query, fields, rank=False):
+        """Rows whose text fields contain query, via the trigram index"""
+        scores = self.search_index.search_docs(query, fields)
+        matched = set(map(self.doc_rows.get, scores))
+        matched.discard(None)  # Indexed since this row list was built
+        if rank:
+            ids = self.search_index.ids
+            self.last_scores = dict(zip(map(ids.__getitem__, scores), scores.values()))
+        return matched
+
+    def filter(self, spec, sort_column=None, reverse=False):
+        """Return the hacks that pass the spec, in list order or sorted by sort_column"""
+        return list(map(self.hacks.__getitem__, self.filter_rows(spec, sort_column, reverse)))
@@ -0,0 +1,354 @@
+"""
+Library Integrity
+Reconciles processed.json with the ROM files actually in the output folder
+
+Missing files used to surface one at a time (a "Source Not Found" redownload,
+a missing folder icon). scan_library walks output_dir with a pool of scandir
+workers, then checks every recorded path (file_path, files[] and
+additional_paths) against the tree in one pass and reports:
+
+- missing: recorded paths with no file on disk
+- moved: missing paths whose file turned up elsewhere in the tree (same name)
+- orphaned: ROM files in the tree that no record points to
+
+along with a fix plan (relink moved paths, redownload or locate missing
+ones). apply_fix_plan applies the relinks through the shared HackDataManager
+and rewrites processed.json with them.
+
+The walk keeps a stat index in library_index.json: the mtime of every
+directory and the files it held. A directory's mtime changes when entries are
+added, removed or renamed in it, so later scans re-read only the directories
+whose mtime changed and reuse the index for the rest.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from utils import get_user_data_path
+
+INDEX_PATH = get_user_data_path("library_index.json")
+INDEX_FORMAT = 1
+
+# Directories stat'ed/scanned at once
+SCAN_WORKERS = 8
+
+# Files in the tree that count as library ROMs (orphan candidates)
+ROM_EXTENSIONS = (".smc", ".sfc")
+
+_shared_index = None
+_shared_lock = threading.Lock()
+
+
+def get_library_index():
+    """Get the process-wide stat index (loaded from disk on first use)"""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = LibraryIndex()
+        return _shared_index
+
+
+def _path_key(path):
+    """Comparable form of a path (absolute, normalized, case-folded on Windows)"""
+    return os.path.normcase(os.path.abspath(os.path.expanduser(path)))
+
+
+def _scan_directory(path, cached):
+    """Return (entry, rescanned) for one directory, or None if it is gone
+
+    entry is {"mtime_ns", "files": {name: [size, mtime_ns]}, "dirs": [names]}.
+    The cached entry is reused as-is when the directory's mtime is unchanged.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    if cached and cached.get("mtime_ns") == mtime_ns:
+        return cached, False
+
+    # Stat before listing: a change made during the listing leaves an older
+    # mtime in the index, so the next scan re-reads this directory
+    files = {}
+    dirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files[entry.name] = [stat.st_size, stat.st_mtime_ns]
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return {"mtime_ns": mtime_ns, "files": files, "dirs": sorted(dirs)}, True
+
+
+class LibraryIndex:
+    """Directory stat index of one output folder, persisted in library_index.json
+
+    dirs maps a directory path relative to root ("" for root, "/"-separated)
+    to its _scan_directory entry.
+    """
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.root = ""
+        self.dirs = {}
+        self.scanned_at = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(snapshot, dict) or snapshot.get("format") != INDEX_FORMAT:
+            return  # Unknown layout - the next scan rebuilds it
+        self.root = snapshot.get("root", "")
+        self.dirs = snapshot.get("dirs", {})
+        self.scanned_at = snapshot.get("scanned_at", 0)
+
+    def _save(self):
+        from processed_journal import write_json_atomic
+        write_json_atomic(self.path, {
+            "format": INDEX_FORMAT,
+            "root": self.root,
+            "scanned_at": self.scanned_at,
+            "dirs": self.dirs,
+        }, indent=None)
+
+    def refresh(self, root, full=False, workers=SCAN_WORKERS):
+        """Walk root in parallel, re-reading only directories whose mtime changed
+
+        Returns the number of directories that were re-read.
+        """
+        with self._lock:
+            root = os.path.abspath(os.path.expanduser(root))
+            same_root = self.root and _path_key(self.root) == _path_key(root)
+            cached = self.dirs if same_root and not full else {}
+            dirs = {}
+            rescanned = 0
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                pending = {pool.submit(_scan_directory, root, cached.get("")): ""}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        relative = pending.pop(future)
+                        result = future.result()
+                        if result is None:
+                            continue
+                        entry, changed = result
+                        dirs[relative] = entry
+                        rescanned += changed
+                        for name in entry["dirs"]:
+                            child = f"{relative}/{name}" if relative else name
+                            child_path = os.path.join(root, *child.split("/"))
+                            pending[pool.submit(_scan_directory, child_path, cached.get(child))] = child
+
+            self.root = root
+            self.dirs = dirs
+            self.scanned_at = time.time()
+            self._save()
+            return rescanned
+
+    def iter_files(self):
+        """Yield (absolute path, size) for every indexed file"""
+        for relative, entry in self.dirs.items():
+            folder = os.path.join(self.root, *relative.split("/")) if relative else self.root
+            for name, (size, _mtime_ns) in entry["files"].items():
+                yield os.path.join(folder, name), size
+
+
+def _recorded_paths(hack_data):
+    """Yield (field, index, path) for every path a record points to
+
+    index is None for file_path and the list position for files[] and
+    additional_paths.
+    """
+    file_path = hack_data.get("file_path")
+    if isinstance(file_path, str) and file_path:
+        yield "file_path", None, file_path
+    for field in ("files", "additional_paths"):
+        values = hack_data.get(field)
+        if not isinstance(values, list):
+            continue
+        for index, value in enumerate(values):
+            path = value.get("path") if isinstance(value, dict) else value
+            if isinstance(path, str) and path:
+                yield field, index, path
+
+
+def scan_library(output_dir, data=None, full=False, workers=SCAN_WORKERS, log=None):
+    """Compare the recorded paths in processed.json with the files under output_dir
+
+    Args:
+        output_dir: ROM output folder to walk
+        data: processed.json contents (default: the shared HackDataManager's)
+        full: Ignore the stat index and re-read every directory
+        workers: scandir worker threads
+
+    Returns:
+        Dictionary with the scan counts, missing/moved/orphaned lists and fix_plan
+    """
+    started = time.time()
+    if data is None:
+        from hack_data_manager import get_hack_data_manager
+        manager = get_hack_data_manager()
+        manager.wait_until_loaded()
+        data = manager.data
+    records = list(data.items())  # Snapshot - the UI may edit while we compare
+
+    index = get_library_index()
+    rescanned = index.refresh(output_dir, full=full, workers=workers)
+    root_key = _path_key(index.root)
+
+    # Every file in the tree, and the ROMs among them by (case-folded) name
+    on_disk = {}
+    for path, size in index.iter_files():
+        on_disk[_path_key(path)] = (path, size)
+    tracked = set()
+    missing = []
+
+    for hack_id, hack_data in records:
+        if not isinstance(hack_data, dict):
+            continue
+        for field, position, path in _recorded_paths(hack_data):
+            key = _path_key(path)
+            tracked.add(key)
+            if key.startswith(root_key + os.sep):
+                exists = key in on_disk
+            else:
+                exists = os.path.exists(os.path.expanduser(path))  # Outside the scanned tree
+            if not exists:
+                missing.append({
+                    "hack_id": hack_id,
+                    "title": hack_data.get("title", "Unknown"),
+                    "field": field,
+                    "index": position,
+                    "path": path,
+                    "folder": os.path.basename(os.path.dirname(path)),
+                })
+
+    untracked = {key: value for key, value in on_disk.items()
+                 if key not in tracked and value[0].lower().endswith(ROM_EXTENSIONS)}
+    by_name = {}
+    for key, (path, size) in untracked.items():
+        by_name.setdefault(os.path.normcase(os.path.basename(path)), []).append(key)
+
+    # A missing path was moved if a file with its name is untracked: prefer one
+    # in a folder with the old folder's name (e.g. moved to another type)
+    moved = []
+    still_missing = []
+    claimed = set()
+    found = {}  # missing path key -> untracked key (file_path and files[] often share a path)
+    for item in missing:
+        old_key = _path_key(item["path"])
+        if old_key not in found:
+            candidates = [key for key in by_name.get(os.path.normcase(os.path.basename(item["path"])), [])
+                          if key not in claimed]
+            if len(candidates) > 1:
+                same_folder = [key for key in candidates
+                               if os.path.basename(os.path.dirname(key)) == os.path.normcase(item["folder"])]
+                candidates = same_folder if len(same_folder) == 1 else []
+            found[old_key] = candidates[0] if len(candidates) == 1 else None
+            if found[old_key]:
+                claimed.add(found[old_key])
+        if found[old_key]:
+            moved.append(dict(item, new_path=untracked[found[old_key]][0]))
+        else:
+            still_missing.append(item)
+
+    orphaned = [{"path": path, "size": size} for key, (path, size) in sorted(untracked.items())
+                if key not in claimed]
+
+    fix_plan = [{"action": "relink", "hack_id": item["hack_id"], "field": item["field"],
+                 "index": item["index"], "old": item["path"], "new": item["new_path"]} for item in moved]
+    for hack_id in dict.fromkeys(item["hack_id"] for item in still_missing):
+        # Downloaded hacks come back with the next bulk download; manual ones need the user
+        fix_plan.append({"action": "locate" if str(hack_id).startswith("usr_") else "redownload",
+                         "hack_id": hack_id})
+    fix_plan.extend({"action": "review", "path": item["path"]} for item in orphaned)
+
+    report = {
+        "root": index.root,
+        "directories": len(index.dirs),
+        "rescanned_directories": rescanned,
+        "files": len(on_disk),
+        "tracked_paths": len(tracked),
+        "missing": still_missing,
+        "moved": moved,
+        "orphaned": orphaned,
+        "fix_plan": fix_plan,
+        "duration": round(time.time() - started, 3),
+    }
+    if log:
+        log(f"🔍 Library scan: {report['files']:,} files in {report['directories']:,} folders "
+            f"({rescanned:,} re-read) in {report['duration']:.2f}s", "Information")
+        log(f"📊 {len(still_missing)} missing, {len(moved)} moved, {len(orphaned)} untracked ROMs", "Information")
+    return report
+
+
+def apply_fix_plan(report, log=None):
+    """Relink the moved paths of a scan_library report through the shared HackDataManager
+
+    Redownload/locate/review actions are left to the user. Returns the number
+    of paths relinked.
+    """
+    from hack_data_manager import get_hack_data_manager
+    manager = get_hack_data_manager()
+    manager.wait_until_loaded()
+
+    # hack_id -> field -> [(index, old, new)], so each field is written once
+    relinks = {}
+    for action in report.get("fix_plan", []):
+        if action["action"] == "relink":
+            relinks.setdefault(action["hack_id"], {}).setdefault(action["field"], []).append(
+                (action["index"], action["old"], action["new"]))
+
+    relinked = 0
+    for hack_id, fields in relinks.items():
+        hack_data = manager.data.get(hack_id)
+        if not isinstance(hack_data, dict):
+            continue
+        for field, changes in fields.items():
+            if field == "file_path":
+                index, old, new = changes[0]
+                if hack_data.get("file_path") != old:
+                    continue  # Edited since the scan
+                value = new
+                applied = 1
+            else:
+                value = list(hack_data.get(field) or [])
+                applied = 0
+                for index, old, new in changes:
+                    if index is None or index >= len(value):
+                        continue
+                    if isinstance(value[index], dict):
+                        if value[index].get("path") == old:
+                            value[index] = dict(value[index], path=new)
+                            applied += 1
+                    elif value[index] == old:
+                        value[index] = new
+                        applied += 1
+            if applied and manager.update_hack(hack_id, field, value):
+                relinked += applied
+                if log:
+                    log(f"🔗 Relinked {hack_data.get('title', hack_id)} ({field}) → {changes[0][2]}", "Information")
+
+    if relinked:
+        # Rewrite rather than journal, so the download pipeline can still move
+        # a relinked hack with its own (possibly earlier loaded) processed.json
+        manager.force_save(rewrite=True)
+    return relinked
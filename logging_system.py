@@ -29,8 +29,30 @@ class LoggingSystem:
         # Configure tags
         self.update_colors()
         
+        # Show messages logged before the widget existed (pages are built lazily)
+        self._replay_history()
+        
         return self.log_text
     
+    def _replay_history(self):
+        """Insert stored messages that pass the current log level"""
+        if not self.log_text or not self.history:
+            return
+        try:
+            self.log_text.configure(state="normal")
+            for stored_level, message in self.history:
+                if not self.should_log(stored_level):
+                    continue
+                tag = stored_level.lower()
+                if tag in ("error", "warning", "debug", "applying"):
+                    self.log_text.insert(tk.END, message + "\n", tag)
+                else:
+                    self.log_text.insert(tk.END, message + "\n")
+            self.log_text.configure(state="disabled")
+            self.log_text.see(tk.END)
+        except tk.TclError:
+            pass
+    
     def setup_log_with_controls(self, parent):
         """Create just the log text widget (controls are handled by layout)"""
         self.log_text = scrolledtext.ScrolledText(
@@ -228,10 +228,27 @@ def run_pipeline_wrapper(*args, **kwargs):
 
 
 def run_single_download_pipeline(selected_hacks, log=None, progress_callback=None, multi_patch_callback=None):
-    """Custom pipeline for single download page that works like bulk download"""
+    """Custom pipeline for single download page that works like bulk download
+
+    Hacks that fail for a transient reason (network, server error...) are
+    retried at the end of the run with exponential backoff; every failure is
+    kept in the retry queue so it can be retried later from the UI.
+    """
+    from pipeline_metrics import RunMetrics
+
+    with RunMetrics("single_download", log) as metrics:
+        _run_single_download_pipeline(selected_hacks, log, progress_callback, multi_patch_callback, metrics)
+
+
+def _run_single_download_pipeline(selected_hacks, log, progress_callback, multi_patch_callback, metrics, _retry_round=0):
     from api_pipeline import fetch_file_metadata, load_processed, save_processed, reset_cancel_flag, is_cancelled, extract_patches_from_zip, _select_best_patch, make_output_path, clean_hack_title, DIFFICULTY_LOOKUP, get_sorted_folder_name, title_case, safe_filename
     from patch_handler import PatchHandler
     from config_manager import ConfigManager
+    from retry_queue import (
+        get_retry_queue, classify_failure, is_transient, compute_backoff, wait_with_cancel,
+        HackProcessingError, MAX_AUTO_RETRY_ROUNDS,
+        REASON_NO_DOWNLOAD_URL, REASON_NO_PATCH, REASON_PATCH_FAILED
+    )
 
     # Get config for paths
     config = ConfigManager()
@@ -244,11 +261,15 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
             log("Error: Base ROM path and output directory must be configured", "Error")
         return
 
-    if log:
+    if log and _retry_round == 0:
         log(f"🎯 Starting download of {len(selected_hacks)} selected hacks...", "Information")
 
-    # Reset cancellation flag
-    reset_cancel_flag()
+    # Reset cancellation flag (retry passes must not clear a pending cancel)
+    if _retry_round == 0:
+        reset_cancel_flag()
+
+    retry_queue = get_retry_queue()
+    transient_failures = []
 
     # Load processed hacks
     processed = load_processed()
@@ -269,6 +290,7 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
         hack_id = str(hack.get("id"))
         hack_name = hack.get("name", "Unknown")
         title_clean = title_case(safe_filename(hack_name))
+        metrics.begin_hack(hack_id)
 
         if log:
             log(f"📥 [{i}/{total_hacks}] Processing: {hack_name}", "Information")
@@ -347,7 +369,8 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                         # Create new directory if needed
                         os.makedirs(os.path.dirname(expected_file_path), exist_ok=True)
                         # Move the file
-                        shutil.move(old_file_path, expected_file_path)
+                        with metrics.stage("move", hack_id):
+                            shutil.move(old_file_path, expected_file_path)
                         # Update file_path in processed data
                         existing_hack["file_path"] = expected_file_path
                         metadata_updated = True
@@ -513,9 +536,12 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
 
             # Save if any metadata was updated
             if metadata_updated:
-                save_processed(processed)
+                with metrics.stage("save_enqueue", hack_id):
+                    save_processed(processed, changed_ids=[hack_id])
 
             if not _redownload:
+                retry_queue.discard([hack_id])
+                metrics.end_hack(hack_id, "updated" if metadata_updated else "skipped")
                 continue
 
         try:
@@ -526,7 +552,8 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                 if log:
 
                     log(f"🔍 Fetching download URL for {hack_name}...", "Information")
-                file_metadata = fetch_file_metadata(hack_id, log)
+                with metrics.stage("fetch_metadata", hack_id):
+                    file_metadata = fetch_file_metadata(hack_id, log)
                 if file_metadata and file_metadata.get("data"):
                     download_url = file_metadata["data"].get("download_url")
 
@@ -534,6 +561,9 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                     if log:
 
                         log(f"❌ No download URL found for {hack_name}", "Error")
+                    retry_queue.record_failure(hack, REASON_NO_DOWNLOAD_URL, "No download URL found")
+                    metrics.end_hack(hack_id, "failed")
+                    errored_hacks += 1
                     continue
 
             # Create temp directory for processing
@@ -551,10 +581,12 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                         log("❌ Download cancelled by user", "Warning")
                     break
                 
-                r = requests.get(download_url)
-                r.raise_for_status()  # Raise exception for bad status codes
-                with open(zip_path, "wb") as f:
-                    f.write(r.content)
+                with metrics.stage("download", hack_id) as stage:
+                    r = requests.get(download_url, timeout=60)
+                    r.raise_for_status()  # Raise exception for bad status codes
+                    with open(zip_path, "wb") as f:
+                        f.write(r.content)
+                    stage["bytes"] = downloaded_bytes = len(r.content)
 
                 # Check for cancellation after download, before processing
                 if is_cancelled():
@@ -569,9 +601,10 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                 primary_type = hack_types[0] if hack_types else "standard"
 
                 # Extract patch file(s)
-                patch_files = extract_patches_from_zip(zip_path, temp_dir, title_clean, return_all=True)
+                with metrics.stage("extract", hack_id):
+                    patch_files = extract_patches_from_zip(zip_path, temp_dir, title_clean, return_all=True)
                 if not patch_files:
-                    raise Exception("Patch file (.ips or .bps) not found in archive")
+                    raise HackProcessingError(REASON_NO_PATCH, "Patch file (.ips or .bps) not found in archive")
 
                 # ── Multi-patch path ────────────────────────────────────────
                 patched_files_data = []
@@ -583,6 +616,7 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                     if selections is None:
                         if log:
                             log(f"⏭️ Skipped: {hack_name} (cancelled by user)", "Warning")
+                        metrics.end_hack(hack_id, "skipped")
                         skipped_hacks += 1
                         continue
 
@@ -597,7 +631,9 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                         )
                         if log:
                             log(f"🔧 Patching {sel['output_name']}...", "Information")
-                        success = PatchHandler.apply_patch(sel["patch_path"], base_rom_path, out_path, log)
+                        with metrics.stage("patch", hack_id) as stage:
+                            success = PatchHandler.apply_patch(sel["patch_path"], base_rom_path, out_path, log)
+                            stage["outcome"] = "ok" if success else "failed"
                         if not success:
                             if log:
                                 log(f"⚠️ Patch failed for {sel['output_name']}, skipping.", "Warning")
@@ -607,7 +643,7 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                             primary_output_path = out_path
 
                     if not patched_list:
-                        raise Exception("All selected patches failed")
+                        raise HackProcessingError(REASON_PATCH_FAILED, "All selected patches failed")
 
                     if primary_output_path is None:
                         primary_output_path = patched_list[0]["path"]
@@ -634,9 +670,11 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                     # Apply the patch to primary location
                     if log:
                         log(f"🔧 Patching {hack_name}...", "Information")
-                    success = PatchHandler.apply_patch(patch_path, base_rom_path, primary_output_path, log)
+                    with metrics.stage("patch", hack_id) as stage:
+                        success = PatchHandler.apply_patch(patch_path, base_rom_path, primary_output_path, log)
+                        stage["outcome"] = "ok" if success else "failed"
                     if not success:
-                        raise Exception("Patch application failed")
+                        raise HackProcessingError(REASON_PATCH_FAILED, "Patch application failed")
 
                     # Check for cancellation after patching
                     if is_cancelled():
@@ -648,10 +686,11 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                         log(f"✅ Patched: {title_clean}", "Information")
 
                 # Handle multi-type downloads
-                additional_paths = handle_multi_type_download(
-                    primary_output_path, hack_types, output_dir, folder_name,
-                    title_clean, base_rom_ext, config, log
-                )
+                with metrics.stage("multi_type_copy", hack_id):
+                    additional_paths = handle_multi_type_download(
+                        primary_output_path, hack_types, output_dir, folder_name,
+                        title_clean, base_rom_ext, config, log
+                    )
 
                 # Detect duplicates and handle obsolete versions
                 current_title = clean_hack_title(hack_name)
@@ -723,7 +762,10 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                     successful_downloads += 1
 
                 # Save progress after each successful download
-                save_processed(processed)
+                with metrics.stage("save_enqueue", hack_id):
+                    save_processed(processed, changed_ids=[hack_id])
+                retry_queue.discard([hack_id])
+                metrics.end_hack(hack_id, "obsolete" if is_obsolete_version else "downloaded", downloaded_bytes)
 
             finally:
                 # Clean up temp directory
@@ -733,18 +775,45 @@ def run_single_download_pipeline(selected_hacks, log=None, progress_callback=Non
                     pass
 
         except Exception as e:
+            reason = classify_failure(e)
             if log:
 
-                log(f"❌ Error processing {hack_name}: {str(e)}", "Error")
+                log(f"❌ Error processing {hack_name}: {str(e)} ({reason})", "Error")
+            retry_queue.record_failure(hack, reason, str(e))
+            metrics.end_hack(hack_id, "failed")
+            if is_transient(reason):
+                transient_failures.append(hack)
             errored_hacks += 1
             continue
 
-    # Final summary
+    # Retry transient failures at the end of the run with exponential backoff
+    if transient_failures and not is_cancelled():
+        if _retry_round < MAX_AUTO_RETRY_ROUNDS:
+            delay = compute_backoff(_retry_round)
+            if log:
+                log(f"🔁 Retrying {len(transient_failures)} failed hack(s) in {delay:.1f}s (attempt {_retry_round + 1}/{MAX_AUTO_RETRY_ROUNDS})", "Information")
+            with metrics.stage("retry_wait"):
+                completed = wait_with_cancel(delay, is_cancelled)
+            if completed:
+                retried = _run_single_download_pipeline(transient_failures, log, progress_callback, multi_patch_callback, metrics, _retry_round + 1)
+                if retried:
+                    # Retried hacks count once, with their final outcome
+                    successful_downloads += retried[0]
+                    skipped_hacks += retried[1]
+                    errored_hacks += retried[2] - len(transient_failures)
+        elif log:
+            log(f"⚠️ {len(transient_failures)} hack(s) still failing - use Retry Failed to try again later", "Warning")
+
+    if _retry_round > 0:
+        return successful_downloads, skipped_hacks, errored_hacks
+
+    # Final summary (once, after every retry round)
     if progress_callback:
         progress_callback(total_hacks, total_hacks, "Complete!")
     if log:
 
         log(f"✅ Download complete! {successful_downloads} processed, {skipped_hacks} skipped, {errored_hacks} errored, out of {total_hacks} hacks.", "Information")
+    return successful_downloads, skipped_hacks, errored_hacks
 
 
 def detect_and_handle_duplicates(processed, current_hack_id, current_title, log=None):
@@ -803,17 +872,61 @@ def detect_and_handle_duplicates(processed, current_hack_id, current_title, log=
         return True
 
 
+def _start_difficulty_lookup_refresh(root, config_manager):
+    """Fetch the latest difficulty names from SMWC and apply them when they arrive"""
+    from difficulty_lookup_manager import refresh_difficulty_lookup_async
+    from utils import update_difficulty_lookup as set_difficulty_lookup
+
+    def apply_lookup(fetched):
+        # Runs on the UI thread
+        try:
+            if fetched and fetched != config_manager.get_difficulty_lookup():
+                config_manager.set_difficulty_lookup(fetched)
+                set_difficulty_lookup(fetched)
+        except Exception as e:
+            print(f"Could not apply difficulty lookup: {e}")
+
+    def on_fetched(fetched):
+        try:
+            root.after(0, lambda: apply_lookup(fetched))
+        except (tk.TclError, RuntimeError):
+            pass  # Window closed before the fetch finished
+
+    refresh_difficulty_lookup_async(on_fetched)
+
+
+def _report_first_paint(root):
+    """Print a first_paint marker once the window has been drawn, then exit"""
+    import json
+    import time
+
+    def on_first_paint():
+        root.update_idletasks()
+        print(json.dumps({"event": "first_paint", "time": time.time()}), flush=True)
+        if os.environ.get("SMWC_STARTUP_BENCHMARK") == "exit":
+            os._exit(0)
+
+    # after_idle fires once mainloop has processed the initial map/expose events
+    root.after_idle(lambda: root.after(0, on_first_paint))
+
+
 def main():
     """Main application entry point"""
     try:
-        # Initialize difficulty lookup from SMWC API before starting UI
+        # Start with the difficulty lookup cached in config (or the built-in fallback)
+        # so the window appears immediately; the SMWC API refresh runs after it is shown
         from config_manager import ConfigManager
-        from difficulty_lookup_manager import get_difficulty_lookup
+        from difficulty_lookup_manager import get_cached_difficulty_lookup
         from utils import update_difficulty_lookup as set_difficulty_lookup
-        
+        from utils import ensure_config_file
+
+        ensure_config_file()
         config_manager = ConfigManager()
-        difficulty_lookup = get_difficulty_lookup(config_manager)
-        set_difficulty_lookup(difficulty_lookup)
+        if config_manager.get("performance_trace", False):
+            import tracer
+            tracer.enable()
+
+        set_difficulty_lookup(get_cached_difficulty_lookup(config_manager))
         
         root = tk.Tk()
         root.title("SMWC Downloader & Patcher")
@@ -867,18 +980,36 @@ def main():
         # Store button reference for pipeline access
         root.download_button = download_button
 
+        # Report time-to-first-paint when launched by benchmark_startup.py
+        if os.environ.get("SMWC_STARTUP_BENCHMARK"):
+            _report_first_paint(root)
+
+        # Refresh the difficulty lookup from SMWC in the background
+        _start_difficulty_lookup_refresh(root, config_manager)
+
         # Add keyboard shortcut for clearing log
         root.bind("<Control-l>", lambda e: clear_log_shortcut(root))
 
         # Add cleanup handler for when app closes
         def on_closing():
             # Force save any pending changes in collection
-            if hasattr(root, 'navigation') and hasattr(root.navigation, 'page_manager'):
-                pages = root.navigation.page_manager.pages
-                if 'Collection' in pages:
-                    collection_page = pages['Collection']
-                    if hasattr(collection_page, 'cleanup'):
-                        collection_page.cleanup()
+            # (page_manager.pages holds frames; the page objects live on the layout)
+            main_layout = getattr(root, 'main_layout', None)
+            collection_page = getattr(main_layout, 'collection_page', None)
+            if collection_page is not None and hasattr(collection_page, 'cleanup'):
+                try:
+                    collection_page.cleanup()
+                except Exception as e:
+                    print(f"Error cleaning up collection page: {e}")
+
+            # Saves (pipeline and delayed collection edits) only queue work on the
+            # persistence worker, and os._exit below skips its atexit flush -
+            # write everything still queued now
+            try:
+                from persistence_worker import get_persistence_worker
+                get_persistence_worker().flush()
+            except Exception as e:
+                print(f"Error saving pending changes on exit: {e}")
 
             # Aggressive thread cleanup to prevent shutdown errors
             try:
@@ -923,39 +1054,6 @@ def main():
         except ImportError:
             pass  # No migration manager
 
-        # Quick multi-type migration check (silent, fast)
-        try:
-            from api_pipeline import load_processed, save_processed
-            from download_state_manager import set_download_active
-            
-            processed = load_processed()
-            needs_multi_type_update = False
-            needs_obsolete_update = False
-
-            for hack_id, hack_data in processed.items():
-                if isinstance(hack_data, dict):
-                    # Multi-type migration
-                    if "hack_type" in hack_data and "hack_types" not in hack_data:
-                        # Convert single hack_type to hack_types array
-                        single_type = hack_data["hack_type"]
-                        hack_data["hack_types"] = [single_type] if single_type else ["standard"]
-                        needs_multi_type_update = True
-
-                    # Obsolete field migration
-                    if "obsolete" not in hack_data:
-                        hack_data["obsolete"] = False  # Default existing hacks to not obsolete
-                        needs_obsolete_update = True
-
-            if needs_multi_type_update or needs_obsolete_update:
-                # Lock collection during migration
-                set_download_active(True)
-                try:
-                    save_processed(processed)
-                finally:
-                    set_download_active(False)
-        except Exception:
-            pass  # Ignore migration errors
-
         # Check for updates in background after UI loads
         def check_for_updates_after_startup():
             """Check for updates after the UI has fully loaded"""
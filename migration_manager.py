@@ -22,14 +22,15 @@ class MigrationManager:
         self.json_path = json_path
         self.backup_path = f"{json_path}.pre-v3.1.backup"
         
-    def needs_migration(self):
-        """Check if processed.json needs migration to v3.1 format"""
-        if not os.path.exists(self.json_path):
+    def needs_migration(self, data=None):
+        """Check if processed.json (or its already loaded data) needs migration to v3.1 format"""
+        if data is None and not os.path.exists(self.json_path):
             return False
             
         try:
-            with open(self.json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if data is None:
+                with open(self.json_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
             
             # Check if any hack is missing v3.0 or v3.1 fields
             for hack_id, hack_data in data.items():
@@ -240,55 +241,34 @@ class MigrationManager:
         set_progress_max(total_hacks + 50)  # Add some for API pages
         add_log(f"📊 Found {total_hacks} hacks to migrate")
         
-        # First, fetch all hack metadata from SMWC API in bulk
-        set_progress("Fetching hack metadata from SMWC API...")
-        add_log("🌐 Fetching hack metadata from SMWC API...")
+        # First, bring the shared hack catalog up to date (delta sync, or nothing if fresh)
+        set_progress("Syncing hack catalog with SMWC API...")
+        add_log("🌐 Syncing local hack catalog with SMWC API...")
         
-        from api_pipeline import fetch_hack_list
-        api_metadata = {}
-        hack_ids = set(data.keys())
+        from hack_catalog import get_hack_catalog
+        catalog = get_hack_catalog()
+        catalog.sync(log=add_log)
+        set_progress_value(50)
         
-        # Use bulk API fetching like bulk_api_migrate.py
-        page = 1
+        # Join the catalog to our hacks by id
+        api_metadata = {}
         total_fetched = 0
-        while True:
-            config = {}  # Empty config = no filters
-            response = fetch_hack_list(config, page=page)
-            
-            if not response or not response.get("data"):
-                break
-            
-            hacks = response["data"]
-            page_matches = 0
-            
-            for hack in hacks:
-                hack_id = str(hack.get("id", ""))
-                if hack_id in hack_ids:  # Only process hacks we have
-                    raw_fields = hack.get("raw_fields", {})
-                    
-                    api_metadata[hack_id] = {
-                        "hall_of_fame": bool(raw_fields.get("hof", 0)),
-                        "sa1_compatibility": bool(raw_fields.get("sa1", 0)),
-                        "collaboration": bool(raw_fields.get("collab", 0)),
-                        "demo": bool(raw_fields.get("demo", 0)),
-                        # v3.1 OPTIMIZED: Extract exits and authors from page data instead of individual API calls
-                        "length": raw_fields.get("length", 0),  # exits count
-                        "authors": hack.get("authors", []),     # authors array
-                        "basic_fetched": True
-                    }
-                    total_fetched += 1
-                    page_matches += 1
-            
-            # Update progress and log
-                    set_progress_value(min(page, 50))
-            add_log(f"📄 Page {page}: Found {page_matches} matching hacks")
-            
-            # Check if we're on the last page
-            if page >= response.get("last_page", 1):
-                break
-            
-            page += 1
-            time.sleep(0.5)  # Small delay between pages
+        for hack_id in data:
+            hack = catalog.get(hack_id)
+            if hack is None:
+                continue
+            raw_fields = hack.get("raw_fields", {})
+            api_metadata[hack_id] = {
+                "hall_of_fame": bool(raw_fields.get("hof", 0)),
+                "sa1_compatibility": bool(raw_fields.get("sa1", 0)),
+                "collaboration": bool(raw_fields.get("collab", 0)),
+                "demo": bool(raw_fields.get("demo", 0)),
+                # v3.1 OPTIMIZED: Extract exits and authors from page data instead of individual API calls
+                "length": raw_fields.get("length", 0),  # exits count
+                "authors": hack.get("authors", []),     # authors array
+                "basic_fetched": True
+            }
+            total_fetched += 1
         
         add_log(f"🎯 Fetched metadata for {total_fetched} hacks from API")
         
@@ -652,119 +632,30 @@ class MigrationManager:
         return migrated_count
 
 
-def needs_v48_migration():
-    """Check if processed.json needs migration to v4.8 format (current_difficulty field)"""
-    from utils import PROCESSED_JSON_PATH
-    
-    if not os.path.exists(PROCESSED_JSON_PATH):
-        return False
-    
-    try:
-        with open(PROCESSED_JSON_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        # Check if any hack is missing current_difficulty field
-        for hack_id, hack_data in data.items():
-            if isinstance(hack_data, dict):
-                # If has difficulty but no current_difficulty, needs migration
-                if "difficulty" in hack_data and "current_difficulty" not in hack_data:
-                    return True
-        
-        return False
-    except Exception:
-        return False
-
-
-def migrate_to_v48():
-    """
-    Migrate processed.json to v4.8 format.
-    Adds current_difficulty and difficulty_id fields for compatibility with new system.
-    """
-    from utils import PROCESSED_JSON_PATH, DIFFICULTY_LOOKUP
-    
-    if not os.path.exists(PROCESSED_JSON_PATH):
-        return {"success": False, "message": "processed.json not found"}
-    
-    # Lock collection during migration
-    try:
-        from download_state_manager import set_download_active
-        set_download_active(True)
-    except ImportError:
-        pass  # Module may not be loaded yet during early startup
-    
-    try:
-        # Load data
-        with open(PROCESSED_JSON_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        # Create backup
-        backup_path = f"{PROCESSED_JSON_PATH}.pre-v4.8.backup"
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Create reverse mapping: difficulty_name -> difficulty_id
-        name_to_id = {}
-        for diff_id, diff_name in DIFFICULTY_LOOKUP.items():
-            if diff_name:
-                name_to_id[diff_name] = diff_id
-        
-        # Add backward compatibility mappings
-        name_to_id["Skilled"] = "diff_3"  # Old name for Intermediate
-        
-        migrated_count = 0
-        
-        for hack_id, hack_data in data.items():
-            if not isinstance(hack_data, dict):
-                continue
-            
-            # Get the old difficulty field
-            difficulty = hack_data.get("difficulty", "")
-            
-            # If missing current_difficulty, copy from difficulty
-            if "current_difficulty" not in hack_data and difficulty:
-                hack_data["current_difficulty"] = difficulty
-                migrated_count += 1
-            
-            # If missing difficulty_id, try to add it
-            if "difficulty_id" not in hack_data:
-                current_diff = hack_data.get("current_difficulty", difficulty)
-                if current_diff and current_diff in name_to_id:
-                    hack_data["difficulty_id"] = name_to_id[current_diff]
-        
-        # Save updated data
-        with open(PROCESSED_JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        return {
-            "success": True,
-            "migrated_count": migrated_count,
-            "message": f"Successfully migrated {migrated_count} hacks to v4.8 format"
-        }
-        
-    except Exception as e:
-        return {"success": False, "message": f"Migration failed: {str(e)}"}
-    finally:
-        # Unlock collection
-        try:
-            from download_state_manager import set_download_active
-            set_download_active(False)
-        except ImportError:
-            pass
-
-
 # Global function for easy access
 def check_and_migrate(root, callback=None):
-    """Check if migration is needed and run it if necessary"""
+    """Check if migration is needed and run it if necessary
+
+    A current schema stamp (see schema_migrations) skips every check.
+    Otherwise processed.json is read once: the v3.1 check and all pending
+    silent migrations work on that same data, which is saved once.
+    """
     try:
-        # Check for v4.8 migration first (silent, fast)
-        if needs_v48_migration():
-            result = migrate_to_v48()
-            if result.get("success"):
-                print(f"✅ v4.8 Migration: {result.get('message')}")
+        from schema_migrations import is_schema_current, run_pending_migrations
+        if is_schema_current():
+            if callback:
+                callback()
+            return True
         
         migration_manager = MigrationManager()
+        from utils import load_processed
+        data = load_processed(migration_manager.json_path)
+        
+        # Check before the silent steps - they add fields the v3.1 check looks at
+        needs_migration = migration_manager.needs_migration(data)
         
-        needs_migration = migration_manager.needs_migration()
+        # The v3.1 upgrade leaves steps to re-apply, so stamp only without it
+        run_pending_migrations(migration_manager.json_path, data=data, stamp=not needs_migration)
         
         if needs_migration:
             if migration_manager.show_migration_dialog(root):
@@ -11,6 +11,7 @@ import glob
 from pathlib import Path
 from patcher_ips import Patch as IPSPatch
 from patcher_bps import Patch as BPSPatch
+import tracer
 
 class PatchHandler:
     @staticmethod
@@ -60,6 +61,12 @@ class PatchHandler:
     @staticmethod
     def apply_patch(patch_path, source_rom_path, output_path, log=None):
         """Apply a patch (IPS or BPS) to a ROM"""
+        with tracer.span("apply_patch", "patch", patch=os.path.basename(patch_path)) as span_args:
+            span_args["success"] = PatchHandler._apply_patch(patch_path, source_rom_path, output_path, log)
+            return span_args["success"]
+
+    @staticmethod
+    def _apply_patch(patch_path, source_rom_path, output_path, log=None):
         patch_ext = Path(patch_path).suffix.lower()
 
         # Reject files that don't carry the correct magic bytes — this blocks
@@ -0,0 +1,133 @@
+"""
+Persistence Worker
+One long-lived writer thread for processed.json and the collection journal
+
+Writes are queued under a key; a newer write for the same key replaces the
+pending one, so bursts of edits or pipeline saves cost one write. Each write
+may wait up to its delay for more changes to coalesce, but never longer than
+MAX_LATENCY_SECONDS after it was first queued. flush() is a barrier that
+writes everything queued so far before returning. Because every write runs on
+this one thread, UI edits and pipeline saves never overlap on disk.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import atexit
+import threading
+import time
+
+# Longest a queued write may be postponed by newer writes to the same key
+MAX_LATENCY_SECONDS = 10.0
+
+_shared_worker = None
+_shared_lock = threading.Lock()
+
+
+def get_persistence_worker():
+    """Get the process-wide persistence worker (flushed at interpreter exit)"""
+    global _shared_worker
+    with _shared_lock:
+        if _shared_worker is None:
+            _shared_worker = PersistenceWorker()
+            atexit.register(_shared_worker.flush)
+        return _shared_worker
+
+
+class _Write:
+    __slots__ = ("key", "func", "due", "deadline", "done")
+
+    def __init__(self, key, func, due, deadline):
+        self.key = key
+        self.func = func
+        self.due = due
+        self.deadline = deadline
+        self.done = threading.Event()
+
+
+class PersistenceWorker:
+    """Coalescing single-thread writer"""
+
+    def __init__(self, max_latency=MAX_LATENCY_SECONDS):
+        self.max_latency = max_latency
+        self._pending = {}  # key -> _Write, in submission order
+        self._running = None
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, key, func, delay=0.0):
+        """Queue func() to run on the writer thread after delay seconds
+
+        Replaces a pending write with the same key (its latency deadline is kept).
+        """
+        now = time.monotonic()
+        with self._condition:
+            write = self._pending.get(key)
+            if write is None:
+                write = self._pending[key] = _Write(key, func, now + delay, now + max(delay, self.max_latency))
+            else:
+                write.func = func
+                write.due = min(now + delay, write.deadline)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="persistence-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self, key):
+        """Drop a pending write that hasn't started"""
+        with self._condition:
+            write = self._pending.pop(key, None)
+        if write is not None:
+            write.done.set()
+
+    def is_pending(self, key):
+        with self._condition:
+            return key in self._pending or (self._running is not None and self._running.key == key)
+
+    def flush(self, timeout=None):
+        """Run every queued write now and wait until they (and the current one) finish
+
+        Returns False if timeout expired first. Safe to call from the writer
+        thread itself, where it only hurries the queue along.
+        """
+        with self._condition:
+            waiting = list(self._pending.values())
+            if self._running is not None:
+                waiting.append(self._running)
+            if not waiting:
+                return True
+            now = time.monotonic()
+            for write in self._pending.values():
+                write.due = now
+            self._condition.notify()
+        if threading.current_thread() is self._thread:
+            return True
+
+        end = None if timeout is None else time.monotonic() + timeout
+        for write in waiting:
+            remaining = None if end is None else max(0.0, end - time.monotonic())
+            if not write.done.wait(remaining):
+                return False
+        return True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    due = [write for write in self._pending.values() if write.due <= now]
+                    if due:
+                        break
+                    wait = min((write.due for write in self._pending.values()), default=None)
+                    self._condition.wait(None if wait is None else wait - now)
+                write = due[0]
+                del self._pending[write.key]
+                self._running = write
+            try:
+                write.func()
+            except Exception as e:
+                print(f"❌ Background write failed ({write.key}): {e}")
+            finally:
+                with self._condition:
+                    self._running = None
+                write.done.set()
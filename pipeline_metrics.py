@@ -0,0 +1,270 @@
+"""
+Pipeline Metrics
+Per-stage timing events for pipeline runs with an end-of-run performance report
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import tracer
+from utils import get_user_data_path
+
+METRICS_DIR = get_user_data_path("metrics")
+MAX_SAVED_RUNS = 20
+
+# The run being measured on the current thread, so helpers such as
+# smwc_api_get can report stages without threading a metrics object through
+_local = threading.local()
+_listeners = []
+
+
+def current():
+    """Get the RunMetrics active on this thread, or None"""
+    return getattr(_local, "metrics", None)
+
+
+def register_listener(callback):
+    """Register a callback(run_name, event) called for every recorded event"""
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def unregister_listener(callback):
+    """Unregister an event listener"""
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def record(stage, start, end=None, hack_id=None, bytes=0, outcome="ok"):
+    """Record an event on the active run (only traced when nothing is being measured)"""
+    metrics = current()
+    if metrics:
+        metrics.record(stage, start, end, hack_id=hack_id, bytes=bytes, outcome=outcome)
+    else:
+        tracer.complete_monotonic(stage, start, end, args={"bytes": bytes, "outcome": outcome})
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class RunMetrics:
+    """Collects timing events for a single run
+
+    Events carry monotonic start/end timestamps, a byte count and an outcome.
+    Use as a context manager to make the run active on the current thread and
+    log + export the summary when it ends.
+    """
+
+    def __init__(self, run_name, log=None, export=True):
+        self.run_name = run_name
+        self.log = log
+        self.export = export
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.start = time.monotonic()
+        self.end = None
+        self.events = []
+        self._hack_starts = {}
+        self._lock = threading.Lock()
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = current()
+        _local.metrics = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _local.metrics = self._previous
+        self.finish()
+        self.report()
+        tracer.flush(self.run_name, log=self.log)
+        return False
+
+    def record(self, stage, start, end=None, hack_id=None, bytes=0, outcome="ok"):
+        """Record a finished stage using time.monotonic() timestamps"""
+        if end is None:
+            end = time.monotonic()
+        event = {
+            "stage": stage,
+            "hack_id": str(hack_id) if hack_id is not None else None,
+            "start": start,
+            "end": end,
+            "duration": end - start,
+            "bytes": bytes or 0,
+            "outcome": outcome,
+        }
+        with self._lock:
+            self.events.append(event)
+        tracer.complete_monotonic(stage, start, end, category=self.run_name,
+                                  args={"hack_id": event["hack_id"], "bytes": event["bytes"], "outcome": outcome})
+        for callback in _listeners.copy():
+            try:
+                callback(self.run_name, event)
+            except Exception as e:
+                print(f"Error in metrics listener: {e}")
+        return event
+
+    @contextmanager
+    def stage(self, stage, hack_id=None):
+        """Time a block of code. The yielded dict can be used to set bytes/outcome."""
+        info = {"bytes": 0, "outcome": "ok"}
+        start = time.monotonic()
+        try:
+            yield info
+        except BaseException:
+            info["outcome"] = "error"
+            raise
+        finally:
+            self.record(stage, start, hack_id=hack_id, bytes=info["bytes"], outcome=info["outcome"])
+
+    def begin_hack(self, hack_id):
+        """Mark the start of processing for a hack"""
+        self._hack_starts[str(hack_id)] = time.monotonic()
+
+    def end_hack(self, hack_id, outcome, bytes=0):
+        """Record the per-hack event (outcome: downloaded, skipped, moved, failed...)"""
+        start = self._hack_starts.pop(str(hack_id), None)
+        if start is not None:
+            self.record("hack", start, hack_id=hack_id, bytes=bytes, outcome=outcome)
+
+    def final_outcomes(self):
+        """Count hacks by the outcome of their last attempt (retries replace earlier failures)"""
+        with self._lock:
+            last = {e["hack_id"]: e["outcome"] for e in self.events if e["stage"] == "hack"}
+        counts = {}
+        for outcome in last.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        return counts
+
+    def finish(self):
+        if self.end is None:
+            self.end = time.monotonic()
+
+    def summary(self):
+        """Aggregate events into per-stage statistics"""
+        end = self.end if self.end is not None else time.monotonic()
+        elapsed = max(end - self.start, 1e-9)
+
+        with self._lock:
+            events = list(self.events)
+
+        stages = {}
+        for event in events:
+            stages.setdefault(event["stage"], []).append(event)
+
+        stage_stats = {}
+        for name, stage_events in stages.items():
+            durations = sorted(e["duration"] for e in stage_events)
+            total = sum(durations)
+            total_bytes = sum(e["bytes"] for e in stage_events)
+            outcomes = {}
+            for e in stage_events:
+                outcomes[e["outcome"]] = outcomes.get(e["outcome"], 0) + 1
+            stage_stats[name] = {
+                "count": len(stage_events),
+                "total_seconds": total,
+                "p50_seconds": _percentile(durations, 50),
+                "p95_seconds": _percentile(durations, 95),
+                "max_seconds": durations[-1],
+                "bytes": total_bytes,
+                "bytes_per_second": total_bytes / total if total > 0 else 0.0,
+                "outcomes": outcomes,
+            }
+
+        hack_events = stages.get("hack", [])
+        download_bytes = sum(e["bytes"] for e in stages.get("download", []))
+        download_bytes += sum(e["bytes"] for e in stages.get("upload", []))
+        return {
+            "run": self.run_name,
+            "started_at": self.started_at,
+            "elapsed_seconds": elapsed,
+            "hacks": len(hack_events),
+            "hacks_per_minute": len(hack_events) / (elapsed / 60.0),
+            "bytes": download_bytes,
+            "bytes_per_second": download_bytes / elapsed,
+            "stages": stage_stats,
+        }
+
+    def format_summary(self, summary=None):
+        """Render the summary as a list of table lines"""
+        summary = summary or self.summary()
+        lines = [
+            f"📊 {self.run_name}: {summary['elapsed_seconds']:.1f}s, {summary['hacks']} hacks "
+            f"({summary['hacks_per_minute']:.1f}/min), {_format_bytes(summary['bytes'])} "
+            f"({_format_bytes(summary['bytes_per_second'])}/s)",
+            f"{'Stage':<16}{'Count':>7}{'Total':>10}{'p50':>10}{'p95':>10}{'Bytes/s':>12}",
+        ]
+        ordered = sorted(summary["stages"].items(), key=lambda item: item[1]["total_seconds"], reverse=True)
+        for name, stats in ordered:
+            rate = _format_bytes(stats["bytes_per_second"]) + "/s" if stats["bytes"] else "-"
+            lines.append(
+                f"{name:<16}{stats['count']:>7}{stats['total_seconds']:>9.2f}s"
+                f"{stats['p50_seconds'] * 1000:>8.0f}ms{stats['p95_seconds'] * 1000:>8.0f}ms{rate:>12}"
+            )
+        return lines
+
+    def report(self):
+        """Log the summary table and export it as JSON"""
+        if not self.events:
+            return None
+        summary = self.summary()
+        if self.log:
+            for line in self.format_summary(summary):
+                self.log(line, "Information")
+        if not self.export:
+            return None
+        path = self.export_json(summary=summary)
+        if path and self.log:
+            self.log(f"📊 Performance report saved to {path}", "Debug")
+        return path
+
+    def export_json(self, path=None, summary=None):
+        """Write summary + raw events to JSON for comparing runs"""
+        try:
+            if path is None:
+                os.makedirs(METRICS_DIR, exist_ok=True)
+                stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                path = os.path.join(METRICS_DIR, f"{self.run_name}_{stamp}.json")
+                _prune_old_reports()
+            with self._lock:
+                events = [dict(e, start=e["start"] - self.start, end=e["end"] - self.start) for e in self.events]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"summary": summary or self.summary(), "events": events}, f, indent=2)
+            return path
+        except Exception as e:
+            if self.log:
+                self.log(f"⚠️ Could not save performance report: {e}", "Warning")
+            return None
+
+
+def _prune_old_reports():
+    """Keep only the most recent MAX_SAVED_RUNS reports"""
+    try:
+        reports = sorted(
+            (os.path.join(METRICS_DIR, name) for name in os.listdir(METRICS_DIR) if name.endswith(".json")),
+            key=os.path.getmtime
+        )
+        for old in reports[:-(MAX_SAVED_RUNS - 1)]:
+            os.remove(old)
+    except Exception:
+        pass
+
+
+def _format_bytes(value):
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024.0
+    return f"{value:.1f}GB"
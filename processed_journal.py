@@ -0,0 +1,215 @@
+"""
+Processed Journal
+Append-only edit journal and rotating compressed backups for processed.json
+
+Collection edits (ratings, notes, completion...) are appended to
+processed.json.journal as one JSON line per record instead of rewriting the
+whole library. Readers replay the journal on top of processed.json; the
+owning HackDataManager folds it back in (compaction) once it grows.
+
+Every entry carries a sequence number. A full save_processed write of data
+read with load_processed supersedes the entries that were replayed into it
+(supersede_journal), so a field edited in the collection doesn't keep
+overriding later pipeline writes until the next compaction.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import glob
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+
+JOURNAL_SUFFIX = ".journal"
+
+# Compressed backups are taken before processed.json is rewritten, at most
+# once per interval, keeping the newest few
+BACKUP_INTERVAL_SECONDS = 6 * 3600
+BACKUP_KEEP = 5
+
+# Appends and trims of the journal file, and the last sequence number handed out
+_journal_lock = threading.Lock()
+_last_seq = 0
+
+
+class ReplayedData(dict):
+    """processed.json contents with the journal replayed
+
+    journal_seq is the sequence number of the newest entry replayed into it;
+    writing this data back supersedes that entry and every older one.
+    """
+    journal_seq = 0
+
+
+def _next_seq():
+    """Sequence number for a new entry: wall-clock ns, strictly increasing (caller holds _journal_lock)"""
+    global _last_seq
+    _last_seq = max(time.time_ns(), _last_seq + 1)
+    return _last_seq
+
+
+def entry_seq(entry):
+    """Sequence number of a journal entry (entries written before sequencing count as 0)"""
+    seq = entry.get("seq", 0)
+    return seq if isinstance(seq, int) else 0
+
+
+def journal_path(path):
+    return path + JOURNAL_SUFFIX
+
+
+def read_journal(path):
+    """Read the journal entries for processed.json at path, oldest first
+
+    A torn last line (crash mid-append) is skipped.
+    """
+    entries = []
+    try:
+        with open(journal_path(path), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and "id" in entry and isinstance(entry.get("fields"), dict):
+                    entries.append(entry)
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def apply_journal(path, data):
+    """Replay the journal onto data (processed.json contents) in place
+
+    Returns {hack_id: {field: (seq, value)}} for the journaled fields of
+    records that exist in data, the number of journal entries read and the
+    newest entry's sequence number.
+    """
+    global _last_seq
+    with _journal_lock:
+        entries = read_journal(path)
+    applied = {}
+    last_seq = 0
+    for entry in entries:
+        seq = entry_seq(entry)
+        last_seq = max(last_seq, seq)
+        hack_id = str(entry["id"])
+        record = data.get(hack_id)
+        if isinstance(record, dict):
+            record.update(entry["fields"])
+            fields = applied.setdefault(hack_id, {})
+            for field, value in entry["fields"].items():
+                fields[field] = (seq, value)
+    with _journal_lock:
+        # Keep new entries ordered after these even if the clock stepped back
+        _last_seq = max(_last_seq, last_seq)
+    return applied, len(entries), last_seq
+
+
+def superseded_seq(data):
+    """Sequence number up to which a full write of data supersedes the journal
+
+    That is the newest entry replayed into it for load_processed data, and
+    every entry so far for data built some other way.
+    """
+    if isinstance(data, ReplayedData):
+        return data.journal_seq
+    with _journal_lock:
+        return max(time.time_ns(), _last_seq)
+
+
+def append_journal(path, records):
+    """Append {hack_id: {field: value}} to the journal and flush it to disk
+
+    Returns the sequence number stamped on the entries (None if there were none).
+    """
+    if not records:
+        return None
+    with _journal_lock:
+        seq = _next_seq()
+        lines = "".join(json.dumps({"id": hack_id, "seq": seq, "fields": fields}, ensure_ascii=False) + "\n"
+                        for hack_id, fields in records.items())
+        with open(journal_path(path), "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+    return seq
+
+
+def supersede_journal(path, seq):
+    """Drop the entries with a sequence number up to seq
+
+    Called once processed.json has been rewritten from data that already held
+    them; newer entries (edits made after that data was read) are kept.
+    """
+    with _journal_lock:
+        entries = read_journal(path)
+        kept = [entry for entry in entries if entry_seq(entry) > seq]
+        if len(kept) == len(entries):
+            return
+        if kept:
+            write_text_atomic(journal_path(path), "".join(
+                json.dumps(entry, ensure_ascii=False) + "\n" for entry in kept))
+        else:
+            try:
+                os.remove(journal_path(path))
+            except FileNotFoundError:
+                pass
+
+
+def discard_journal(path):
+    """Remove the journal once processed.json holds everything in it"""
+    with _journal_lock:
+        try:
+            os.remove(journal_path(path))
+        except FileNotFoundError:
+            pass
+
+
+def write_json_atomic(path, data, indent=2):
+    """Write data as JSON via a temp file and rename, so readers never see a partial file"""
+    write_text_atomic(path, json.dumps(data, indent=indent))
+
+
+def write_text_atomic(path, text):
+    """Write already-serialized text via a temp file and rename"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _backup_paths(path):
+    """Existing compressed backups of path, oldest first"""
+    return sorted(glob.glob(glob.escape(path) + ".*.backup.gz"))
+
+
+def rotate_backup(path, interval=BACKUP_INTERVAL_SECONDS, keep=BACKUP_KEEP):
+    """Gzip a copy of path if the newest backup is older than interval
+
+    Backups are named <path>.<YYYYmmdd-HHMMSS>.backup.gz; only the newest
+    keep are retained. Returns the new backup's path, or None if none was due.
+    """
+    if not os.path.exists(path):
+        return None
+    backups = _backup_paths(path)
+    if backups and time.time() - os.path.getmtime(backups[-1]) < interval:
+        return None
+
+    backup_path = f"{path}.{time.strftime('%Y%m%d-%H%M%S')}.backup.gz"
+    with open(path, "rb") as src, gzip.open(backup_path, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+
+    backups = _backup_paths(path)
+    for old_path in backups[:-keep] if keep > 0 else backups:
+        try:
+            os.remove(old_path)
+        except OSError:
+            pass
+    return backup_path
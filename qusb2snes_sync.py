@@ -13,6 +13,10 @@ import os
 import time
 from typing import List, Dict, Optional, Callable
 
+import pipeline_metrics
+import tracer
+from pipeline_metrics import RunMetrics
+
 try:
     import websockets
 except ImportError:
@@ -410,6 +414,7 @@ class QUSB2SNESSync:
     
     async def list_directory(self, path: str) -> List[Dict]:
         """List remote directory contents with SD2SNES-safe delays and retry logic"""
+        list_start = time.monotonic()
         try:
             # Add delay before directory listing (SD2SNES requirement)
             # Increased delay to prevent firmware overload after large uploads
@@ -436,9 +441,11 @@ class QUSB2SNESSync:
             # Add delay after directory listing (SD2SNES requirement)
             # Increased delay to prevent firmware overload after large uploads
             await asyncio.sleep(1.0)
+            pipeline_metrics.record("list", list_start)
             return items
             
         except Exception as e:
+            pipeline_metrics.record("list", list_start, outcome="error")
             # If listing fails, directory likely doesn't exist
             # SD2SNES closes connection on non-existent directory listing
             self.log_error(f"❌ Failed to list directory {path}: {str(e)}")
@@ -490,6 +497,7 @@ class QUSB2SNESSync:
     async def upload_file(self, local_path: str, remote_path: str) -> bool:
         """Upload file to remote location with connection recovery"""
         max_retries = 2  # Files uploads are more expensive, fewer retries
+        upload_start = time.monotonic()
         
         for attempt in range(max_retries):
             try:
@@ -565,11 +573,13 @@ class QUSB2SNESSync:
                 
                 # Note: Individual file verification removed for performance
                 # Folder-level verification happens after all files in a folder are uploaded
+                pipeline_metrics.record("upload", upload_start, bytes=bytes_sent)
                 return True
                 
             except Exception as e:
                 if attempt == max_retries - 1:
                     self.log_error(f"❌ Upload failed for {local_path} after {max_retries} attempts: {str(e)}")
+                    pipeline_metrics.record("upload", upload_start, outcome="failed")
                     return False
                 
                 self.log_progress(f"⚠️ Upload attempt {attempt + 1} failed for {os.path.basename(local_path)}: {str(e)}, retrying...")
@@ -1032,6 +1042,12 @@ class QUSB2SNESSync:
 
     async def _send_command(self, opcode: str, space: str = "SNES", operands: List[str] = None, timeout: float = None) -> Optional[Dict]:
         """Send command to QUSB2SNES with proper logging and response handling"""
+        with tracer.span(opcode, "qusb2snes", operands=operands) as span_args:
+            result = await self._dispatch_command(opcode, space, operands, timeout)
+            span_args["ok"] = result is not None
+            return result
+
+    async def _dispatch_command(self, opcode: str, space: str = "SNES", operands: List[str] = None, timeout: float = None) -> Optional[Dict]:
         if not self.connected or not self.websocket:
             raise Exception("Not connected to QUSB2SNES")
         
@@ -1115,6 +1131,10 @@ class QUSB2SNESSyncManager:
         if self.on_error:
             self.on_error(message)
     
+    def _log_metrics(self, message: str, level: str = "Information"):
+        """Adapter so RunMetrics can report through the progress callback"""
+        self.log_progress(message)
+    
     def cancel_operation(self):
         """Cancel the current sync operation"""
         self.cancelled = True
@@ -1170,7 +1190,8 @@ class QUSB2SNESSyncManager:
             return False
 
         # Use the new tree-based sync approach with timestamp
-        return await self.sync_client.sync_directory_tree_based(local_rom_dir, self.remote_folder, last_sync_timestamp)
+        with RunMetrics("qusb2snes_sync", self._log_metrics):
+            return await self.sync_client.sync_directory_tree_based(local_rom_dir, self.remote_folder, last_sync_timestamp)
     
     async def sync_roms_incremental(self, local_rom_dir: str, progress_tracker: Dict = None, cleanup_deleted: bool = False, last_sync_timestamp: float = 0) -> Dict:
         """
@@ -1195,12 +1216,13 @@ class QUSB2SNESSyncManager:
         # Delegate to the sync client's tree-based sync method
         try:
             # Use the tree-based sync with cleanup
-            result = await self.sync_client.sync_directory_tree_based(
-                local_rom_dir, 
-                self.remote_folder, 
-                last_sync_timestamp,  # Pass the actual timestamp
-                cleanup_deleted
-            )
+            with RunMetrics("qusb2snes_sync", self._log_metrics):
+                result = await self.sync_client.sync_directory_tree_based(
+                    local_rom_dir, 
+                    self.remote_folder, 
+                    last_sync_timestamp,  # Pass the actual timestamp
+                    cleanup_deleted
+                )
             
             return {
                 "success": result,
@@ -0,0 +1,138 @@
+"""
+Record Normalization
+String interning and the author table for processed.json records
+
+Difficulty labels, type keys, dates and author names repeat across thousands
+of records; json.load gives every occurrence its own string object. Records
+are normalized as they are loaded or synced: enum-like strings are interned
+so equal values share one object. Stored values are never reshaped - authors
+keep whatever form the pipeline stored (a plain string, a list of names or
+the API's [{id, name}] objects); normalize_authors turns any of them into a
+list of names for the author table and the view rows.
+
+AuthorTable maps author ids to names and hacks both ways, so "hacks by this
+author" and the author filter are lookups over the distinct author names
+instead of scans over every record.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import sys
+import threading
+
+# Fields holding one of a small set of values (or a date), interned on load
+INTERNED_FIELDS = ("current_difficulty", "difficulty", "hack_type", "type", "completed_date", "date")
+
+
+def normalize_authors(authors):
+    """Return authors as a list of names
+
+    Accepts a list of names, the API's [{"id": ..., "name": ...}] objects or
+    a comma-separated string (as the collection editor splits it).
+    """
+    if isinstance(authors, str):
+        authors = authors.split(",")
+    elif not isinstance(authors, list):
+        return []
+    names = []
+    for author in authors:
+        if isinstance(author, dict):
+            author = author.get("name")
+        if isinstance(author, str):
+            author = author.strip()
+            if author:
+                names.append(sys.intern(author))
+    return names
+
+
+def normalize_record(hack_data):
+    """Intern enum-like strings of one record in place (values are unchanged)"""
+    for field in INTERNED_FIELDS:
+        value = hack_data.get(field)
+        if type(value) is str:
+            hack_data[field] = sys.intern(value)
+    hack_types = hack_data.get("hack_types")
+    if isinstance(hack_types, list):
+        hack_data["hack_types"] = [sys.intern(t) if type(t) is str else t for t in hack_types]
+    authors = hack_data.get("authors")
+    # Only plain name lists are interned; other shapes (API dicts with ids,
+    # comma-separated strings) are left exactly as stored
+    if isinstance(authors, list) and all(type(a) is str for a in authors):
+        hack_data["authors"] = [sys.intern(a) for a in authors]
+    return hack_data
+
+
+class AuthorTable:
+    """Author id <-> name table with a many-to-many mapping to hack ids
+
+    Names are matched case-insensitively; the first spelling seen is kept.
+    Safe to read from worker threads while the main thread updates it.
+    """
+
+    def __init__(self):
+        self.names = []        # author id -> display name
+        self._ids = {}         # lowercase name -> author id
+        self._hacks_of = []    # author id -> set of hack ids
+        self._authors_of = {}  # hack id -> tuple of author ids
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._authors_of)
+
+    @classmethod
+    def build(cls, data):
+        """Build from a processed.json-style dict (titled records only)"""
+        table = cls()
+        for hack_id, hack_data in data.items():
+            table.set(hack_id, hack_data)
+        return table
+
+    def _author_id(self, name):
+        key = name.lower()
+        author_id = self._ids.get(key)
+        if author_id is None:
+            author_id = self._ids[key] = len(self.names)
+            self.names.append(name)
+            self._hacks_of.append(set())
+        return author_id
+
+    def set(self, hack_id, hack_data):
+        """Index (or re-index) one record; non-titled or missing records are removed"""
+        with self._lock:
+            for author_id in self._authors_of.pop(hack_id, ()):
+                self._hacks_of[author_id].discard(hack_id)
+            if not (isinstance(hack_data, dict) and "title" in hack_data):
+                return
+            author_ids = tuple(dict.fromkeys(
+                self._author_id(name) for name in normalize_authors(hack_data.get("authors", []))))
+            self._authors_of[hack_id] = author_ids
+            for author_id in author_ids:
+                self._hacks_of[author_id].add(hack_id)
+
+    def authors_of(self, hack_id):
+        """Author names of one hack"""
+        with self._lock:
+            return [self.names[author_id] for author_id in self._authors_of.get(hack_id, ())]
+
+    def hacks_by(self, name):
+        """Hack ids credited to the author with exactly this name (case-insensitive)"""
+        with self._lock:
+            author_id = self._ids.get(name.strip().lower())
+            return set(self._hacks_of[author_id]) if author_id is not None else set()
+
+    def hacks_matching(self, query):
+        """Hack ids with an author whose name contains query (case-insensitive)"""
+        query = query.strip().lower()
+        with self._lock:
+            matched = set()
+            for key, author_id in self._ids.items():
+                if query in key:
+                    matched.update(self._hacks_of[author_id])
+            return matched
+
+    def author_counts(self):
+        """{author name: number of hacks}, for authors with at least one hack"""
+        with self._lock:
+            return {self.names[author_id]: len(hacks)
+                    for author_id, hacks in enumerate(self._hacks_of) if hacks}
@@ -0,0 +1,194 @@
+"""
+Retry Queue
+Persists hacks that failed to download or patch so they can be retried later
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import errno
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+from utils import get_user_data_path
+
+RETRY_QUEUE_PATH = get_user_data_path("retry_queue.json")
+
+# Failure reason codes
+REASON_NETWORK = "network"                  # Connection reset, DNS, timeout...
+REASON_SERVER = "server_error"              # HTTP 429 / 5xx from SMWC
+REASON_NOT_FOUND = "not_found"              # HTTP 4xx (file removed, bad link)
+REASON_BAD_ARCHIVE = "bad_archive"          # Truncated or corrupt download
+REASON_NO_DOWNLOAD_URL = "no_download_url"
+REASON_NO_PATCH = "no_patch_in_archive"
+REASON_PATCH_FAILED = "patch_failed"
+REASON_DISK_BUSY = "disk_busy"             # File locked/busy (antivirus scan, sync client...)
+REASON_DISK = "disk_error"                  # Permissions, missing path, disk full...
+REASON_UNKNOWN = "unknown"
+
+# Reasons worth retrying automatically - everything else needs user attention
+TRANSIENT_REASONS = {REASON_NETWORK, REASON_SERVER, REASON_BAD_ARCHIVE, REASON_DISK_BUSY}
+
+# OSError errnos that can clear up between retry rounds
+TRANSIENT_ERRNOS = {errno.EAGAIN, errno.EWOULDBLOCK, errno.EBUSY, errno.EINTR, errno.ETIMEDOUT}
+# Windows sharing/lock violations (file held open by another process)
+TRANSIENT_WINERRORS = {32, 33}
+
+# End-of-run automatic retry settings
+MAX_AUTO_RETRY_ROUNDS = 3
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 30.0
+
+
+class HackProcessingError(Exception):
+    """Error raised by the pipelines with a known failure reason code"""
+
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+
+def classify_failure(error):
+    """Map an exception raised while processing a hack to a reason code"""
+    import zipfile
+
+    if isinstance(error, HackProcessingError):
+        return error.reason
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else 0
+        if status == 429 or status >= 500:
+            return REASON_SERVER
+        return REASON_NOT_FOUND
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return REASON_NETWORK
+    if isinstance(error, requests.RequestException):
+        return REASON_NETWORK
+    if isinstance(error, zipfile.BadZipFile):
+        return REASON_BAD_ARCHIVE
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return REASON_NETWORK
+    if isinstance(error, OSError):
+        if error.errno in TRANSIENT_ERRNOS or getattr(error, "winerror", None) in TRANSIENT_WINERRORS:
+            return REASON_DISK_BUSY
+        return REASON_DISK  # Permission denied, not found, disk full... fail fast
+    return REASON_UNKNOWN
+
+
+def is_transient(reason):
+    """Check if a failure reason is worth retrying automatically"""
+    return reason in TRANSIENT_REASONS
+
+
+def compute_backoff(attempt, base=BACKOFF_BASE_SECONDS, cap=BACKOFF_MAX_SECONDS):
+    """Exponential backoff with full jitter for the given retry attempt (0-based)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def wait_with_cancel(delay, cancel_check=None):
+    """Sleep for delay seconds, waking early if cancel_check() returns True
+
+    Returns:
+        bool: True if the wait completed, False if it was cancelled
+    """
+    deadline = time.monotonic() + delay
+    while True:
+        if cancel_check and cancel_check():
+            return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        time.sleep(min(0.25, remaining))
+
+
+class RetryQueue:
+    """Persistent queue of failed hacks keyed by hack ID"""
+
+    def __init__(self, path=None):
+        self.path = path or RETRY_QUEUE_PATH
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=2)
+        except Exception as e:
+            print(f"Error saving retry queue: {e}")
+
+    def reload(self):
+        """Reload entries from disk"""
+        with self._lock:
+            self.entries = self._load()
+
+    def record_failure(self, hack, reason, message=""):
+        """Add or update a failed hack. The hack dict is stored so it can be re-run later."""
+        hack_id = str(hack.get("id"))
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            entry = self.entries.get(hack_id, {})
+            self.entries[hack_id] = {
+                "hack": hack,
+                "title": hack.get("name", entry.get("title", "Unknown")),
+                "reason": reason,
+                "transient": is_transient(reason),
+                "message": message,
+                "attempts": entry.get("attempts", 0) + 1,
+                "first_failed": entry.get("first_failed", now),
+                "last_failed": now,
+            }
+            self._save()
+        return self.entries[hack_id]
+
+    def discard(self, hack_ids):
+        """Remove resolved hacks from the queue"""
+        with self._lock:
+            removed = 0
+            for hack_id in hack_ids:
+                if self.entries.pop(str(hack_id), None) is not None:
+                    removed += 1
+            if removed:
+                self._save()
+        return removed
+
+    def clear(self):
+        """Remove every entry from the queue"""
+        with self._lock:
+            self.entries = {}
+            self._save()
+
+    def get_transient(self):
+        """Entries that can be retried"""
+        return [e for e in self.entries.values() if e.get("transient")]
+
+    def get_permanent(self):
+        """Entries that need user attention (missing patch, bad link...)"""
+        return [e for e in self.entries.values() if not e.get("transient")]
+
+    def __len__(self):
+        return len(self.entries)
+
+
+_queue = None
+
+
+def get_retry_queue():
+    """Get the shared retry queue instance"""
+    global _queue
+    if _queue is None:
+        _queue = RetryQueue()
+    return _queue
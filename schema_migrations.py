@@ -0,0 +1,209 @@
+"""
+Schema Migrations
+Ordered registry of silent processed.json migrations behind a schema_version stamp
+
+processed.json's schema version is stamped in a small sidecar file
+(processed.json.schema), together with the size and mtime of the file it was
+written for. At startup, a current stamp for the same file means nothing else
+is read. If processed.json changed since (app saves, a restored backup,
+another machine's copy), its first record is probed instead: every step is
+tried on a copy of it, and if any would change it the stamp is ignored.
+Otherwise processed.json is loaded once, every pending step is applied in
+order to the same data, and the result is saved once before the stamp is
+updated. Steps are idempotent, so a missing or stale stamp only costs a scan.
+
+The interactive v3.1 upgrade (API metadata download) stays in
+migration_manager.MigrationManager; check_and_migrate runs it after these
+steps when the loaded data still needs it.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import copy
+import json
+import os
+
+SCHEMA_SUFFIX = ".schema"
+
+
+def _migrate_current_difficulty(data):
+    """v4.8: add current_difficulty (from difficulty) and difficulty_id"""
+    from utils import DIFFICULTY_LOOKUP
+
+    # Reverse mapping: difficulty_name -> difficulty_id
+    name_to_id = {name: diff_id for diff_id, name in DIFFICULTY_LOOKUP.items() if name}
+    name_to_id["Skilled"] = "diff_3"  # Old name for Intermediate
+
+    migrated = 0
+    for hack_data in data.values():
+        if not isinstance(hack_data, dict):
+            continue
+        difficulty = hack_data.get("difficulty", "")
+        changed = False
+        if "current_difficulty" not in hack_data and difficulty:
+            hack_data["current_difficulty"] = difficulty
+            changed = True
+        if "difficulty_id" not in hack_data:
+            current_diff = hack_data.get("current_difficulty", difficulty)
+            if current_diff and current_diff in name_to_id:
+                hack_data["difficulty_id"] = name_to_id[current_diff]
+                changed = True
+        migrated += changed
+    return migrated
+
+
+def _migrate_hack_types(data):
+    """v4.1: single hack_type becomes a hack_types list"""
+    migrated = 0
+    for hack_data in data.values():
+        if isinstance(hack_data, dict) and "hack_type" in hack_data and "hack_types" not in hack_data:
+            single_type = hack_data["hack_type"]
+            hack_data["hack_types"] = [single_type] if single_type else ["standard"]
+            migrated += 1
+    return migrated
+
+
+def _migrate_obsolete_flag(data):
+    """v4.0: existing hacks default to not obsolete"""
+    migrated = 0
+    for hack_data in data.values():
+        if isinstance(hack_data, dict) and "obsolete" not in hack_data:
+            hack_data["obsolete"] = False
+            migrated += 1
+    return migrated
+
+
+# (schema version, description, step(data) -> records changed), oldest first.
+# Append new steps with the next version number; never renumber.
+MIGRATIONS = [
+    (1, "current_difficulty and difficulty_id (v4.8)", _migrate_current_difficulty),
+    (2, "hack_types list (v4.1)", _migrate_hack_types),
+    (3, "obsolete flag (v4.0)", _migrate_obsolete_flag),
+]
+
+CURRENT_SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_path(path):
+    return path + SCHEMA_SUFFIX
+
+
+def _file_signature(path):
+    """[size, mtime_ns] of processed.json, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _first_record_is_current(path):
+    """Probe processed.json's first record: False if any step (or the v3.1 upgrade) would change it"""
+    from hack_data_manager import _iter_json_object_items
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for hack_id, hack_data in _iter_json_object_items(f):
+                if not isinstance(hack_data, dict):
+                    continue
+                if "completed" not in hack_data:
+                    return False  # Pre-v3.1 record - let the full v3.1 check run
+                probe = {hack_id: copy.deepcopy(hack_data)}
+                return not any(step(probe) for _version, _description, step in MIGRATIONS)
+    except (OSError, ValueError):
+        return False
+    return True  # No records - nothing to migrate
+
+
+def read_schema_version(path=None):
+    """Stamped schema version of processed.json at path (0 if unstamped)
+
+    A stamp written for a different file (size/mtime changed) only counts if
+    the first record already has the stamped schema.
+    """
+    if path is None:
+        from utils import PROCESSED_JSON_PATH
+        path = PROCESSED_JSON_PATH
+    try:
+        with open(schema_path(path), "r", encoding="utf-8") as f:
+            stamp = json.load(f)
+        version = stamp.get("schema_version", 0)
+        if not isinstance(version, int):
+            return 0
+    except (OSError, ValueError, AttributeError):
+        return 0
+    if stamp.get("file") != _file_signature(path) and not _first_record_is_current(path):
+        return 0
+    return version
+
+
+def write_schema_version(path, version=CURRENT_SCHEMA_VERSION):
+    """Stamp processed.json at path (call once its data is on disk)"""
+    from processed_journal import write_json_atomic
+    write_json_atomic(schema_path(path), {"schema_version": version, "file": _file_signature(path)})
+
+
+def is_schema_current(path=None):
+    return read_schema_version(path) >= CURRENT_SCHEMA_VERSION
+
+
+def apply_pending_migrations(data, from_version=0, log=None):
+    """Apply every step newer than from_version to data in place
+
+    Returns the number of records changed (counted once per step).
+    """
+    total = 0
+    for version, description, step in MIGRATIONS:
+        if version <= from_version:
+            continue
+        migrated = step(data)
+        if migrated and log:
+            log(f"✅ Schema {version} migration ({description}): {migrated} hacks updated")
+        total += migrated
+    return total
+
+
+def run_pending_migrations(path=None, data=None, stamp=True, log=print):
+    """Bring processed.json up to CURRENT_SCHEMA_VERSION in one load/transform/save pass
+
+    Args:
+        path: processed.json path (default: the user's)
+        data: Already loaded processed.json contents to migrate in place
+        stamp: Stamp the new schema version once the data is on disk
+
+    Returns:
+        The migrated data, or None if the stamp was already current.
+    """
+    if path is None:
+        from utils import PROCESSED_JSON_PATH
+        path = PROCESSED_JSON_PATH
+    from_version = read_schema_version(path)
+    if from_version >= CURRENT_SCHEMA_VERSION:
+        return None
+    if not os.path.exists(path):
+        return {}
+
+    from utils import load_processed, save_processed
+    if data is None:
+        data = load_processed(path)
+    if apply_pending_migrations(data, from_version, log):
+        from processed_journal import rotate_backup
+        from persistence_worker import get_persistence_worker
+
+        # Lock collection during migration
+        try:
+            from download_state_manager import set_download_active
+        except ImportError:
+            set_download_active = None
+        if set_download_active:
+            set_download_active(True)
+        try:
+            rotate_backup(path, interval=0)
+            save_processed(data, path)
+            get_persistence_worker().flush()
+        finally:
+            if set_download_active:
+                set_download_active(False)
+    if stamp:
+        write_schema_version(path)
+    return data
@@ -1,6 +1,7 @@
 import requests
 import time
 from config_manager import ConfigManager
+import pipeline_metrics
 
 def get_api_delay():
     """Get current API delay setting from config"""
@@ -16,9 +17,11 @@ def smwc_api_get(url, params=None, log=None):
         full_url = url + "?" + urllib.parse.urlencode(params, doseq=True)
         log(f"[DEBUG] API Request: {full_url}", level="debug")
     
+    request_start = time.monotonic()
     try:
         response = requests.get(url, params=params, timeout=30)
         response.raise_for_status()  # Raise exception for bad status codes
+        pipeline_metrics.record("api_request", request_start, bytes=len(response.content))
         
         # Check if response is valid JSON
         try:
@@ -30,6 +33,7 @@ def smwc_api_get(url, params=None, log=None):
             raise Exception(f"Invalid JSON response from API: {e}")
         
     except requests.exceptions.RequestException as e:
+        pipeline_metrics.record("api_request", request_start, outcome="error")
         if log:
             log(f"[ERROR] Network error: {e}", level="error")
         raise Exception(f"Network error: {e}")
@@ -43,5 +47,7 @@ def smwc_api_get(url, params=None, log=None):
     if log:
         log(f"[DEBUG] Waiting {delay:.1f} seconds...", level="debug")
 
+    delay_start = time.monotonic()
     time.sleep(delay)
+    pipeline_metrics.record("api_delay", delay_start)
     return response
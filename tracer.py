@@ -0,0 +1,163 @@
+"""
+Tracer
+Opt-in Chrome trace-event recorder (loads in chrome://tracing or ui.perfetto.dev)
+
+Enable with the "performance_trace" config setting or the SMWC_TRACE
+environment variable. Spans are buffered in memory and written to the
+traces folder when a pipeline run finishes.
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from utils import get_user_data_path
+
+TRACES_DIR = get_user_data_path("traces")
+MAX_BUFFERED_EVENTS = 200000
+MAX_SAVED_TRACES = 10
+
+_enabled = os.environ.get("SMWC_TRACE", "").lower() not in ("", "0", "false", "no")
+_events = deque(maxlen=MAX_BUFFERED_EVENTS)
+_named_threads = set()
+_lock = threading.Lock()
+_pid = os.getpid()
+
+
+def enable():
+    """Start recording spans"""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording spans and drop anything buffered"""
+    global _enabled
+    _enabled = False
+    with _lock:
+        _events.clear()
+
+
+def is_enabled():
+    return _enabled
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000.0
+
+
+def _thread_id():
+    """Current thread id, emitting a thread_name metadata event the first time"""
+    tid = threading.get_ident()
+    if tid not in _named_threads:
+        _named_threads.add(tid)
+        _events.append({
+            "name": "thread_name", "ph": "M", "pid": _pid, "tid": tid,
+            "args": {"name": threading.current_thread().name}
+        })
+    return tid
+
+
+def complete(name, start_us, end_us=None, category="pipeline", args=None):
+    """Record a finished span using _now_us() style timestamps"""
+    if not _enabled:
+        return
+    if end_us is None:
+        end_us = _now_us()
+    with _lock:
+        event = {
+            "name": name, "cat": category, "ph": "X",
+            "ts": start_us, "dur": max(end_us - start_us, 0),
+            "pid": _pid, "tid": _thread_id()
+        }
+        if args:
+            event["args"] = args
+        _events.append(event)
+
+
+def complete_monotonic(name, start, end=None, category="pipeline", args=None):
+    """Record a span measured with time.monotonic() seconds"""
+    if not _enabled:
+        return
+    offset = _now_us() - time.monotonic() * 1e6
+    end = time.monotonic() if end is None else end
+    complete(name, start * 1e6 + offset, end * 1e6 + offset, category, args)
+
+
+def instant(name, category="pipeline", args=None):
+    """Record a point-in-time marker"""
+    if not _enabled:
+        return
+    with _lock:
+        event = {"name": name, "cat": category, "ph": "i", "s": "t",
+                 "ts": _now_us(), "pid": _pid, "tid": _thread_id()}
+        if args:
+            event["args"] = args
+        _events.append(event)
+
+
+@contextmanager
+def span(name, category="pipeline", **args):
+    """Time a block of code as a trace span (no-op when tracing is off)"""
+    if not _enabled:
+        yield args
+        return
+    start = _now_us()
+    try:
+        yield args
+    except BaseException as e:
+        args["error"] = str(e)
+        raise
+    finally:
+        complete(name, start, category=category, args=args)
+
+
+def flush(label="trace", path=None, log=None):
+    """Write buffered events to a trace-event JSON file and clear the buffer
+
+    Returns the written path, or None when tracing is off or nothing was recorded.
+    """
+    if not _enabled:
+        return None
+    with _lock:
+        events = list(_events)
+        _events.clear()
+        _named_threads.clear()
+    if not any(e["ph"] != "M" for e in events):
+        return None
+
+    try:
+        if path is None:
+            os.makedirs(TRACES_DIR, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(TRACES_DIR, f"{label}_{stamp}.trace.json")
+            _prune_old_traces()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        if log:
+            log(f"🧭 Trace saved to {path} (open in chrome://tracing or ui.perfetto.dev)", "Information")
+        return path
+    except Exception as e:
+        if log:
+            log(f"⚠️ Could not save trace: {e}", "Warning")
+        return None
+
+
+def _prune_old_traces():
+    """Keep only the most recent MAX_SAVED_TRACES files"""
+    try:
+        traces = sorted(
+            (os.path.join(TRACES_DIR, name) for name in os.listdir(TRACES_DIR) if name.endswith(".trace.json")),
+            key=os.path.getmtime
+        )
+        for old in traces[:-(MAX_SAVED_TRACES - 1)]:
+            os.remove(old)
+    except Exception:
+        pass
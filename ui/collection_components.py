@@ -356,46 +356,14 @@ class HackCollectionInlineEditor(InlineEditor):
                         self.data_manager.update_hack(self.editing_hack_id, "completed", False)
                         self._log(f"❌ Automatically marked '{hack_title}' (hack #{self.editing_hack_id}) as not completed when date was removed", "Debug")
             
-            # Update the specific tree item directly without rebuilding entire table
-            for item in self.parent_page.tree.get_children():
-                item_tags = self.parent_page.tree.item(item)["tags"]
-                if item_tags and str(item_tags[0]) == str(self.editing_hack_id):
-                    # Get current values
-                    current_values = list(self.parent_page.tree.item(item)["values"])
-                    
-                    # Update the specific column dynamically
-                    try:
-                        col_index = next(i for i, c in enumerate(self.parent_page.COLUMNS) if c["id"] == self.field_name)
-                        
-                        if self.field_name == "completed_date":
-                            current_values[col_index] = new_value 
-                            # Update completed checkbox based on whether we have a date and completed status
-                            if hack_data:
-                                current_values[0] = "✓" if hack_data.get("completed", False) else ""
-                        elif self.field_name == "time_to_beat":  # v3.1 NEW
-                            # Format time for display (convert seconds back to readable format)
-                            if hasattr(self.parent_page, '_format_time_display'):
-                                display_time = self.parent_page._format_time_display(new_value)
-                            else:
-                                display_time = str(new_value) if new_value else ""
-                            current_values[col_index] = display_time
-                        elif self.field_name == "notes":
-                            # Truncate notes for display
-                            display_notes = new_value[:30] + "..." if len(new_value) > 30 else new_value
-                            current_values[col_index] = display_notes
-                            
-                        # Update the tree item
-                        self.parent_page.tree.item(item, values=current_values)
-                    except (StopIteration, IndexError):
-                        pass # Column might be missing or hidden
-                    
-                    # User-friendly logging
-                    field_display = {"completed_date": "completion date", "notes": "notes", "time_to_beat": "time to beat"}.get(self.field_name, self.field_name)
-                    if new_value:
-                        self._log(f"📝 Updated {field_display} for '{hack_title}' (hack #{self.editing_hack_id})", "Information")
-                    else:
-                        self._log(f"🗑️ Cleared {field_display} for '{hack_title}' (hack #{self.editing_hack_id})", "Information")
-                    break
+            # Update only the cells that changed in this hack's row
+            if self.parent_page.refresh_row(self.editing_hack_id):
+                # User-friendly logging
+                field_display = {"completed_date": "completion date", "notes": "notes", "time_to_beat": "time to beat"}.get(self.field_name, self.field_name)
+                if new_value:
+                    self._log(f"📝 Updated {field_display} for '{hack_title}' (hack #{self.editing_hack_id})", "Information")
+                else:
+                    self._log(f"🗑️ Cleared {field_display} for '{hack_title}' (hack #{self.editing_hack_id})", "Information")
             
         else:
             hack_data = self.parent_page._find_hack_data(self.editing_hack_id)
@@ -0,0 +1,86 @@
+"""
+Compute Worker
+Runs UI compute jobs on one background thread, keeping only the newest request
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import threading
+import tkinter as tk
+
+
+class LatestJobWorker:
+    """Background thread for jobs where only the newest request matters
+
+    Every submit() bumps a generation number. A job that is superseded while it
+    waits is skipped, and a finished result is only handed to its callback (on
+    the Tk main thread) if no newer job was submitted in the meantime - so
+    results for stale keystrokes are dropped instead of painted.
+    """
+
+    def __init__(self, widget, name="ui-compute"):
+        self.widget = widget
+        self.name = name
+        self.generation = 0
+        self._pending = None  # (generation, job, on_done, on_error)
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+
+    def submit(self, job, on_done, on_error=None):
+        """Run job() in the background and call on_done(result) on the main thread
+
+        Returns the job's generation number.
+        """
+        with self._condition:
+            self.generation += 1
+            self._pending = (self.generation, job, on_done, on_error)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+            return self.generation
+
+    def is_current(self, generation):
+        return generation == self.generation and not self._closed
+
+    def close(self):
+        """Stop the thread; pending and in-flight results are discarded"""
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                (generation, job, on_done, on_error), self._pending = self._pending, None
+
+            if not self.is_current(generation):
+                continue
+            try:
+                result = job()
+            except Exception as e:
+                if on_error is not None:
+                    self._post(generation, on_error, e)
+                continue
+            self._post(generation, on_done, result)
+
+    def _post(self, generation, callback, value):
+        """Hand a result to the main thread unless a newer job has been submitted"""
+        if not self.is_current(generation):
+            return
+
+        def deliver():
+            if self.is_current(generation):
+                callback(value)
+
+        try:
+            self.widget.after(0, deliver)
+        except (tk.TclError, RuntimeError):
+            pass  # Window closed while computing
@@ -1,7 +1,12 @@
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
-from utils import resource_path, get_hack_types
+from utils import resource_path
+from hack_index import HackIndex, HackSearchIndex, FilterSpec
+
+# Delay before a search-as-you-type query is applied
+SEARCH_DEBOUNCE_MS = 150
 
 class TableFilters:
     """Handles filter UI and state for the collection table"""
@@ -27,11 +32,25 @@ class TableFilters:
         self.user_content_filter = tk.StringVar(value="Any")  # Default to "Any" for dropdown
         self.obsolete_filter = tk.StringVar(value="No")  # Default to "No" for obsolete records
         self.author_filter = tk.StringVar()  # Author search filter
+        # Filter index for the current hack list (patched for edited records,
+        # rebuilt when the list itself changes)
+        self._index = None
+        self._index_version = None
+        self._changed_ids = set()
+        # (index, key, rows) of the last apply, so paging doesn't filter again
+        self._last_result = None
+        # apply_filters may run on a compute worker thread
+        self._index_lock = threading.Lock()
+        # Trigram index over title/authors/notes, kept current by store events
+        self._search_index = None
+        self._search_job = None
         
     def create_filter_ui(self, parent, data_manager):
         """Create filter UI elements"""
         self.data_manager = data_manager  # Store reference for Add Hack functionality
         filter_frame = ttk.LabelFrame(parent, text="Filters", padding=15)
+        self._start_search_index(filter_frame)
+        data_manager.subscribe(self._on_store_changed)
         
         # Create main grid container
         grid_container = ttk.Frame(filter_frame)
@@ -67,13 +86,13 @@ class TableFilters:
         return filter_frame
         
     def _create_name_filter(self, parent):
-        """Create name filter"""
+        """Create search filter (matches title, authors and notes)"""
         name_frame = ttk.Frame(parent)
         name_frame.pack(fill="x", pady=(0, 8))
-        ttk.Label(name_frame, text="Name:", font=("Segoe UI", 9, "bold")).pack(anchor="w")
+        ttk.Label(name_frame, text="Search (title, authors, notes):", font=("Segoe UI", 9, "bold")).pack(anchor="w")
         name_entry = ttk.Entry(name_frame, textvariable=self.name_filter)
         name_entry.pack(fill="x", pady=(2, 0))
-        name_entry.bind("<KeyRelease>", lambda e: self.apply_callback())
+        name_entry.bind("<KeyRelease>", lambda e: self._schedule_search(e.widget))
         
     def _create_dropdown_filters(self, parent, data_manager):
         """Create dropdown filter controls"""
@@ -131,7 +150,7 @@ class TableFilters:
         ttk.Label(author_frame, text="Author(s):", font=("Segoe UI", 9, "bold")).pack(anchor="w")
         author_entry = ttk.Entry(author_frame, textvariable=self.author_filter)
         author_entry.pack(fill="x", pady=(2, 0))
-        author_entry.bind("<KeyRelease>", lambda e: self.apply_callback())
+        author_entry.bind("<KeyRelease>", lambda e: self._schedule_search(e.widget))
         
     def _create_remaining_dropdowns(self, parent):
         """Create completed and rating dropdowns"""
@@ -231,6 +250,19 @@ class TableFilters:
                       command=self.random_callback).pack(side="left")
 
                   
+    def _schedule_search(self, widget):
+        """Debounce typing so the table is filtered once the user pauses"""
+        if self._search_job is not None:
+            try:
+                widget.after_cancel(self._search_job)
+            except tk.TclError:
+                pass
+        self._search_job = widget.after(SEARCH_DEBOUNCE_MS, self._run_scheduled_search)
+    
+    def _run_scheduled_search(self):
+        self._search_job = None
+        self.apply_callback()
+    
     def clear_filters(self):
         """Reset all filters to default values"""
         self.name_filter.set("")
@@ -263,107 +295,104 @@ class TableFilters:
             if current_diff not in difficulties:
                 self.difficulty_filter.set("All")
                 
-    def apply_filters(self, hacks):
-        """Apply all active filters to the list of hacks"""
-        filtered_hacks = []
+    def apply_filters(self, hacks, sort_column=None, reverse=False, spec=None):
+        """Apply all active filters to the list of hacks, optionally sorted by a column
         
-        for hack in hacks:
-            if self._hack_passes_filters(hack):
-                filtered_hacks.append(hack)
-                
-        return filtered_hacks
+        Pass a spec from compile_filter_spec() to call this off the Tk main
+        thread (the filter variables can only be read on the main thread).
+        Returns (rows, scores), scores being hack_id -> search relevance.
+        """
+        if spec is None:
+            spec = self.compile_filter_spec()
+        with self._index_lock:
+            index = self._get_index(hacks)
+            key = (spec.key(), sort_column, reverse, self._index_version)
+            if self._last_result is None or self._last_result[0] is not index or self._last_result[1] != key:
+                self._last_result = (index, key, index.filter(spec, sort_column, reverse))
+            # Callers may reorder their copy
+            return list(self._last_result[2]), index.last_scores
+    
+    def _on_store_changed(self, event, hack_ids):
+        """Remember edited records so the index can patch them - may run on a worker thread"""
+        self._changed_ids.update(hack_ids)
+    
+    def _get_index(self, hacks):
+        """Get the filter index for this hack list, patching or rebuilding it when the data changed"""
+        version = getattr(self.data_manager, "data_version", None)
+        if self._index is None or self._index.hacks is not hacks:
+            self._changed_ids = set()
+            self._index = HackIndex(hacks, self._get_search_index(), self._get_author_table())
+        elif self._changed_ids:
+            # Same list, so the records were edited in place
+            changed, self._changed_ids = self._changed_ids, set()
+            self._index.update_records(changed)
+        elif self._index_version != version:
+            self._index = HackIndex(hacks, self._get_search_index(), self._get_author_table())
+        self._index_version = version
+        return self._index
+    
+    def _start_search_index(self, widget):
+        """Build the trigram search index in the background; scans are used until it's ready"""
+        if self._search_index is not None:
+            return
+        self._search_index = HackSearchIndex(self.data_manager)
         
-    def _hack_passes_filters(self, hack):
-        """Check if a hack passes all current filters"""
-        # Name filter
-        name_filter_text = self.name_filter.get().strip().lower()
-        if name_filter_text and name_filter_text not in hack.get("title", "").lower():
-            return False
-        
-        # Author filter
-        author_filter_text = self.author_filter.get().strip().lower()
-        if author_filter_text:
-            authors = hack.get("authors", [])
-            if isinstance(authors, list):
-                # Check if any author contains the filter text
-                author_match = any(author_filter_text in author.lower() for author in authors if isinstance(author, str))
-                if not author_match:
-                    return False
-            elif isinstance(authors, str):
-                # Handle case where authors is a string instead of list
-                if author_filter_text not in authors.lower():
-                    return False
-            
-        # Type filter - support multi-type hacks
-        type_filter_value = self.type_filter.get()
-        if type_filter_value != "All":
-            hack_types = get_hack_types(hack)
-            # Check if the filter type is in the hack's types (case-insensitive)
-            filter_type_lower = type_filter_value.lower()
-            hack_types_lower = [t.lower() for t in hack_types]
-            if filter_type_lower not in hack_types_lower:
-                return False
-            
-        # Difficulty filter
-        difficulty_filter_value = self.difficulty_filter.get()
-        if difficulty_filter_value != "All" and hack.get("difficulty") != difficulty_filter_value:
-            return False
-            
-        # User Created Records filter - check if hack ID has "usr_" prefix
-        user_content_filter_value = self.user_content_filter.get()
-        if user_content_filter_value != "Any":
-            hack_id = hack.get("id", "")
-            is_user_created = str(hack_id).startswith("usr_")
-            
-            if user_content_filter_value == "Yes" and not is_user_created:
-                return False
-            elif user_content_filter_value == "No" and is_user_created:
-                return False
-        
-        # Obsolete Records filter - check if hack is obsolete
-        obsolete_filter_value = self.obsolete_filter.get()
-        if obsolete_filter_value != "Any":
-            is_obsolete = hack.get("obsolete", False)
-            
-            if obsolete_filter_value == "Yes" and not is_obsolete:
-                return False
-            elif obsolete_filter_value == "No" and is_obsolete:
-                return False
-            
-        # More filter checks...
-        return self._check_remaining_filters(hack)
+        def on_ready():
+            try:
+                widget.after(0, self._on_search_index_ready)
+            except (tk.TclError, RuntimeError):
+                pass  # Window closed while building
         
-    def _check_remaining_filters(self, hack):
-        """Check remaining filters"""
-        # Completed filter
-        completed_filter_value = self.completed_filter.get()
-        if completed_filter_value == "Yes" and not hack.get("completed", False):
-            return False
-        elif completed_filter_value == "No" and hack.get("completed", False):
-            return False
-            
-        # Rating filter
-        rating_filter_value = self.rating_filter.get()
-        if rating_filter_value != "All":
-            stars_count = rating_filter_value.count("★")
-            if hack.get("personal_rating", 0) != stars_count:
-                return False
-                
-        # Boolean filters
-        filters_to_check = [
-            ("hall_of_fame", self.hall_of_fame_filter.get(), "hall_of_fame"),
-            ("sa1_compatibility", self.sa1_filter.get(), "sa1_compatibility"),
-            ("collaboration", self.collaboration_filter.get(), "collaboration"),
-            ("demo", self.demo_filter.get(), "demo")
-        ]
-        
-        for field_name, filter_value, hack_field in filters_to_check:
-            if filter_value == "Yes" and not hack.get(hack_field, False):
-                return False
-            elif filter_value == "No" and hack.get(hack_field, False):
-                return False
-                
-        return True
+        self._search_index.build_async(on_ready)
+    
+    def _on_search_index_ready(self):
+        with self._index_lock:
+            self._index = None  # Next apply switches to the trigram index
+        if self.name_filter.get().strip() or self.author_filter.get().strip():
+            self.apply_callback()
+    
+    def _get_author_table(self):
+        """The store's author table, if the data manager keeps one"""
+        get_author_table = getattr(self.data_manager, "get_author_table", None)
+        return get_author_table() if get_author_table is not None else None
+    
+    def _get_search_index(self):
+        """The trigram search index, once its background build has finished"""
+        if self._search_index is not None and self._search_index.ready:
+            return self._search_index
+        return None
+    
+    @property
+    def search_query(self):
+        """The current search text, normalized"""
+        return self.name_filter.get().strip().lower()
+    
+    def cleanup(self):
+        """Stop following store events"""
+        if self.data_manager is not None:
+            self.data_manager.unsubscribe(self._on_store_changed)
+        if self._search_index is not None:
+            self._search_index.close()
+            self._search_index = None
+    
+    def compile_filter_spec(self):
+        """Read every filter variable once and compile them into a FilterSpec"""
+        return FilterSpec.from_values(
+            name=self.name_filter.get(),
+            author=self.author_filter.get(),
+            hack_type=self.type_filter.get(),
+            difficulty=self.difficulty_filter.get(),
+            user_created=self.user_content_filter.get(),
+            obsolete=self.obsolete_filter.get(),
+            completed=self.completed_filter.get(),
+            rating=self.rating_filter.get(),
+            flags={
+                "hall_of_fame": self.hall_of_fame_filter.get(),
+                "sa1_compatibility": self.sa1_filter.get(),
+                "collaboration": self.collaboration_filter.get(),
+                "demo": self.demo_filter.get(),
+            },
+        )
     
     def show_add_hack_dialog(self):
         """Show dialog to add a new hack manually"""
@@ -751,7 +780,9 @@ class AddHackDialog:
         # Handle authors array
         authors = self.hack_data.get("authors", [])
         if isinstance(authors, list):
-            authors_text = ", ".join(authors)
+            # Stored records may hold the API's {id, name} objects
+            from record_normalization import normalize_authors
+            authors_text = ", ".join(normalize_authors(authors))
         else:
             authors_text = str(authors) if authors else ""
         self.authors_var.set(authors_text)
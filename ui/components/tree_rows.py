@@ -0,0 +1,255 @@
+"""
+Tree Rows
+Keyed row reconciliation for ttk.Treeview tables
+
+Copyright (c) 2025 iamtheratio
+Licensed under the MIT License - see LICENSE file for details
+"""
+
+import tkinter as tk
+
+
+class TreeRowReconciler:
+    """Keeps a Treeview's top-level rows in step with a keyed list of rows
+
+    Rows are (key, values, tags) tuples. The reconciler remembers which item
+    shows each key and what was last written to it, so a refresh only deletes,
+    inserts, rewrites and reorders the rows that actually differ. Refreshes
+    requested with schedule() are batched into one idle callback.
+    """
+
+    # Above this many changed cells a whole-row write is cheaper than per-cell sets
+    MAX_CELL_WRITES = 2
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.columns = tuple(tree["columns"])  # Creation-time order, which values follow
+        self.items = {}  # key -> item id
+        self.keys = {}   # item id -> key
+        self.rows = {}   # key -> (values, tags) last written
+        self.order = []  # keys in display order
+        self._pending = None
+        self._idle_job = None
+
+    def item_for(self, key):
+        """Item id showing key (after applying any scheduled refresh), or None"""
+        self.flush()
+        return self.items.get(key)
+
+    def key_for(self, item):
+        return self.keys.get(item)
+
+    def schedule(self, rows):
+        """Reconcile to rows on the next idle callback; later calls replace earlier ones"""
+        self._pending = list(rows)
+        if self._idle_job is None:
+            self._idle_job = self.tree.after_idle(self.flush)
+
+    def flush(self):
+        """Apply a scheduled refresh now"""
+        if self._idle_job is not None:
+            try:
+                self.tree.after_cancel(self._idle_job)
+            except tk.TclError:
+                pass
+            self._idle_job = None
+        if self._pending is not None:
+            rows, self._pending = self._pending, None
+            self.reconcile(rows)
+
+    def reconcile(self, rows):
+        """Make the tree show exactly rows, in order, touching only what changed"""
+        tree = self.tree
+        new_order = [key for key, _values, _tags in rows]
+        wanted = set(new_order)
+
+        stale = [key for key in self.items if key not in wanted]
+        if stale:
+            tree.delete(*(self.items[key] for key in stale))
+            for key in stale:
+                del self.keys[self.items.pop(key)]
+                del self.rows[key]
+
+        inserted = False
+        for key, values, tags in rows:
+            values = tuple(values)
+            tags = tuple(tags)
+            item = self.items.get(key)
+            if item is None:
+                item = tree.insert("", "end", values=values, tags=tags)
+                self.items[key] = item
+                self.keys[item] = key
+                self.rows[key] = (values, tags)
+                inserted = True
+            else:
+                self._write(key, item, values, tags)
+
+        if new_order != self.order:
+            # New rows were appended, so reorder in a single call when needed
+            current = [key for key in self.order if key in wanted]
+            if inserted:
+                current += [key for key in new_order if key not in set(current)]
+            if current != new_order:
+                tree.set_children("", *(self.items[key] for key in new_order))
+            self.order = new_order
+
+    def update_row(self, key, values=None, tags=None):
+        """Rewrite one row's changed cells/tags; returns False if key isn't shown"""
+        item = self.item_for(key)
+        if item is None:
+            return False
+        old_values, old_tags = self.rows[key]
+        self._write(key, item,
+                    tuple(values) if values is not None else old_values,
+                    tuple(tags) if tags is not None else old_tags)
+        return True
+
+    def _write(self, key, item, values, tags):
+        old_values, old_tags = self.rows[key]
+        if values == old_values and tags == old_tags:
+            return
+        if tags != old_tags:
+            self.tree.item(item, values=values, tags=tags)
+        else:
+            changed = [i for i, (old, new) in enumerate(zip(old_values, values)) if old != new]
+            if len(old_values) != len(values) or len(changed) > self.MAX_CELL_WRITES:
+                self.tree.item(item, values=values)
+            else:
+                for i in changed:
+                    self.tree.set(item, self.columns[i], values[i])
+        self.rows[key] = (values, tags)
+
+    def clear(self):
+        """Remove every row"""
+        self._pending = None
+        if self.items:
+            self.tree.delete(*self.items.values())
+        self.items.clear()
+        self.keys.clear()
+        self.rows.clear()
+        self.order = []
+
+
+class VirtualTreeRows:
+    """Renders a window of a long keyed list into a Treeview
+
+    The model is a list of keys in display order; row_for(key) returns the
+    (values, tags) for a key. Only the rows in view plus OVERSCAN_ROWS on
+    either side exist in the tree, so the tree holds a few dozen items no
+    matter how long the list is. The vertical scrollbar tracks the model, and
+    when the tree scrolls itself (mouse wheel, arrow keys) into the overscan
+    the window is re-based around the new top row.
+    """
+
+    OVERSCAN_ROWS = 20
+    DEFAULT_ROW_HEIGHT = 20
+    DEFAULT_HEADER_HEIGHT = 25
+
+    def __init__(self, tree, scrollbar, row_for):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_for = row_for
+        self.rows = TreeRowReconciler(tree)
+        self.keys = []
+        self.first = 0          # Model index of the top visible row
+        self._window_start = 0  # Model index of the first rendered row
+        self._row_height = None
+        self._header_height = None
+        self._idle_job = None
+
+        tree.configure(yscrollcommand=self._on_tree_scrolled)
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind("<Configure>", lambda event: self.schedule(), add="+")
+
+    def key_for(self, item):
+        return self.rows.key_for(item)
+
+    def set_keys(self, keys):
+        """Replace the model (e.g. after sorting); keeps the scroll position"""
+        self.keys = list(keys)
+        self.schedule()
+
+    def append_keys(self, keys):
+        self.keys.extend(keys)
+        self.schedule()
+
+    def clear(self):
+        """Drop the model and every row immediately"""
+        self._cancel()
+        self.keys = []
+        self.first = 0
+        self._window_start = 0
+        self.rows.clear()
+        self.scrollbar.set(0.0, 1.0)
+
+    def schedule(self):
+        """Re-render on the next idle callback (several model changes cost one render)"""
+        if self._idle_job is None:
+            self._idle_job = self.tree.after_idle(self.render)
+
+    def _cancel(self):
+        if self._idle_job is not None:
+            try:
+                self.tree.after_cancel(self._idle_job)
+            except tk.TclError:
+                pass
+            self._idle_job = None
+
+    def visible_count(self):
+        """Number of whole rows that fit in the tree at its current height"""
+        if self._row_height is None:
+            # Measure from the first row that is actually on screen
+            for item in self.tree.get_children():
+                bbox = self.tree.bbox(item)
+                if bbox:
+                    self._header_height, self._row_height = bbox[1], bbox[3]
+                    break
+        row_height = self._row_height or self.DEFAULT_ROW_HEIGHT
+        header_height = self._header_height if self._header_height is not None else self.DEFAULT_HEADER_HEIGHT
+        return max(1, (self.tree.winfo_height() - header_height) // row_height)
+
+    def render(self):
+        """Show the window around self.first, touching only rows that changed"""
+        self._cancel()
+        visible = self.visible_count()
+        total = len(self.keys)
+        self.first = max(0, min(self.first, total - visible))
+        start = max(0, self.first - self.OVERSCAN_ROWS)
+        end = min(total, self.first + visible + self.OVERSCAN_ROWS)
+
+        row_for = self.row_for
+        self.rows.reconcile([(key, *row_for(key)) for key in self.keys[start:end]])
+        self._window_start = start
+        if end > start:
+            self.tree.yview_moveto((self.first - start) / (end - start))
+
+        if total <= visible:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + visible) / total))
+
+    def refresh(self):
+        """Rewrite rendered rows whose values/tags changed (e.g. selection or styling)"""
+        self.render()
+
+    def scroll_to(self, index):
+        self.first = index
+        self.render()
+
+    def _on_tree_scrolled(self, first, last):
+        """The tree scrolled itself into the overscan - re-base the window"""
+        rendered = len(self.rows.order)
+        if not rendered:
+            return
+        top = self._window_start + round(float(first) * rendered)
+        if top != self.first:
+            self.scroll_to(top)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.keys)))
+        elif action == "scroll":
+            step = int(amount)
+            if unit == "pages":
+                step *= self.visible_count()
+            self.scroll_to(self.first + step)
@@ -7,6 +7,7 @@ import os
 import sys
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
+from itertools import compress
 import statistics
 
 # Add path for imports
@@ -20,19 +21,25 @@ class DashboardAnalytics:
         
     def load_analytics_data(self, date_filter="all_time"):
         """Load and calculate all analytics data with optional date filtering"""
+        from collection_columns import COMPLETED, OBSOLETE
         self.date_filter = date_filter
         
-        # Get different datasets for different metric types
+        # One columnar snapshot serves every metric; row masks pick the dataset
+        columns = self.columns = self.data_manager.get_columns()
         # Inventory metrics (exclude obsolete): Total Hacks, Total Exits, Completion Rate
-        current_hacks = self.data_manager.get_all_hacks(include_obsolete=False)
-        current_data = {hack['id']: self.data_manager.data[hack['id']] for hack in current_hacks if hack['id'] in self.data_manager.data}
-        
-        # Completion metrics (include obsolete): Completed Hacks, Completed Exits, Time metrics, Line Graph
-        all_hacks = self.data_manager.get_all_hacks(include_obsolete=True)
-        all_data = {hack['id']: self.data_manager.data[hack['id']] for hack in all_hacks if hack['id'] in self.data_manager.data}
+        self.current_mask = columns.mask(excluded=OBSOLETE)
+        self.current_completed_mask = columns.mask(required=COMPLETED, excluded=OBSOLETE)
+        # Completion metrics (include obsolete, date filtered): Completed Hacks, Completed Exits, Time metrics
+        self.completed_mask = columns.mask(required=COMPLETED)
+        if date_filter == "all_time":
+            self.filtered_mask = self.completed_mask
+        else:
+            self.filtered_mask = columns.both(self.completed_mask, columns.date_mask(self._date_in_range))
+        # Parsed completion date per distinct date string (None if blank or invalid)
+        self.date_objects = [self._parse_date(date) for date in columns.date_table.values]
         
         self.analytics_data = {
-            'total_hacks': len(current_data),  # Exclude obsolete
+            'total_hacks': columns.count(self.current_mask),  # Exclude obsolete
             'completed_hacks': 0,
             'completion_rate': 0.0,
             'completion_velocity': 0.0,
@@ -56,10 +63,6 @@ class DashboardAnalytics:
             'time_progression': {}  # NEW: Time progression data for charts
         }
         
-        # Store both datasets for use in different calculations
-        self.current_data = current_data  # For inventory metrics
-        self.all_data = all_data  # For completion metrics
-        
         self._calculate_basic_stats()
         self._calculate_completion_data()
         self._calculate_time_metrics()
@@ -68,85 +71,56 @@ class DashboardAnalytics:
         
         return self.analytics_data
     
-    def _should_include_hack(self, hack_data):
-        """Check if hack should be included based on date filter"""
+    @staticmethod
+    def _parse_date(completed_date):
+        try:
+            return datetime.strptime(completed_date, '%Y-%m-%d') if completed_date else None
+        except ValueError:
+            return None
+    
+    def _date_in_range(self, completed_date):
+        """Check if a completion date passes the date filter (completed hacks only)"""
         if self.date_filter == "all_time":
             return True
             
-        completed_date = hack_data.get('completed_date')
-        if not completed_date or not hack_data.get('completed', False):
+        date_obj = self._parse_date(completed_date)
+        if date_obj is None:
             return False
             
-        try:
-            date_obj = datetime.strptime(completed_date, '%Y-%m-%d')
-            now = datetime.now()
+        now = datetime.now()
+        if self.date_filter == "last_week":
+            filter_date = now - timedelta(days=7)
+        elif self.date_filter == "last_month":
+            filter_date = now - timedelta(days=30)
+        elif self.date_filter == "3_months":
+            filter_date = now - timedelta(days=90)
+        elif self.date_filter == "6_months":
+            filter_date = now - timedelta(days=180)
+        elif self.date_filter == "1_year":
+            filter_date = now - timedelta(days=365)
+        else:
+            return True
             
-            if self.date_filter == "last_week":
-                filter_date = now - timedelta(days=7)
-            elif self.date_filter == "last_month":
-                filter_date = now - timedelta(days=30)
-            elif self.date_filter == "3_months":
-                filter_date = now - timedelta(days=90)
-            elif self.date_filter == "6_months":
-                filter_date = now - timedelta(days=180)
-            elif self.date_filter == "1_year":
-                filter_date = now - timedelta(days=365)
-            else:
-                return True
-                
-            return date_obj >= filter_date
-        except ValueError:
-            return False
+        return date_obj >= filter_date
     
     def _calculate_basic_stats(self):
         """Calculate basic completion statistics"""
-        completed_hacks = []
-        all_ratings = []
-        completion_dates = []
-        
-        # Calculate total exits from current (non-obsolete) hacks only
-        total_exits = 0
-        for hack_id, hack_data in self.current_data.items():
-            exits = hack_data.get('exits', 0)
-            if isinstance(exits, str):
-                try:
-                    exits = int(exits)
-                except (ValueError, TypeError):
-                    exits = 0
-            if exits > 0:
-                total_exits += exits
-        
-        # Calculate completion rate using current (non-obsolete) hacks only
-        total_completed_current = 0
-        for hack_id, hack_data in self.current_data.items():
-            if hack_data.get('completed', False):
-                total_completed_current += 1
-        
-        # For completion metrics, use ALL hacks (including obsolete)
-        for hack_id, hack_data in self.all_data.items():
-            if hack_data.get('completed', False):
-                # Check if this hack should be included based on date filter for other metrics
-                if self._should_include_hack(hack_data):
-                    completed_hacks.append(hack_data)
-                    self.analytics_data['completed_hacks'] += 1
-                    
-                    # Collect ratings
-                    rating = hack_data.get('personal_rating')
-                    if rating and rating != 'Not Rated':
-                        try:
-                            rating_val = int(rating)
-                            if 1 <= rating_val <= 5:  # Only accept valid ratings 1-5
-                                all_ratings.append(rating_val)
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    # Collect completion dates
-                    if hack_data.get('completed_date'):
-                        try:
-                            date_obj = datetime.strptime(hack_data['completed_date'], '%Y-%m-%d')
-                            completion_dates.append(date_obj)
-                        except ValueError:
-                            pass
+        columns = self.columns
+        
+        # Total exits and completion rate from current (non-obsolete) hacks only
+        total_exits = columns.sum(columns.exits, self.current_mask)
+        total_completed_current = columns.count(self.current_completed_mask)
+        
+        # For completion metrics, use ALL hacks (including obsolete) that pass the date filter
+        self.analytics_data['completed_hacks'] = columns.count(self.filtered_mask)
+        
+        # Collect ratings (0 = not rated)
+        all_ratings = [rating for rating in compress(columns.rating, self.filtered_mask) if rating]
+        
+        # Collect completion dates
+        completion_dates = [self.date_objects[code]
+                            for code in compress(columns.completed_date, self.filtered_mask)
+                            if self.date_objects[code] is not None]
         
         # Store completion rate based on current (non-obsolete) hacks
         self.analytics_data['total_exits'] = total_exits
@@ -174,44 +148,25 @@ class DashboardAnalytics:
     
     def _calculate_completion_data(self):
         """Calculate completion data by difficulty and type"""
+        columns = self.columns
         difficulty_stats = defaultdict(lambda: {'completed': 0, 'total': 0})
         type_stats = defaultdict(lambda: {'completed': 0, 'total': 0})
-        rating_counts = defaultdict(int)
         
-        # Calculate totals using current (non-obsolete) hacks only
-        for hack_id, hack_data in self.current_data.items():
-            difficulty = hack_data.get('current_difficulty', 'Unknown')
-            hack_types = hack_data.get('hack_types', [hack_data.get('hack_type', 'Unknown')])
-            
-            # Count difficulty and type totals from current hacks
-            difficulty_stats[difficulty]['total'] += 1
-            for hack_type in hack_types:
-                type_stats[hack_type]['total'] += 1
-        
-        # Calculate completed stats using all hacks (including obsolete)
-        for hack_id, hack_data in self.all_data.items():
-            difficulty = hack_data.get('current_difficulty', 'Unknown')
-            hack_types = hack_data.get('hack_types', [hack_data.get('hack_type', 'Unknown')])
-            completed = hack_data.get('completed', False)
-            rating = hack_data.get('personal_rating')
-            
-            # Only count completed hacks that pass the date filter
-            if completed and self._should_include_hack(hack_data):
-                # Count difficulty completions (once per hack)
-                difficulty_stats[difficulty]['completed'] += 1
-                
-                # Count type completions (once per type for multi-type hacks)
-                for hack_type in hack_types:
-                    type_stats[hack_type]['completed'] += 1
-                
-                # Rating distribution (only for filtered completed hacks)
-                if rating and rating != 'Not Rated':
-                    try:
-                        rating_val = int(rating)
-                        if 1 <= rating_val <= 5:  # Only accept valid ratings 1-5
-                            rating_counts[rating_val] += 1
-                    except (ValueError, TypeError):
-                        pass
+        # Totals from current (non-obsolete) hacks; multi-type hacks count once per type
+        for difficulty, count in columns.value_counts(columns.difficulty, columns.difficulty_table, self.current_mask).items():
+            difficulty_stats[difficulty]['total'] += count
+        for hack_type, count in columns.type_counts(self.current_mask, 'Unknown').items():
+            type_stats[hack_type]['total'] += count
+        
+        # Completed stats from all hacks (including obsolete) that pass the date filter
+        for difficulty, count in columns.value_counts(columns.difficulty, columns.difficulty_table, self.filtered_mask).items():
+            difficulty_stats[difficulty]['completed'] += count
+        for hack_type, count in columns.type_counts(self.filtered_mask, 'Unknown').items():
+            type_stats[hack_type]['completed'] += count
+        
+        # Rating distribution (only for filtered completed hacks)
+        rating_counts = Counter(compress(columns.rating, self.filtered_mask))
+        rating_counts.pop(0, None)
         
         self.analytics_data['completion_by_difficulty'] = dict(difficulty_stats)
         self.analytics_data['completion_by_type'] = dict(type_stats)
@@ -230,6 +185,7 @@ class DashboardAnalytics:
     
     def _calculate_time_metrics(self):
         """Calculate time-based performance metrics"""
+        columns = self.columns
         total_time = 0
         completed_count = 0
         
@@ -237,52 +193,11 @@ class DashboardAnalytics:
         exit_based_total_time = 0
         exit_based_total_exits = 0
         
-        # Calculate completed exits SEPARATELY from time metrics (don't require time_to_beat)
-        completed_exits = 0
-        for hack_id, hack_data in self.all_data.items():
-            if not hack_data.get('completed', False):
-                continue
-                
-            # Only include if it passes the date filter
-            if not self._should_include_hack(hack_data):
-                continue
-                
-            # Count exits from ALL completed hacks (regardless of time_to_beat)
-            exits = hack_data.get('exits', 0)
-            if isinstance(exits, str):
-                try:
-                    exits = int(exits)
-                except (ValueError, TypeError):
-                    exits = 0
-            
-            if exits > 0:
-                completed_exits += exits
+        # Count exits from ALL completed hacks in the period (regardless of time_to_beat)
+        completed_exits = columns.sum(columns.exits, self.filtered_mask)
         
         # Now calculate time-based metrics (these DO require time_to_beat > 0)
-        for hack_id, hack_data in self.all_data.items():
-            if not hack_data.get('completed', False):
-                continue
-                
-            # Only include if it passes the date filter
-            if not self._should_include_hack(hack_data):
-                continue
-                
-            time_to_beat = hack_data.get('time_to_beat', 0)
-            exits = hack_data.get('exits', 0)
-            
-            # Convert to numeric
-            if isinstance(time_to_beat, str):
-                try:
-                    time_to_beat = float(time_to_beat)
-                except (ValueError, TypeError):
-                    time_to_beat = 0
-            
-            if isinstance(exits, str):
-                try:
-                    exits = int(exits)
-                except (ValueError, TypeError):
-                    exits = 0
-            
+        for time_to_beat, exits in compress(zip(columns.time_to_beat, columns.exits), self.filtered_mask):
             # Only include in time calculations if hack has time_to_beat data
             if time_to_beat > 0:
                 total_time += time_to_beat
@@ -291,14 +206,8 @@ class DashboardAnalytics:
                 # For exit calculations: if hack has both time and exit data, use actual exits
                 # If hack has time but no exit data (exits = 0), use a reasonable default of 50 exits
                 # This allows time-based hacks to contribute to avg_time_per_exit calculations
-                if exits > 0:
-                    exit_based_total_time += time_to_beat
-                    exit_based_total_exits += exits
-                else:
-                    # Use default exit count for completed hacks with time but no exit data
-                    default_exits = 50  # Reasonable average for most SMW hacks
-                    exit_based_total_time += time_to_beat
-                    exit_based_total_exits += default_exits
+                exit_based_total_time += time_to_beat
+                exit_based_total_exits += exits if exits > 0 else 50  # Reasonable average for most SMW hacks
         
         # Store completed exits (calculated independently of time_to_beat)
         self.analytics_data['completed_exits'] = completed_exits
@@ -313,15 +222,10 @@ class DashboardAnalytics:
     
     def _calculate_streaks(self):
         """Calculate completion streaks"""
-        completion_dates = []
-        
-        for hack_data in self.data_manager.data.values():
-            if hack_data.get('completed', False) and hack_data.get('completed_date'):
-                try:
-                    date_obj = datetime.strptime(hack_data['completed_date'], '%Y-%m-%d')
-                    completion_dates.append(date_obj)
-                except ValueError:
-                    continue
+        # Distinct completion days across all completed hacks (date filter not applied)
+        completion_dates = {self.date_objects[code]
+                            for code in set(compress(self.columns.completed_date, self.completed_mask))}
+        completion_dates.discard(None)
         
         if not completion_dates:
             return
@@ -377,39 +281,25 @@ class DashboardAnalytics:
         monthly_data = defaultdict(lambda: defaultdict(list))  # month -> difficulty -> [times]
         
         # Use all data (including obsolete) for time progression since this is completion-based
-        for hack_id, hack_data in self.all_data.items():
-            if not hack_data.get('completed', False):
-                continue
-                
-            completed_date = hack_data.get('completed_date')
-            if not completed_date:
+        columns = self.columns
+        for row in compress(range(len(columns)), self.completed_mask):
+            date_obj = self.date_objects[columns.completed_date[row]]
+            if date_obj is None or date_obj < six_months_ago:
                 continue
                 
-            try:
-                date_obj = datetime.strptime(completed_date, '%Y-%m-%d')
-                if date_obj < six_months_ago:
-                    continue
-                    
+            time_to_beat = columns.time_to_beat[row]
+            if time_to_beat > 0:
                 # Get month key (YYYY-MM format)
                 month_key = date_obj.strftime('%Y-%m')
-                
-                difficulty = hack_data.get('current_difficulty', 'Unknown')
-                # Use new hack_types array - include hack in all its type categories for time progression
-                hack_types = hack_data.get('hack_types', [hack_data.get('hack_type', 'standard')])
-                time_to_beat = hack_data.get('time_to_beat', 0)
-                
-                if time_to_beat > 0:
-                    # Convert to hours
-                    time_hours = time_to_beat / 3600
-                    # Add entry for each hack type (so multi-type hacks appear in all relevant type filters)
-                    for hack_type in hack_types:
-                        monthly_data[month_key][difficulty].append({
-                            'time': time_hours,
-                            'type': hack_type
-                        })
-                    
-            except ValueError:
-                continue
+                difficulty = columns.difficulty_table.values[columns.difficulty[row]]
+                # Convert to hours
+                time_hours = time_to_beat / 3600
+                # Add entry for each hack type (so multi-type hacks appear in all relevant type filters)
+                for hack_type in columns.hack_types(row, 'standard'):
+                    monthly_data[month_key][difficulty].append({
+                        'time': time_hours,
+                        'type': hack_type
+                    })
         
         # Generate all months in the 6-month range
         progression_data = {}
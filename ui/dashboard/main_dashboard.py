@@ -11,7 +11,7 @@ import platform
 # Add paths for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from hack_data_manager import HackDataManager
+from hack_data_manager import get_hack_data_manager
 from colors import get_colors
 from ui_constants import get_page_padding
 from .analytics import DashboardAnalytics
@@ -25,10 +25,13 @@ class DashboardPage:
         self.parent_frame = parent_frame
         self.logger = logger
         self.frame = None
-        self.data_manager = HackDataManager(logger=logger)
+        self.data_manager = get_hack_data_manager(logger=logger)
         self.analytics = DashboardAnalytics(self.data_manager)
         self.analytics_data = {}
         self.date_filter = "last_week"
+        self._loaded_filter = None  # date_filter the analytics were computed for
+        self._data_changed = True
+        self.data_manager.subscribe(self._on_data_changed)
         
         # Scrolling components
         self.canvas = None
@@ -130,8 +133,20 @@ class DashboardPage:
         # Focus the frame so it can receive mouse wheel events
         self.frame.focus_set()
     
+    def _on_data_changed(self, event, hack_ids):
+        """Shared hack store changed - recompute analytics on the next refresh"""
+        self._data_changed = True
+        # The first paint may have used a partially loaded library
+        if event == "loaded" and self.frame:
+            try:
+                self.frame.after(0, self._refresh_dashboard)
+            except (tk.TclError, RuntimeError):
+                pass
+    
     def _load_analytics_data(self):
         """Load analytics data using the analytics module"""
+        self._data_changed = False
+        self._loaded_filter = self.date_filter
         self.analytics_data = self.analytics.load_analytics_data(self.date_filter)
         
         if self.logger:
@@ -198,10 +213,9 @@ class DashboardPage:
         if self.logger:
             self.logger.log("Refreshing dashboard data...", level="info")
         
-        # Reload data
-        self.data_manager = HackDataManager(logger=self.logger)
-        self.analytics = DashboardAnalytics(self.data_manager)
-        self._load_analytics_data()
+        # Recompute analytics only if the shared store changed or the date filter did
+        if self._data_changed or self._loaded_filter != self.date_filter or not self.analytics_data:
+            self._load_analytics_data()
         
         # Clear and recreate content
         for widget in self.scrollable_frame.winfo_children():
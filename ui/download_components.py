@@ -11,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from utils import TYPE_DISPLAY_LOOKUP, DIFFICULTY_LOOKUP, format_types_display
 from ui_constants import get_labelframe_padding
 from ui.components import DifficultySection
+from ui.components.tree_rows import VirtualTreeRows
 import sv_ttk
 
 class DownloadFilters:
@@ -321,7 +322,12 @@ class DownloadFilters:
 
 
 class DownloadResults:
-    """Results table component for single download page"""
+    """Results table component for single download page
+    
+    The results live in a model (search_results in display order, selection as
+    a dict keyed by hack id) and the Treeview only holds the rows in view, so
+    large result sets stay responsive.
+    """
     
     def __init__(self, parent, callback_selection_change, filters=None):
         self.parent = parent
@@ -330,13 +336,18 @@ class DownloadResults:
         
         # Table state
         self.tree = None
+        self.view = None  # VirtualTreeRows rendering the visible window
         self.status_label = None
-        self.search_results = []
-        self.selected_hacks = []
+        self.search_results = []  # Model, in display order
+        self.selected = {}  # hack id -> hack, in selection order
         self.sort_column = "date"
         self.sort_reverse = True  # Default to descending (newest first)
         self.select_all_state = False  # Track select all checkbox state
         
+        # Model lookups
+        self._hacks_by_id = {}  # hack id -> hack for every result
+        self._row_values = {}  # hack id -> formatted cells (without the check mark)
+        
         # Progressive loading state
         self.is_progressive_loading = False
         self.downloaded_hack_ids = set()  # Cache of downloaded hack IDs for styling
@@ -348,49 +359,96 @@ class DownloadResults:
     def _load_downloaded_hacks(self):
         """Load the set of downloaded hack IDs for styling purposes"""
         try:
-            from hack_data_manager import HackDataManager
-            hack_manager = HackDataManager()
+            from hack_data_manager import get_hack_data_manager
+            hack_manager = get_hack_data_manager()
             # Get all hack IDs including obsolete versions for downloaded styling
             # We want to show ALL downloaded hacks as italic, even obsolete versions
-            all_hacks = hack_manager.get_all_hacks(include_obsolete=True)
-            self.downloaded_hack_ids = set(hack['id'] for hack in all_hacks)
+            self.downloaded_hack_ids = hack_manager.get_hack_ids(include_obsolete=True)
+            # Keep the set current as downloads finish instead of re-reading processed.json
+            hack_manager.subscribe(self._on_store_changed)
+            if self.tree:
+                self.tree.bind("<Destroy>", lambda e: self.cleanup(), add="+")
         except Exception:
             # If we can't load for any reason, just use empty set
             self.downloaded_hack_ids = set()
     
-    def refresh_downloaded_styling(self):
-        """Refresh the downloaded hack cache and update visual styling of all items"""
+    def cleanup(self):
+        """Stop following the shared store (called when the table is destroyed)"""
+        try:
+            from hack_data_manager import get_hack_data_manager
+            get_hack_data_manager().unsubscribe(self._on_store_changed)
+        except Exception:
+            pass
+    
+    def _on_store_changed(self, event, hack_ids):
+        """Shared store changed (may run on a worker thread) - apply on the UI thread"""
+        if not self.tree:
+            return
+        try:
+            self.tree.after(0, lambda: self._apply_store_change(hack_ids))
+        except (tk.TclError, RuntimeError):
+            pass
+    
+    def _apply_store_change(self, hack_ids):
+        """Update downloaded IDs for changed records and restyle if any flipped"""
+        from hack_data_manager import get_hack_data_manager
+        data = get_hack_data_manager().data
+        changed = []
+        for hack_id in hack_ids:
+            entry = data.get(hack_id)
+            is_downloaded = isinstance(entry, dict) and "title" in entry
+            if is_downloaded != (hack_id in self.downloaded_hack_ids):
+                if is_downloaded:
+                    self.downloaded_hack_ids.add(hack_id)
+                else:
+                    self.downloaded_hack_ids.discard(hack_id)
+                changed.append(hack_id)
+        if changed:
+            self.refresh_downloaded_styling(changed)
+    
+    def _row_for(self, hack_id):
+        """(values, tags) for a hack's row, from the model and the selection"""
+        values = self._row_values.get(hack_id)
+        if values is None:
+            values = self._row_values[hack_id] = self._format_hack_row(self._hacks_by_id[hack_id])
+        is_downloaded = hack_id in self.downloaded_hack_ids
+        if hack_id in self.selected:
+            return ("✓",) + values, ("downloaded_selected" if is_downloaded else "selected",)
+        return ("",) + values, ("downloaded" if is_downloaded else "unselected",)
+    
+    def _reset_model(self):
+        """Drop all results and selections"""
+        self.search_results = []
+        self.selected = {}
+        self._hacks_by_id = {}
+        self._row_values = {}
+        if self.view:
+            self.view.clear()
+    
+    def _add_to_model(self, hacks):
+        """Append hacks not already in the results; returns their ids"""
+        new_ids = []
+        for hack in hacks:
+            hack_id = str(hack.get("id", ""))
+            if hack_id in self._hacks_by_id:
+                continue
+            self._hacks_by_id[hack_id] = hack
+            self.search_results.append(hack)
+            new_ids.append(hack_id)
+        return new_ids
+    
+    def refresh_downloaded_styling(self, hack_ids=None):
+        """Restyle rendered rows after downloaded status changed
+        
+        Only the visible window is in the tree, so this re-renders at most a
+        few dozen rows whatever hack_ids says.
+        """
         # Only reload downloaded hack IDs if not already loaded (optimization)
         if not hasattr(self, 'downloaded_hack_ids') or not self.downloaded_hack_ids:
             self._load_downloaded_hacks()
         
-        # Update the styling of all visible items efficiently
-        if self.tree and self.tree.get_children():
-            # Batch process all items to reduce individual tree operations
-            items_to_update = []
-            
-            for item in self.tree.get_children():
-                item_index = self.tree.index(item)
-                if item_index < len(self.search_results):
-                    hack = self.search_results[item_index]
-                    hack_id = str(hack.get("id", ""))
-                    is_downloaded = hack_id in self.downloaded_hack_ids
-                    
-                    # Get current selection state
-                    current_values = self.tree.item(item, "values")
-                    is_selected = current_values[0] == "✓"
-                    
-                    # Determine the correct tag
-                    if is_selected:
-                        tag = "downloaded_selected" if is_downloaded else "selected"
-                    else:
-                        tag = "downloaded" if is_downloaded else "unselected"
-                    
-                    items_to_update.append((item, tag))
-            
-            # Apply all tag updates at once
-            for item, tag in items_to_update:
-                self.tree.item(item, tags=(tag,))
+        if self.view:
+            self.view.refresh()
 
     def update_theme_colors(self):
         """Update tag configurations when theme changes"""
@@ -445,7 +503,8 @@ class DownloadResults:
             self.tree.column(col, width=width, minwidth=min_width, anchor=anchor)
         
         # Scrollbars (horizontal only shown when needed)
-        v_scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=self.tree.yview)
+        # The vertical scrollbar follows the result model, not the rendered rows (see VirtualTreeRows)
+        v_scrollbar = ttk.Scrollbar(results_frame, orient="vertical")
         h_scrollbar = ttk.Scrollbar(results_frame, orient="horizontal", command=self.tree.xview)
         
         # Configure scrollbars with auto-hide for horizontal
@@ -455,8 +514,8 @@ class DownloadResults:
             if tree_width > 1:  # Avoid division by zero
                 # Check if content is wider than visible area
                 try:
-                    bbox = self.tree.bbox(self.tree.get_children()[0]) if self.tree.get_children() else None
-                    if bbox:
+                    # Only the rendered window is in the tree; any row means there is content
+                    if self.tree.get_children():
                         # Show/hide horizontal scrollbar based on content width
                         total_width = sum([self.tree.column(col, "width") for col in self.tree["columns"]])
                         if total_width > tree_width:
@@ -468,8 +527,9 @@ class DownloadResults:
                 except (IndexError, tk.TclError):
                     h_scrollbar.grid_remove()
         
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
         self.tree.bind('<Configure>', on_configure)
+        self.view = VirtualTreeRows(self.tree, v_scrollbar, self._row_for)
         
         # Grid layout
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -543,42 +603,43 @@ class DownloadResults:
                 self.tree.heading(col, text=base_text)
     
     def _sort_results(self):
-        """Sort the current results and update the tree display"""
+        """Sort the result model and re-render the visible window"""
         if not self.search_results:
             return
         
-        # Create a list of (hack, item_id) pairs for sorting
-        items_data = []
-        for item in self.tree.get_children():
-            item_index = self.tree.index(item)
-            if item_index < len(self.search_results):
-                hack = self.search_results[item_index]
-                items_data.append((hack, item, self.tree.item(item, "values")))
+        # Sort keys come from the formatted cells (without the check mark), like the table shows them
+        def cells(hack):
+            hack_id = str(hack.get("id", ""))
+            values = self._row_values.get(hack_id)
+            if values is None:
+                values = self._row_values[hack_id] = self._format_hack_row(hack)
+            return values
+        
+        def number(text, convert):
+            return convert(text) if text != "N/A" else -1
         
         # Sort based on the selected column
         if self.sort_column == "title":
-            items_data.sort(key=lambda x: x[0].get("name", "").lower(), reverse=self.sort_reverse)
+            key = lambda hack: hack.get("name", "").lower()
         elif self.sort_column == "type":
-            items_data.sort(key=lambda x: x[2][2], reverse=self.sort_reverse)
+            key = lambda hack: cells(hack)[1]
         elif self.sort_column == "difficulty":
-            items_data.sort(key=lambda x: x[2][3], reverse=self.sort_reverse)
+            key = lambda hack: cells(hack)[2]
         elif self.sort_column == "rating":
-            items_data.sort(key=lambda x: float(x[2][4]) if x[2][4] != "N/A" else -1, reverse=self.sort_reverse)
+            key = lambda hack: number(cells(hack)[3], float)
         elif self.sort_column == "downloads":
-            items_data.sort(key=lambda x: int(x[2][5]) if x[2][5] != "N/A" else -1, reverse=self.sort_reverse)
+            key = lambda hack: number(cells(hack)[4], int)
         elif self.sort_column == "exits":
-            items_data.sort(key=lambda x: int(x[2][6]) if x[2][6] != "N/A" else -1, reverse=self.sort_reverse)
+            key = lambda hack: number(cells(hack)[5], int)
         elif self.sort_column == "authors":
-            items_data.sort(key=lambda x: x[2][7].lower(), reverse=self.sort_reverse)
+            key = lambda hack: cells(hack)[6].lower()
         elif self.sort_column == "date":
-            items_data.sort(key=lambda x: x[2][8], reverse=self.sort_reverse)
-        
-        # Reorder items in tree
-        for index, (hack, item, values) in enumerate(items_data):
-            self.tree.move(item, "", index)
+            key = lambda hack: cells(hack)[7]
+        else:
+            return
         
-        # Update search_results to match new order
-        self.search_results = [item[0] for item in items_data]
+        self.search_results.sort(key=key, reverse=self.sort_reverse)
+        self.view.set_keys(str(hack.get("id", "")) for hack in self.search_results)
     
     def _on_tree_click(self, event):
         """Handle tree item click for selection"""
@@ -595,47 +656,24 @@ class DownloadResults:
     
     def _toggle_selection(self, item):
         """Toggle selection state of an item with proper downloaded styling"""
-        current_values = list(self.tree.item(item, "values"))
-        current_tags = self.tree.item(item, "tags")
-        
-        # Determine if this item is downloaded
-        item_index = self.tree.index(item)
-        is_downloaded = False
-        hack = None
+        hack_id = self.view.key_for(item)
+        if hack_id is None:
+            return
         
-        # Safely get hack data with bounds checking
-        if item_index < len(self.search_results):
-            hack = self.search_results[item_index]
-            hack_id = str(hack.get("id", ""))
-            is_downloaded = hack_id in self.downloaded_hack_ids
-        
-        if current_values[0] == "":
-            # Select the item
-            current_values[0] = "✓"
-            # Choose tag based on downloaded status
-            tag = "downloaded_selected" if is_downloaded else "selected"
-            self.tree.item(item, values=current_values, tags=(tag,))
-            
-            # Add to selected hacks (only if we have valid hack data)
-            if hack is not None and hack not in self.selected_hacks:
-                self.selected_hacks.append(hack)
+        if hack_id in self.selected:
+            del self.selected[hack_id]
         else:
-            # Deselect the item
-            current_values[0] = ""
-            # Choose tag based on downloaded status
-            tag = "downloaded" if is_downloaded else "unselected"
-            self.tree.item(item, values=current_values, tags=(tag,))
-            
-            # Remove from selected hacks (only if we have valid hack data)
-            if hack is not None and hack in self.selected_hacks:
-                self.selected_hacks.remove(hack)
+            self.selected[hack_id] = self._hacks_by_id[hack_id]
+        
+        # Rewrite just this row's check mark and tag
+        self.view.rows.update_row(hack_id, *self._row_for(hack_id))
         
         # Notify parent of selection change
         self.callback_selection_change()
     
     def toggle_select_all(self):
-        """Toggle selection state of all visible items with proper downloaded styling"""
-        if not self.tree or not self.tree.get_children():
+        """Toggle selection state of every result with proper downloaded styling"""
+        if not self.search_results:
             return
         
         # Determine new state based on current select_all_state
@@ -645,39 +683,13 @@ class DownloadResults:
         header_text = "✓"  # Keep single checkmark always
         self.tree.heading("select", text=header_text)
         
-        # Apply selection state to all visible items
-        for item in self.tree.get_children():
-            current_values = list(self.tree.item(item, "values"))
-            item_index = self.tree.index(item)
-            
-            # Determine if this item is downloaded with bounds checking
-            is_downloaded = False
-            hack = None
-            if item_index < len(self.search_results):
-                hack = self.search_results[item_index]
-                hack_id = str(hack.get("id", ""))
-                is_downloaded = hack_id in self.downloaded_hack_ids
-            
-            if self.select_all_state:
-                # Select the item
-                current_values[0] = "✓"
-                # Choose tag based on downloaded status
-                tag = "downloaded_selected" if is_downloaded else "selected"
-                self.tree.item(item, values=current_values, tags=(tag,))
-                
-                # Add to selected hacks if not already there (only if we have valid hack data)
-                if hack is not None and hack not in self.selected_hacks:
-                    self.selected_hacks.append(hack)
-            else:
-                # Deselect the item
-                current_values[0] = ""
-                # Choose tag based on downloaded status
-                tag = "downloaded" if is_downloaded else "unselected"
-                self.tree.item(item, values=current_values, tags=(tag,))
-                
-                # Remove from selected hacks (only if we have valid hack data)
-                if hack is not None and hack in self.selected_hacks:
-                    self.selected_hacks.remove(hack)
+        # Selection lives in the model; only the rendered rows need rewriting
+        if self.select_all_state:
+            for hack_id, hack in self._hacks_by_id.items():
+                self.selected.setdefault(hack_id, hack)
+        else:
+            self.selected = {}
+        self.view.refresh()
         
         # Notify parent of selection change
         self.callback_selection_change()
@@ -689,13 +701,8 @@ class DownloadResults:
         # Refresh downloaded hack cache before search to catch any newly downloaded hacks
         self._load_downloaded_hacks()
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Reset state
-        self.search_results = []
-        self.selected_hacks = []
+        # Clear existing results and reset state
+        self._reset_model()
         self.select_all_state = False
         self.tree.heading("select", text="✓")
     
@@ -704,7 +711,7 @@ class DownloadResults:
         if not self.is_progressive_loading:
             return
         
-        # Apply "Show Only Non-Downloaded" filter if enabled before adding to tree
+        # Apply "Show Only Non-Downloaded" filter if enabled before adding to the model
         filtered_new_results = new_results
         if self.filters and self.filters.show_only_new_var.get():
             # Filter out already-downloaded hacks
@@ -714,13 +721,8 @@ class DownloadResults:
                 if hack_id not in self.downloaded_hack_ids:
                     filtered_new_results.append(hack)
         
-        # During progressive loading, search_results should only contain what's visible in the tree
-        # This ensures tree indices match search_results indices for proper selection handling
-        self.search_results.extend(filtered_new_results)
-        
-        # Add each filtered hack to the tree
-        for hack in filtered_new_results:
-            self._add_hack_to_tree(hack)
+        # New rows are only rendered if they land in the visible window
+        self.view.append_keys(self._add_to_model(filtered_new_results))
         
         # Update status
         self.set_status(status_text)
@@ -742,9 +744,14 @@ class DownloadResults:
                 if hack_id not in self.downloaded_hack_ids:
                     filtered_results.append(hack)
         
-        # search_results should already contain the filtered results from progressive loading
-        # but we'll update it to the final filtered set to ensure consistency
-        self.search_results = filtered_results
+        # The model should already hold the filtered results from progressive loading
+        # but we'll rebuild it from the final filtered set to ensure consistency
+        selected = self.selected
+        self.search_results = []
+        self._hacks_by_id = {}
+        self._add_to_model(filtered_results)
+        self.selected = {hack_id: hack for hack_id, hack in selected.items() if hack_id in self._hacks_by_id}
+        self.view.set_keys(self._hacks_by_id)
         
         # Now that loading is complete, sort the results
         if self.search_results:
@@ -777,8 +784,8 @@ class DownloadResults:
         self.add_progressive_results(results, f"Found {len(results)} hacks")
         self.complete_progressive_display(results, time_period_filter)
     
-    def _add_hack_to_tree(self, hack):
-        """Add a single hack to the tree view with downloaded status styling"""
+    def _format_hack_row(self, hack):
+        """Format a hack's display cells (everything after the check mark column)"""
         # Format the data for display
         title = hack.get("name", "Unknown")
         
@@ -855,31 +862,11 @@ class DownloadResults:
         if len(authors) > 20:
             authors = authors[:17] + "..."
         
-        # Check if this hack is already downloaded
-        hack_id = str(hack.get("id", ""))
-        is_downloaded = hack_id in self.downloaded_hack_ids
-        
-        # Choose appropriate tag based on download status
-        tag = "downloaded" if is_downloaded else "unselected"
-        
-        self.tree.insert("", "end", values=(
-            "",  # Empty for unselected
-            title,
-            hack_type,
-            difficulty,
-            rating,
-            downloads,
-            exits,
-            authors,
-            date
-        ), tags=(tag,))
+        return (title, hack_type, difficulty, rating, downloads, exits, authors, date)
     
     def clear_results(self):
         """Clear search results"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self.search_results = []
-        self.selected_hacks = []
+        self._reset_model()
         # Reset select all state
         self.select_all_state = False
         if self.tree:
@@ -887,27 +874,15 @@ class DownloadResults:
     
     def clear_selection(self):
         """Clear all selections with proper downloaded styling"""
-        self.selected_hacks = []
+        self.selected = {}
         
         # Reset select all state
         self.select_all_state = False
         if self.tree:
             self.tree.heading("select", text="✓")
         
-        for item in self.tree.get_children():
-            current_values = list(self.tree.item(item, "values"))
-            current_values[0] = ""
-            
-            # Determine if this item is downloaded to set proper tag with bounds checking
-            item_index = self.tree.index(item)
-            is_downloaded = False
-            if item_index < len(self.search_results):
-                hack = self.search_results[item_index]
-                hack_id = str(hack.get("id", ""))
-                is_downloaded = hack_id in self.downloaded_hack_ids
-            
-            tag = "downloaded" if is_downloaded else "unselected"
-            self.tree.item(item, values=current_values, tags=(tag,))
+        if self.view:
+            self.view.refresh()
     
     def set_status(self, text):
         """Set the status label text"""
@@ -916,53 +891,24 @@ class DownloadResults:
     
     def get_selected_count(self):
         """Get the number of selected hacks"""
-        return len(self.selected_hacks)
+        return len(self.selected)
     
     def get_selected_hacks(self):
         """Get the list of selected hacks"""
-        return self.selected_hacks.copy()
+        return list(self.selected.values())
 
     def uncheck_hacks_by_ids(self, hack_ids_to_uncheck):
         """Uncheck specific hacks by their IDs, keeping all other selections intact"""
         if not hack_ids_to_uncheck or not self.tree:
             return
         
-        # Convert hack IDs to strings for comparison
-        hack_ids_set = set(str(hack_id) for hack_id in hack_ids_to_uncheck)
-        
-        # Track which hacks to remove from selected_hacks
-        hacks_to_remove = []
-        
-        # Go through all tree items and uncheck matching hack IDs
-        for item in self.tree.get_children():
-            item_index = self.tree.index(item)
-            if item_index < len(self.search_results):
-                hack = self.search_results[item_index]
-                hack_id = str(hack.get("id", ""))
-                
-                # If this hack was downloaded, uncheck it
-                if hack_id in hack_ids_set:
-                    current_values = list(self.tree.item(item, "values"))
-                    
-                    # Only uncheck if it's currently checked
-                    if current_values[0] == "✓":
-                        current_values[0] = ""
-                        
-                        # Determine proper tag based on downloaded status
-                        is_downloaded = hack_id in self.downloaded_hack_ids
-                        tag = "downloaded" if is_downloaded else "unselected"
-                        self.tree.item(item, values=current_values, tags=(tag,))
-                        
-                        # Mark hack for removal from selected_hacks
-                        hacks_to_remove.append(hack)
-        
-        # Remove unchecked hacks from selected_hacks list
-        for hack in hacks_to_remove:
-            if hack in self.selected_hacks:
-                self.selected_hacks.remove(hack)
+        # Drop them from the selection; rendered rows pick up the change on refresh
+        for hack_id in hack_ids_to_uncheck:
+            self.selected.pop(str(hack_id), None)
+        self.view.refresh()
         
         # Update select all state if all items are now unselected
-        if not self.selected_hacks:
+        if not self.selected:
             self.select_all_state = False
             if self.tree:
                 self.tree.heading("select", text="✓")
@@ -974,11 +920,13 @@ class DownloadResults:
 class DownloadButton:
     """Download button component for single download page"""
     
-    def __init__(self, parent, callback_download, callback_cancel=None):
+    def __init__(self, parent, callback_download, callback_cancel=None, callback_retry=None):
         self.parent = parent
         self.callback_download = callback_download
         self.callback_cancel = callback_cancel
+        self.callback_retry = callback_retry
         self.download_button = None
+        self.retry_button = None
         self.progress_label = None
         self.is_downloading = False
         
@@ -990,15 +938,28 @@ class DownloadButton:
         download_frame = ttk.Frame(self.parent)
         download_frame.pack(fill="x", pady=(10, 0))
         
+        buttons_row = ttk.Frame(download_frame)
+        buttons_row.pack()
+
         # Download button
         self.download_button = ttk.Button(
-            download_frame,
+            buttons_row,
             text="Download & Patch",
             command=self._handle_download_cancel,
             style="Large.Accent.TButton",
             state="disabled"
         )
-        self.download_button.pack()
+        self.download_button.pack(side="left")
+
+        # Retry button for hacks left in the retry queue by earlier downloads
+        if self.callback_retry:
+            self.retry_button = ttk.Button(
+                buttons_row,
+                text="Retry Failed",
+                command=self._handle_retry,
+                state="disabled"
+            )
+            self.retry_button.pack(side="left", padx=(10, 0))
         
         # Progress label (initially hidden)
         self.progress_label = ttk.Label(
@@ -1020,6 +981,21 @@ class DownloadButton:
             self.clear_completion_message()
             self.callback_download()
     
+    def _handle_retry(self):
+        """Handle retry button clicks"""
+        if not self.is_downloading and self.callback_retry:
+            self.clear_completion_message()
+            self.callback_retry()
+
+    def update_retry_state(self, retry_count):
+        """Update retry button based on the number of retryable hacks"""
+        if not self.retry_button:
+            return
+        if retry_count > 0 and not self.is_downloading:
+            self.retry_button.configure(state="normal", text=f"Retry Failed ({retry_count})")
+        else:
+            self.retry_button.configure(state="disabled", text=f"Retry Failed ({retry_count})" if retry_count else "Retry Failed")
+
     def update_state(self, selected_count):
         """Update button state based on selected count"""
         if not self.is_downloading:
@@ -1036,6 +1012,8 @@ class DownloadButton:
         if is_downloading:
             self.download_button.configure(text="Cancel", state="normal")
             self.progress_label.configure(text="Starting download...")
+            if self.retry_button:
+                self.retry_button.configure(state="disabled")
         else:
             # Reset to normal state - let update_state handle the proper text
             self.download_button.configure(state="normal")
@@ -29,6 +29,9 @@ class MainLayout:
         
         # Pages
         self.dashboard_page = None
+        self.download_page = None
+        self.settings_page = None
+        self.collection_page = None
         self.single_download_page = None
         self.bulk_download_page = None
         self.hack_collection_page = None
@@ -71,25 +74,32 @@ class MainLayout:
         return self.content_frame
     
     def _create_pages(self):
-        """Create and register all pages"""
-        # Create dashboard page - NEW DEFAULT PAGE
+        """Register all pages - each one is built the first time it is shown"""
+        self.page_manager.register_page("Dashboard", self._create_dashboard_page)
+        self.page_manager.register_page("Download", self._create_download_page)
+        self.page_manager.register_page("Settings", self._create_settings_page)
+        self.page_manager.register_page("Collection", self._create_collection_page)
+
+    def _create_dashboard_page(self):
+        """Create dashboard page - DEFAULT PAGE"""
         self.dashboard_page = DashboardPage(self.content_frame, self.logger)
         dashboard_frame = self.dashboard_page.create()
-        self.page_manager.add_page("Dashboard", dashboard_frame)
         
         # Store dashboard instance reference in root for theme toggling
         self.root.dashboard_page = self.dashboard_page
-        
-        # Create download page (renamed from single download)
+        return dashboard_frame
+
+    def _create_download_page(self):
+        """Create download page (renamed from single download)"""
         self.download_page = DownloadPage(
             self.content_frame,
             self.run_pipeline_func,
             self.logger
         )
-        download_frame = self.download_page.create()
-        self.page_manager.add_page("Download", download_frame)
-        
-        # Create settings page (renamed from bulk download)
+        return self.download_page.create()
+
+    def _create_settings_page(self):
+        """Create settings page (renamed from bulk download)"""
         self.settings_page = SettingsPage(
             self.content_frame,
             self.run_pipeline_func,
@@ -99,23 +109,33 @@ class MainLayout:
             self.logger
         )
         settings_frame = self.settings_page.create()
-        self.page_manager.add_page("Settings", settings_frame)
         
         # Store log_text reference for theme toggling
         if hasattr(self.settings_page, 'frame') and hasattr(self.logger, 'log_text'):
             self.root.log_text = self.logger.log_text
         
-        # Create collection page (renamed from hack history)
-        self.collection_page = CollectionPage(self.content_frame, self.logger)
-        collection_frame = self.collection_page.create()
-        self.page_manager.add_page("Collection", collection_frame)
-        
         # Register reload callback for metadata migration
-        self.settings_page.reload_collection_callback = self.collection_page._refresh_data_and_table
+        self.settings_page.reload_collection_callback = self._reload_collection_if_built
 
         # Wire up emulator settings callback so setting/changing the emulator path
         # immediately refreshes the play icon column in the collection table.
-        self.settings_page.emulator_settings_callback = self.collection_page.refresh_emulator_cache
+        self.settings_page.emulator_settings_callback = self._refresh_emulator_cache_if_built
+        return settings_frame
+
+    def _create_collection_page(self):
+        """Create collection page (renamed from hack history)"""
+        self.collection_page = CollectionPage(self.content_frame, self.logger)
+        return self.collection_page.create()
+
+    def _reload_collection_if_built(self):
+        """Reload the collection from disk - an unbuilt page loads fresh data when first shown"""
+        if self.collection_page:
+            return self.collection_page._refresh_data_and_table(reload_from_disk=True)
+
+    def _refresh_emulator_cache_if_built(self):
+        """Refresh the collection's play icons if the page exists"""
+        if self.collection_page:
+            return self.collection_page.refresh_emulator_cache()
 
     
     def get_download_button(self):
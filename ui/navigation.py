@@ -135,9 +135,14 @@ class NavigationBar:
     def show_page(self, page_name):
         """Switch to a specific page"""
         self.current_page = page_name
+        # Pages load their data when first built, so only refresh on later visits
+        already_built = self.page_manager.is_built(page_name)
         self.page_manager.show_page(page_name)
         self._update_tab_styles(page_name)
         
+        if not already_built:
+            return
+        
         # Refresh dashboard when Dashboard tab is clicked
         if page_name == "Dashboard":
             # Small delay to ensure page is shown first
@@ -6,14 +6,36 @@ class PageManager:
     def __init__(self, content_frame):
         self.content_frame = content_frame
         self.pages = {}
+        self.page_factories = {}
         self.current_page = None
     
     def add_page(self, name, page_frame):
         """Add a page to the manager"""
         self.pages[name] = page_frame
     
+    def register_page(self, name, factory):
+        """Register a page that is built on first navigation
+
+        The factory is called with no arguments and must return the page frame.
+        """
+        self.page_factories[name] = factory
+    
+    def is_built(self, page_name):
+        """Check whether a page's frame has been created"""
+        return page_name in self.pages
+    
+    def ensure_page(self, page_name):
+        """Build a registered page if it hasn't been built yet, returning its frame"""
+        if page_name not in self.pages and page_name in self.page_factories:
+            factory = self.page_factories.pop(page_name)
+            self.pages[page_name] = factory()
+        return self.pages.get(page_name)
+    
     def show_page(self, page_name):
         """Show a specific page and hide others"""
+        # Build the page on first visit
+        self.ensure_page(page_name)
+        
         # Hide all pages
         for name, frame in self.pages.items():
             frame.pack_forget()
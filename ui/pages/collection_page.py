@@ -8,9 +8,11 @@ import shlex
 import re
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from hack_data_manager import HackDataManager
+from hack_data_manager import get_hack_data_manager
 from ui.collection_components import InlineEditor, DateValidator, NotesValidator, HackCollectionInlineEditor
 from ui.components.table_filters import TableFilters
+from ui.components.tree_rows import TreeRowReconciler
+from ui.components.compute_worker import LatestJobWorker
 from ui_constants import get_page_padding, get_section_padding
 from file_explorer_utils import open_file_in_explorer, get_file_icon_unicode
 
@@ -37,7 +39,9 @@ class CollectionPage:
         self.parent = parent
         self.frame = None
         self.logger = logger  # Add logger support
-        self.data_manager = HackDataManager(logger=logger)
+        self.data_manager = get_hack_data_manager(logger=logger)
+        self._store_refresh_job = None
+        self._compute = None  # LatestJobWorker for filtering/formatting, started on first refresh
         
         # v3.1 NEW: Pagination state
         self.current_page = 1
@@ -47,6 +51,9 @@ class CollectionPage:
         # Sorting state - Default to title ascending
         self.sort_column = "title"
         self.sort_reverse = False
+        # Typing a new search ranks results by relevance until a column is clicked
+        self.sort_by_relevance = False
+        self._last_search_query = ""
         
         # Column Configuration (ID, Header, Width, MinWidth, Anchor)
         # DEFAULT_COLUMNS stores the original default order - never modified
@@ -106,7 +113,9 @@ class CollectionPage:
         
         # Table and data
         self.tree = None
+        self.rows = None  # TreeRowReconciler keyed by hack id
         self.filtered_data = []
+        self._filtered_by_id = None  # Lazy id -> hack lookup for filtered_data
         self.status_label = None
         
         # Cache ConfigManager instance and emulator path for performance
@@ -170,7 +179,7 @@ class CollectionPage:
                     if isinstance(child, ttk.Frame):
                         for grandchild in child.winfo_children():
                             if isinstance(grandchild, ttk.Button) and "Refresh" in grandchild.cget("text"):
-                                grandchild.configure(command=self._refresh_data_and_table)
+                                grandchild.configure(command=lambda: self._refresh_data_and_table(reload_from_disk=True))
         
         # v3.1 NEW: Create pagination controls
         self._create_pagination_controls()
@@ -181,6 +190,9 @@ class CollectionPage:
         # Load initial data
         self._refresh_data_and_table()
         
+        # Follow changes to the shared hack store (downloads, metadata fetches, reloads)
+        self.data_manager.subscribe(self._on_store_changed)
+        
         return self.frame
     
     def show(self):
@@ -207,9 +219,35 @@ class CollectionPage:
         except ImportError:
             pass
             
+        self.data_manager.unsubscribe(self._on_store_changed)
+        self.filters.cleanup()
+        if self._compute is not None:
+            self._compute.close()
+        
         # Force save any pending changes
         self.data_manager.force_save()
     
+    def _on_store_changed(self, event, hack_ids):
+        """Shared store changed - may be called from a worker thread"""
+        # Our own edits already update the table; only follow outside changes
+        # (and the background load filling in the library)
+        if event not in ("synced", "reloaded", "loading", "loaded") or getattr(self, '_is_refreshing', False) or not self.frame:
+            return
+        try:
+            self.frame.after(0, self._schedule_store_refresh)
+        except (tk.TclError, RuntimeError):
+            pass
+    
+    def _schedule_store_refresh(self):
+        """Coalesce bursts of store changes into one table refresh"""
+        if self._store_refresh_job:
+            self.frame.after_cancel(self._store_refresh_job)
+        self._store_refresh_job = self.frame.after(300, self._refresh_from_store)
+    
+    def _refresh_from_store(self):
+        self._store_refresh_job = None
+        self._refresh_data_and_table()
+    
     def _on_download_state_change(self, download_active):
         """Handle download state changes"""
         if hasattr(self, 'download_status_label') and self.download_status_label:
@@ -235,6 +273,7 @@ class CollectionPage:
             col_id = col_config["id"]
             self.tree.heading(col_id, text=col_config["header"], command=lambda c=col_id: self._sort_by_column(c))
             self.tree.column(col_id, width=col_config["width"], minwidth=col_config["min_width"], anchor=col_config["anchor"])
+        self.rows = TreeRowReconciler(self.tree)
             
         # Set initial visibility
         self.tree["displaycolumns"] = self.visible_columns
@@ -270,8 +309,13 @@ class CollectionPage:
         self.status_label = ttk.Label(footer_frame, text="", font=("Segoe UI", 9))
         self.status_label.pack(anchor="center")
     
-    def _refresh_data_and_table(self):
-        """Reload all data and refresh the table"""
+    def _refresh_data_and_table(self, reload_from_disk=False):
+        """Refresh the table from the shared store
+
+        Args:
+            reload_from_disk (bool): Re-read processed.json first, for changes made
+                outside save_processed (Refresh button, difficulty migration)
+        """
         # Guard against duplicate calls
         if hasattr(self, '_is_refreshing') and self._is_refreshing:
             self._log("DEBUG: Skipping duplicate refresh call", "Debug")
@@ -294,66 +338,135 @@ class CollectionPage:
                 else:
                     self._log("❌ Failed to save changes before refresh", "Error")
             
-            # Reload data from disk to pick up external changes (e.g. metadata fetch)
-            self.data_manager.reload_data()
+            # Pipeline saves reach the shared store directly; only re-read the file when asked
+            if reload_from_disk:
+                self.data_manager.reload_data()
             self.filters.refresh_dropdown_values(self.data_manager)
             
             # Apply filters and sorting
-            self._apply_filters()
             self._refresh_table()
             
             self._log(f"🔄 Refreshed hack data from file", "Debug")
         finally:
             self._is_refreshing = False
     
-    def _refresh_table(self):
-        """Refresh table data with pagination and sorting"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _refresh_table(self, on_applied=None):
+        """Refresh table data with pagination and sorting
         
+        Filtering, sorting and row formatting run on the compute worker; only
+        the finished page is applied here on the main thread. Requests made
+        while one is computing supersede it, so typing never queues up work.
+        
+        Args:
+            on_applied: Optional callable run once this refresh reaches the tree
+        """
         # Get filtered data - include obsolete hacks so table filters can handle them
         all_hacks = self.data_manager.get_all_hacks(include_obsolete=True)
-        self.filtered_data = self.filters.apply_filters(all_hacks)
+        # A changed search query switches to relevance ordering
+        search_query = self.filters.search_query
+        if search_query != self._last_search_query:
+            self._last_search_query = search_query
+            self.sort_by_relevance = bool(search_query)
+        
+        # Everything the worker needs is read here; Tk variables stay on this thread
+        request = {
+            "hacks": all_hacks,
+            "spec": self.filters.compile_filter_spec(),
+            # Column sorting comes from the filter index's presorted orders
+            "sort_column": None if self.sort_by_relevance else self.sort_column,
+            "reverse": self.sort_reverse,
+            "relevance": self.sort_by_relevance,
+            "page": self.current_page,
+            "page_size": self.page_size,
+        }
+        if self._compute is None:
+            self._compute = LatestJobWorker(self.frame, name="collection-compute")
+        self._compute.submit(
+            lambda: self._compute_page(request),
+            lambda result: self._apply_page(result, on_applied),
+            lambda error: self._log(f"❌ Failed to refresh collection table: {error}", "Error"),
+        )
+    
+    def _compute_page(self, request):
+        """Filter, sort, paginate and format one page (runs on the compute worker)"""
+        filtered, scores = self.filters.apply_filters(
+            request["hacks"], request["sort_column"], request["reverse"], spec=request["spec"])
+        
+        # Apply relevance ranking
+        if request["relevance"]:
+            self._sort_by_relevance(filtered, scores)
         
-        # Apply sorting
-        self._sort_filtered_data()
+        # Calculate pagination
+        page_size = request["page_size"]
+        total_hacks = len(filtered)
+        total_pages = max(1, (total_hacks + page_size - 1) // page_size)
+        current_page = min(request["page"], total_pages)
+        
+        # Calculate page slice
+        start_index = (current_page - 1) * page_size
+        page_data = filtered[start_index:start_index + page_size]
+        
+        return {
+            "all_count": len(request["hacks"]),
+            "filtered": filtered,
+            "total_pages": total_pages,
+            "current_page": current_page,
+            "rows": [(str(hack.get("id")), self._build_row_values(hack), (hack.get("id"),))
+                     for hack in page_data],
+        }
+    
+    def _apply_page(self, result, on_applied=None):
+        """Show a computed page (main thread)
+        
+        The page's rows are reconciled against what the tree already shows, so
+        only changed, added, removed or moved rows touch the Treeview.
+        """
+        if not self.tree:
+            return
+        self.filtered_data = result["filtered"]
+        self._filtered_by_id = None
         
         # Update column headers to show sort indicators
         self._update_column_headers()
         
-        # Calculate pagination
-        total_hacks = len(self.filtered_data)
-        self.total_pages = max(1, (total_hacks + self.page_size - 1) // self.page_size)
-        
+        self.total_pages = result["total_pages"]
         # Ensure current page is valid
-        if self.current_page > self.total_pages:
-            self.current_page = self.total_pages
+        if self.current_page != result["current_page"]:
+            self.current_page = result["current_page"]
             self.page_var.set(str(self.current_page))
         
-        # Calculate page slice
-        start_index = (self.current_page - 1) * self.page_size
-        end_index = min(start_index + self.page_size, total_hacks)
-        page_data = self.filtered_data[start_index:end_index]
-        
-        # Populate table with page data
-        for hack in page_data:
-            self._insert_hack_row(hack)
+        # Populate table with page data (applied in one idle callback)
+        self.rows.schedule(result["rows"])
         
         # Update status with pagination info
-        if total_hacks > self.page_size:
-            sort_info = f" (sorted by {self.sort_column})" if self.sort_column else ""
-            status_text = f"Showing {len(page_data)} of {total_hacks} hack(s) (Page {self.current_page} of {self.total_pages}){sort_info}"
+        total_hacks = len(self.filtered_data)
+        if self.sort_by_relevance:
+            sort_info = " (ranked by relevance)"
         else:
             sort_info = f" (sorted by {self.sort_column})" if self.sort_column else ""
+        if total_hacks > self.page_size:
+            status_text = f"Showing {len(result['rows'])} of {total_hacks} hack(s) (Page {self.current_page} of {self.total_pages}){sort_info}"
+        else:
             status_text = f"Displaying {total_hacks} hack(s){sort_info}"
-        self._update_status_label(len(all_hacks), total_hacks, status_text)
+        if not self.data_manager.loaded:
+            status_text += " • loading collection..."
+        self._update_status_label(result["all_count"], total_hacks, status_text)
         
         # Update pagination controls
         self._update_pagination_controls()
+        
+        if on_applied is not None:
+            on_applied()
+    
+    def refresh_row(self, hack_id):
+        """Re-render one hack's row from its data, writing only the cells that changed"""
+        hack = self._find_hack_data(hack_id)
+        if hack is None or self.rows is None:
+            return False
+        return self.rows.update_row(str(hack_id), values=self._build_row_values(hack))
     
-    def _insert_hack_row(self, hack):
-        """Insert a single hack row into the table"""
+    def _build_row_values(self, hack):
+        """Display values for one hack, in the treeview's column order"""
         completed_display = "✓" if hack.get("completed", False) else ""
         rating_display = self._get_rating_display(hack.get("personal_rating", 0))
         
@@ -364,8 +477,6 @@ class CollectionPage:
         # v3.1 NEW: Format time to beat display
         time_to_beat_display = self._format_time_display(hack.get("time_to_beat", 0))
         
-        hack_id = hack.get("id")
-        
         # Use new helper function for type display
         hack_types = hack.get("hack_types", []) or [hack.get("hack_type", "standard")]
         type_display = format_types_display(hack_types)
@@ -406,9 +517,7 @@ class CollectionPage:
         # treeview's internal 'columns' definition never changes after creation.
         # Using self.COLUMNS here would cause values to land in the wrong cells
         # on any subsequent refresh (e.g. after a sort trigger).
-        values = [row_data.get(col_id, "") for col_id in self.tree["columns"]]
-        
-        self.tree.insert("", "end", values=values, tags=(hack_id,))
+        return [row_data.get(col_id, "") for col_id in self.rows.columns]
     
     def _update_status_label(self, total_count, filtered_count, custom_text=None):
         """Update the status label"""
@@ -451,31 +560,26 @@ class CollectionPage:
             # Calculate page number (1-based)
             target_page = (hack_index // self.page_size) + 1
             
-            # Switch to that page if needed
+            # Switch to that page if needed, then scroll to and select the item in the tree
             if target_page != self.current_page:
                 self.current_page = target_page
                 self.page_var.set(str(self.current_page))
-                self._refresh_table() # This will populate the tree with the correct page data
-                
-            # Scroll to and select the item in the tree
-            self._select_hack_in_tree(hack_id)
+                # Selects once the worker has populated the tree with the correct page data
+                self._refresh_table(on_applied=lambda: self._select_hack_in_tree(hack_id))
+            else:
+                self._select_hack_in_tree(hack_id)
             
         except ValueError:
             self._log(f"❌ Failed to find selected hack '{title}' in filtered data", "Error")
 
     def _select_hack_in_tree(self, hack_id):
         """Find a hack in the current tree view, select it, and ensure it's visible"""
-        hack_id_str = str(hack_id)
-        
-        # Iterate through tree items to find the match
-        for item in self.tree.get_children():
-            tags = self.tree.item(item)["tags"]
-            if tags and str(tags[0]) == hack_id_str:
-                # Found it!
-                self.tree.selection_set(item)
-                self.tree.focus(item)
-                self.tree.see(item)
-                return
+        item = self.rows.item_for(str(hack_id))
+        if item:
+            self.tree.selection_set(item)
+            self.tree.focus(item)
+            self.tree.see(item)
+            return
         
         self._log(f"⚠️ Could not find hack {hack_id} in tree view", "Warning")
     
@@ -762,35 +866,10 @@ class CollectionPage:
                 else:
                     self._log(f"❌ Failed to clear completion date for '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str})", "Error")
             
-            # Update the specific tree item directly (same as inline editing)
-            for item in self.tree.get_children():
-                item_tags = self.tree.item(item)["tags"]
-                if item_tags and str(item_tags[0]) == str(hack_id_str):
-                    # Get current values
-                    current_values = list(self.tree.item(item)["values"])
-                    
-                    # Update completed checkbox (use treeview's fixed column order,
-                    # NOT self.COLUMNS which may be reordered by the user)
-                    tree_cols = list(self.tree["columns"])
-                    try:
-                        completed_col_idx = tree_cols.index("completed")
-                        current_values[completed_col_idx] = "✓" if new_completed else ""
-                    except ValueError:
-                        # "completed" column might be hidden or missing
-                        pass
-                    
-                    # Update completion date if it changed dynamically
-                    try:
-                        date_col_idx = tree_cols.index("completed_date")
-                        current_values[date_col_idx] = hack_data.get("completed_date", "")
-                    except ValueError:
-                        pass # Column might be hidden/missing
-                    
-                    # Update the tree item
-                    self.tree.item(item, values=current_values)
-                    completion_status = "✅ completed" if new_completed else "❌ not completed"
-                    self._log(f"🔄 Updated completion status for '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str}) - now marked as {completion_status}", "Information")
-                    break
+            # Update just this row's changed cells (checkbox and completion date)
+            if self.refresh_row(hack_id_str):
+                completion_status = "✅ completed" if new_completed else "❌ not completed"
+                self._log(f"🔄 Updated completion status for '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str}) - now marked as {completion_status}", "Information")
     
     def _edit_rating(self, hack_id, item, event, col_id="rating"):
         """Handle rating clicks - improved star detection"""
@@ -840,31 +919,14 @@ class CollectionPage:
         if self.data_manager.update_hack(hack_id_str, "personal_rating", new_rating):
             hack_data["personal_rating"] = new_rating
             
-            # IMPROVED: Use optimized tree update instead of full refresh
-            for tree_item in self.tree.get_children():
-                item_tags = self.tree.item(tree_item)["tags"]
-                if item_tags and str(item_tags[0]) == str(hack_id_str):
-                    # Get current values
-                    current_values = list(self.tree.item(tree_item)["values"])
-                    
-                    # Update rating in the correct column (use treeview's fixed column
-                    # order, NOT self.COLUMNS which may be reordered by the user)
-                    try:
-                        rating_col_idx = list(self.tree["columns"]).index("rating")
-                        current_values[rating_col_idx] = self._get_rating_display(new_rating)
-                    except ValueError:
-                        pass
-                    
-                    # Update the tree item
-                    self.tree.item(tree_item, values=current_values)
-                    
-                    # User-friendly logging
-                    if new_rating == 0:
-                        self._log(f"⭐ Cleared rating for '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str})", "Information")
-                    else:
-                        stars_text = "★" * new_rating + "☆" * (5 - new_rating)
-                        self._log(f"⭐ Rated '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str}) as {new_rating}/5 stars [{stars_text}]", "Information")
-                    break
+            # IMPROVED: Update only the rating cell instead of a full refresh
+            if self.refresh_row(hack_id_str):
+                # User-friendly logging
+                if new_rating == 0:
+                    self._log(f"⭐ Cleared rating for '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str})", "Information")
+                else:
+                    stars_text = "★" * new_rating + "☆" * (5 - new_rating)
+                    self._log(f"⭐ Rated '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str}) as {new_rating}/5 stars [{stars_text}]", "Information")
         else:
             self._log(f"❌ Failed to update rating for '{hack_data.get('title', 'Unknown')}' (hack #{hack_id_str}) - data manager update failed", "Error")
     
@@ -1285,12 +1347,10 @@ class CollectionPage:
     
     def _find_hack_data(self, hack_id_str):
         """Find hack data by ID"""
-        # Convert to string for comparison to handle both string and integer IDs
-        hack_id_str = str(hack_id_str)
-        for hack in self.filtered_data:
-            if str(hack.get("id")) == hack_id_str:
-                return hack
-        return None
+        # Built once per refresh; string keys handle both string and integer IDs
+        if self._filtered_by_id is None:
+            self._filtered_by_id = {str(hack.get("id")): hack for hack in self.filtered_data}
+        return self._filtered_by_id.get(str(hack_id_str))
     
     def _open_hack_in_explorer(self, hack_id):
         """Open the hack file location in the system file explorer"""
@@ -1648,8 +1708,13 @@ class CollectionPage:
     
     def _sort_by_column(self, column):
         """Sort the data by the specified column"""
+        # Clicking a column leaves relevance ordering
+        if self.sort_by_relevance:
+            self.sort_by_relevance = False
+            self.sort_column = column
+            self.sort_reverse = False
         # Toggle sort direction if clicking the same column
-        if self.sort_column == column:
+        elif self.sort_column == column:
             self.sort_reverse = not self.sort_reverse
         else:
             self.sort_column = column
@@ -1675,7 +1740,7 @@ class CollectionPage:
 
         for col_id in self.tree["columns"]:
             base_header = header_map.get(col_id, col_id)
-            if col_id == self.sort_column:
+            if col_id == self.sort_column and not self.sort_by_relevance:
                 indicator = " ▼" if self.sort_reverse else " ▲"
                 header_text = base_header + indicator
             else:
@@ -1683,51 +1748,8 @@ class CollectionPage:
 
             self.tree.heading(col_id, text=header_text, command=lambda c=col_id: self._sort_by_column(c))
     
-    def _sort_filtered_data(self):
-        """Sort the filtered data based on current sort settings"""
-        if not self.sort_column or not self.filtered_data:
-            return
-        
-        def get_sort_key(hack):
-            value = hack.get(self.sort_column, "")
-            
-            # Handle different data types for proper sorting
-            if self.sort_column == "completed":
-                # Sort completed status: completed items first, then uncompleted
-                return (not hack.get("completed", False), hack.get("title", "").lower())
-            elif self.sort_column in ["rating"]:
-                # Numeric sorting for rating - use actual numeric value from data, not display value
-                rating = hack.get("personal_rating", 0)
-                try:
-                    return float(rating) if rating else 0
-                except (ValueError, TypeError):
-                    return 0
-            elif self.sort_column == "completed_date":
-                # Date sorting - handle empty dates
-                if not value:
-                    return "0000-00-00"  # Empty dates sort first
-                return value
-            elif self.sort_column == "time_to_beat":
-                # Time sorting - convert to numeric for proper ordering
-                if not value:
-                    return 0
-                try:
-                    # If it's already numeric (seconds), use it
-                    if isinstance(value, (int, float)):
-                        return value
-                    # If it's a string, try to parse it
-                    return float(value)
-                except (ValueError, TypeError):
-                    return 0
-            elif self.sort_column == "release_date":
-                # Release date sorting - use numeric timestamp for proper chronological ordering
-                timestamp = hack.get("time", 0)
-                try:
-                    return int(timestamp) if timestamp else 0
-                except (ValueError, TypeError):
-                    return 0
-            else:
-                # String sorting (case-insensitive)
-                return str(value).lower()
-        
-        self.filtered_data.sort(key=get_sort_key, reverse=self.sort_reverse)
+    @staticmethod
+    def _sort_by_relevance(hacks, scores):
+        """Rank search results by relevance (column sorts arrive presorted from the filter index)"""
+        # Best matches first, ties alphabetical
+        hacks.sort(key=lambda hack: (-scores.get(hack.get("id"), 0), hack.get("title", "").lower()))
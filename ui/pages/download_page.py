@@ -4,6 +4,7 @@ import sys
 import os
 import threading
 import queue
+import tracer
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from api_pipeline import fetch_hack_list
@@ -60,20 +61,22 @@ class DownloadPage:
         self._ui_drain_job = None
 
         processed = 0
-        while processed < 200:
-            try:
-                func = self._ui_queue.get_nowait()
-            except queue.Empty:
-                break
+        with tracer.span("ui_queue_drain", "ui") as span_args:
+            while processed < 200:
+                try:
+                    func = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
 
-            try:
-                func()
-            except Exception as e:
                 try:
-                    self._log(f"UI queue task failed: {str(e)}", "Error")
-                except Exception:
-                    pass
-            processed += 1
+                    func()
+                except Exception as e:
+                    try:
+                        self._log(f"UI queue task failed: {str(e)}", "Error")
+                    except Exception:
+                        pass
+                processed += 1
+            span_args["tasks"] = processed
 
         # Keep draining while searching or while work remains
         should_continue = self.is_searching or not self._ui_queue.empty()
@@ -100,8 +103,10 @@ class DownloadPage:
         self.download_button_component = DownloadButton(
             button_frame,
             callback_download=self._download_selected,
-            callback_cancel=self._cancel_download
+            callback_cancel=self._cancel_download,
+            callback_retry=self._retry_failed
         )
+        self._update_retry_display()
         
         # Create results component in the middle LAST - this will fill remaining space
         self.results = DownloadResults(
@@ -671,6 +676,40 @@ class DownloadPage:
         # Log the download initiation - removed duplicate message
         # self._log(f"🚀 Starting download of {len(hack_list)} selected hacks", "Information")
         
+        self._start_download(hack_list, original_selected_hack_ids)
+
+    def _retry_failed(self):
+        """Re-run hacks that previously failed for a transient reason"""
+        from retry_queue import get_retry_queue
+
+        retry_queue = get_retry_queue()
+        retry_queue.reload()
+        entries = retry_queue.get_transient()
+        if not entries:
+            self._log("✅ No failed hacks to retry", "Information")
+            self._update_retry_display()
+            return
+
+        permanent = retry_queue.get_permanent()
+        if permanent:
+            self._log(f"⚠️ {len(permanent)} hack(s) failed permanently and will not be retried (e.g. no patch in archive)", "Warning")
+
+        hack_list = [entry["hack"] for entry in entries]
+        self._log(f"🔁 Retrying {len(hack_list)} failed hack(s)...", "Information")
+        self._start_download(hack_list, [str(hack.get("id", "")) for hack in hack_list])
+
+    def _update_retry_display(self):
+        """Refresh the retry button with the number of retryable hacks"""
+        try:
+            from retry_queue import get_retry_queue
+            count = len(get_retry_queue().get_transient())
+        except Exception:
+            count = 0
+        if self.download_button_component:
+            self.download_button_component.update_retry_state(count)
+
+    def _start_download(self, hack_list, original_selected_hack_ids):
+        """Run the download pipeline for hack_list in a background thread"""
         # Set downloading state
         self.download_button_component.set_downloading(True)
         
@@ -715,6 +754,7 @@ class DownloadPage:
                     self.frame.after(0, uncheck_downloaded_hacks)
                 
                 self.frame.after(0, lambda: self._update_selection_display())
+                self.frame.after(0, self._update_retry_display)
         
         # Start download in background thread
         download_thread = threading.Thread(target=download_worker, daemon=True)
@@ -736,6 +776,7 @@ class DownloadPage:
             self.download_button_component.set_downloading(False)
             self.download_button_component.clear_completion_message()
             self._update_selection_display()
+            self._update_retry_display()
         except ImportError:
             self._log("❌ Could not import cancel_pipeline - cancellation not available", "Error")
         except Exception as e:
@@ -10,7 +10,6 @@ import os
 import json
 import re
 import shutil
-import tkinter as tk
 import sys
 import platform
 
@@ -26,6 +25,8 @@ def resource_path(relative_path):
 
 def set_window_icon(window):
     """Set the application icon for any window or dialog"""
+    import tkinter as tk  # Only the GUI needs tkinter - keep it out of headless imports
+
     try:
         if platform.system() == "Linux":
             # On Linux, use PNG icon with iconphoto
@@ -89,12 +90,15 @@ def update_difficulty_lookup(new_lookup):
     Args:
         new_lookup: Dictionary mapping difficulty IDs to friendly names
     """
-    global DIFFICULTY_LOOKUP
     if new_lookup and isinstance(new_lookup, dict):
+        # Update in place - other modules hold a reference to this dict
+        # (from utils import DIFFICULTY_LOOKUP), so it must not be rebound
+        updated = dict(new_lookup)
         # Preserve the "No Difficulty" mapping
-        DIFFICULTY_LOOKUP = new_lookup.copy()
-        if "" not in DIFFICULTY_LOOKUP:
-            DIFFICULTY_LOOKUP[""] = "No Difficulty"
+        if "" not in updated:
+            updated[""] = "No Difficulty"
+        DIFFICULTY_LOOKUP.clear()
+        DIFFICULTY_LOOKUP.update(updated)
 
 DIFFICULTY_KEYMAP = {
     "newcomer": "1",
@@ -571,18 +575,70 @@ def move_hack_to_new_difficulty(output_dir, hack_type, old_diff, new_diff, filen
 def load_processed(path=None):
     if path is None:
         path = PROCESSED_JSON_PATH
+    # Let queued saves land before reading
+    from persistence_worker import get_persistence_worker
+    get_persistence_worker().flush()
     if os.path.exists(path):
+        from processed_journal import ReplayedData, apply_journal
         with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            data = ReplayedData(json.load(f))
+        # Collection edits not yet folded into the file (see processed_journal);
+        # saving this data back supersedes them
+        _, _, data.journal_seq = apply_journal(path, data)
+        return data
     return {}
 
-def save_processed(data, path=None):
+# Callbacks (path, data, changed_ids) run after save_processed writes - lets the shared
+# hack store pick up pipeline changes without re-reading the file
+_processed_save_listeners = []
+
+def register_processed_save_listener(callback):
+    """Register a callback(path, data, changed_ids) called after processed data is saved"""
+    if callback not in _processed_save_listeners:
+        _processed_save_listeners.append(callback)
+
+def unregister_processed_save_listener(callback):
+    """Unregister a processed save listener"""
+    if callback in _processed_save_listeners:
+        _processed_save_listeners.remove(callback)
+
+def save_processed(data, path=None, changed_ids=None):
+    """Queue data to be written to processed.json and notify listeners
+
+    The write happens on the shared persistence worker, after any queued
+    collection edits; back-to-back saves coalesce into one write. Call
+    get_persistence_worker().flush() to wait for it.
+
+    changed_ids names the records the caller touched since its last save, so
+    listeners only look at those; None means any record may have changed.
+
+    The write supersedes the journal entries already replayed into data (see
+    processed_journal.superseded_seq); edits journaled since still win.
+    """
     if path is None:
         path = PROCESSED_JSON_PATH
     # Ensure directory exists
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+
+    # Serialize here, on the caller's thread: records hold nested lists
+    # (hack_types, authors, files...) the pipeline keeps mutating, so the
+    # writer must not read the live dicts
+    text = json.dumps(data, indent=2)
+    from processed_journal import superseded_seq, supersede_journal, write_text_atomic
+    seq = superseded_seq(data)
+
+    def write():
+        write_text_atomic(path, text)
+        supersede_journal(path, seq)
+
+    from persistence_worker import get_persistence_worker
+    get_persistence_worker().submit(("processed", os.path.abspath(path)), write)
+
+    for callback in _processed_save_listeners.copy():
+        try:
+            callback(path, data, changed_ids)
+        except Exception as e:
+            print(f"Error in processed save listener: {e}")
 
 def get_user_data_path(filename):
     """Get platform-specific user data directory for storing app files"""
@@ -615,16 +671,21 @@ CONFIG_JSON_PATH = get_user_data_path("config.json")
 # Get base directory (project root)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Ensure cross-platform config file exists in proper location
-if not os.path.exists(CONFIG_JSON_PATH):
-    # Create the directory if it doesn't exist
-    os.makedirs(os.path.dirname(CONFIG_JSON_PATH), exist_ok=True)
-    with open(CONFIG_JSON_PATH, 'w') as f:
-        json.dump({
-            "flips_path": "",
-            "base_rom_path": "",
-            "output_dir": ""
-        }, f, indent=2)
+def ensure_config_file():
+    """Create the cross-platform config file if it doesn't exist yet
+
+    Called by the GUI at startup rather than on import, so headless/core
+    imports of utils have no side effects on the user data folder.
+    """
+    if not os.path.exists(CONFIG_JSON_PATH):
+        # Create the directory if it doesn't exist
+        os.makedirs(os.path.dirname(CONFIG_JSON_PATH), exist_ok=True)
+        with open(CONFIG_JSON_PATH, 'w') as f:
+            json.dump({
+                "flips_path": "",
+                "base_rom_path": "",
+                "output_dir": ""
+            }, f, indent=2)
 
 # Multi-type support utilities
 def get_hack_types(hack_data):